@@ -1,13 +1,14 @@
 from datetime import datetime, timezone
 import time
 
-from flask import request, current_app
+from flask import request, current_app, Response
 from flask_json import as_json
 from sqlalchemy import exc as sqla_exc, select
 
 from flexmeasures.data import db
 from flexmeasures.data.models.task_runs import LatestTaskRun
 from flexmeasures.auth.error_handling import UNAUTH_STATUS_CODE, FORBIDDEN_STATUS_CODE
+from flexmeasures.utils.instrumentation import render_metrics
 
 
 @as_json
@@ -108,3 +109,20 @@ def post_task_run():
         current_app.logger.error(f"Exception in /postLatestTaskRun endpoint: {e}")
         return {"status": "ERROR", "reason": "An internal error has occurred."}, 500
     return {"status": "OK"}, 200
+
+
+def get_metrics():
+    """
+    Get the wall time and SQL query histograms of requests and jobs, in the Prometheus text format.
+    Like checking task runs, this requires the FLEXMEASURES_TASK_CHECK_AUTH_TOKEN.
+    """
+    token_name = current_app.config.get("SECURITY_TOKEN_AUTHENTICATION_HEADER")
+    token = current_app.config.get("FLEXMEASURES_TASK_CHECK_AUTH_TOKEN", "")
+    if token_name not in request.headers:
+        return Response("Not authenticated to get metrics.\n", UNAUTH_STATUS_CODE)
+    if not token or request.headers.get(token_name) != token:
+        return Response("Not authorized to get metrics.\n", FORBIDDEN_STATUS_CODE)
+    return Response(
+        render_metrics(current_app.redis_connection),
+        mimetype="text/plain; version=0.0.4",
+    )
@@ -20,3 +20,8 @@ def get_task_run():
 @roles_required("task-runner")
 def post_task_run():
     return ops_impl.post_task_run()
+
+
+@flexmeasures_api_ops.route("/metrics", methods=["GET"])
+def get_metrics():
+    return ops_impl.get_metrics()
@@ -1,6 +1,9 @@
 from marshmallow import Schema, fields, validate
 
-from flexmeasures.api.common.schemas.generic_schemas import PaginationSchema
+from flexmeasures.api.common.schemas.generic_schemas import (
+    CursorPaginationSchema,
+    PaginationSchema,
+)
 from flexmeasures.api.common.schemas.users import AccountIdField
 from flexmeasures.data.schemas import AssetIdField
 from flexmeasures.data.schemas.generic_assets import (
@@ -37,7 +40,7 @@ class PipedAssetFieldListField(fields.Str):
         return "|".join(values)
 
 
-class AssetAPIQuerySchema(PaginationSchema):
+class AssetAPIQuerySchema(PaginationSchema, CursorPaginationSchema):
     legacy_field_aliases = {
         **PaginationSchema.legacy_field_aliases,
         "account_id": "account",
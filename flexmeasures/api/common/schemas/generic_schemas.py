@@ -1,4 +1,11 @@
-from marshmallow import Schema, fields, validate, post_load, ValidationError
+from marshmallow import (
+    Schema,
+    fields,
+    validate,
+    post_load,
+    validates_schema,
+    ValidationError,
+)
 from flexmeasures.api.common.schemas.search import SearchFilterField
 from flexmeasures.api.common.schemas.utils import SupportsLegacyFieldAliases
 from flexmeasures.data.schemas import AwareDateTimeField, DurationField
@@ -42,6 +49,53 @@ class PaginationSchema(SupportsLegacyFieldAliases, Schema):
     )
 
 
+class CursorPaginationSchema(Schema):
+    """Keyset pagination and streaming, as alternatives to paginating with `page` on large listings.
+
+    Keyset pagination seeks to the first ID after a cursor, so deep pages are as fast as the first page.
+    Streaming serializes the listing in batches, as newline-delimited JSON.
+    """
+
+    after = fields.Int(
+        required=False,
+        validate=validate.Range(min=0),
+        metadata=dict(
+            description="Return only records with an ID greater than this cursor, ordered by ID (keyset pagination). Use the `next-cursor` of the previous response to get the next page.",
+            example=482,
+        ),
+    )
+    response_format = fields.Str(
+        data_key="format",
+        required=False,
+        load_default="json",
+        validate=validate.OneOf(["json", "ndjson"]),
+        metadata=dict(
+            description="Set to 'ndjson' to stream all records as newline-delimited JSON, one record per line.",
+            example="ndjson",
+        ),
+    )
+
+    @validates_schema
+    def validate_pagination_mode(self, data, **kwargs):
+        if data.get("page") is not None:
+            if "after" in data:
+                raise ValidationError(
+                    "Use either `page` or `after`, not both.", field_name="after"
+                )
+            if data.get("response_format") == "ndjson":
+                raise ValidationError(
+                    "Streaming returns all records, so `page` cannot be used.",
+                    field_name="page",
+                )
+        if "after" in data and (
+            data.get("sort_by", "id") != "id" or data.get("sort_dir") == "desc"
+        ):
+            raise ValidationError(
+                "Paginating with `after` requires sorting by ascending ID.",
+                field_name="after",
+            )
+
+
 class EventWindowSchema(SupportsLegacyFieldAliases, Schema):
     """Shared event-window fields for endpoints returning event-indexed time series or annotations.
 
@@ -5,17 +5,20 @@ import json
 import re
 from timely_beliefs.beliefs.classes import BeliefsDataFrame
 from timely_beliefs.sensors.func_store import knowledge_horizons
-from typing import Sequence
+from functools import wraps
+from typing import Callable, Sequence
 from datetime import timedelta
 
-from flask import current_app
+from flask import current_app, Response, stream_with_context
+from flask_json import as_json
+from marshmallow import Schema
 from redis.exceptions import ConnectionError as RedisConnectionError
 from werkzeug.exceptions import Forbidden, Unauthorized
 from numpy import array
 from psycopg2.errors import UniqueViolation
 from rq import Queue, Worker
 from rq.job import Job
-from sqlalchemy import select
+from sqlalchemy import select, Select
 from sqlalchemy.exc import IntegrityError
 
 from flexmeasures.data import db
@@ -238,6 +241,57 @@ def get_accessible_accounts() -> list[Account]:
     return accounts
 
 
+def as_json_or_stream(f):
+    """Like ``as_json``, but lets streamed responses (see ``stream_ndjson``) through as they are."""
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        rv = f(*args, **kwargs)
+        if isinstance(rv, Response) and rv.is_streamed:
+            return rv
+        return as_json(lambda: rv)()
+
+    return wrapper
+
+
+def stream_ndjson(
+    query: Select,
+    schema: Schema,
+    keep: Callable[[object], bool] | None = None,
+    batch_size: int = 1000,
+) -> Response:
+    """Stream the results of a query as newline-delimited JSON, one serialized record per line.
+
+    Rows are fetched from a server-side cursor and serialized in batches,
+    so memory use does not grow with the number of records.
+
+    :param query:       ORM query selecting the records to stream.
+    :param schema:      Schema to serialize the records with.
+    :param keep:        Optional function to select which records to include (e.g. only readable ones).
+    :param batch_size:  Number of rows to fetch and serialize at once.
+    """
+
+    def generate():
+        result = db.session.scalars(query.execution_options(yield_per=batch_size))
+        for batch in result.partitions():
+            if keep is not None:
+                batch = [record for record in batch if keep(record)]
+            yield "".join(
+                json.dumps(record) + "\n" for record in schema.dump(batch, many=True)
+            )
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
+def is_readable(context) -> bool:
+    """Whether the current user has read access to the given context, without raising."""
+    try:
+        check_access(context, "read")
+    except (Forbidden, Unauthorized):
+        return False
+    return True
+
+
 def convert_asset_json_fields(asset_kwargs):
     """
     Convert string fields in asset_kwargs to JSON where needed.
@@ -0,0 +1,42 @@
+from flask import current_app, url_for
+
+from flexmeasures.auth.error_handling import FORBIDDEN_STATUS_CODE, UNAUTH_STATUS_CODE
+
+
+def get_metrics(client, token=None):
+    headers = {
+        "Authorization": token
+        or current_app.config["FLEXMEASURES_TASK_CHECK_AUTH_TOKEN"]
+    }
+    return client.get(url_for("flexmeasures_api_ops.get_metrics"), headers=headers)
+
+
+def test_metrics_auth(client):
+    response = client.get(url_for("flexmeasures_api_ops.get_metrics"))
+    assert response.status_code == UNAUTH_STATUS_CODE
+    response = get_metrics(client, "bad-token")
+    assert response.status_code == FORBIDDEN_STATUS_CODE
+
+
+def test_metrics_of_requests(client, clean_redis):
+    for _ in range(3):
+        assert client.get(url_for("flexmeasures_api_ops.get_ping")).status_code == 200
+    assert client.get(url_for("flexmeasures_api_ops.get_task_run")).status_code == 401
+
+    response = get_metrics(client)
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    metrics = response.data.decode()
+    assert "# TYPE flexmeasures_request_duration_seconds histogram" in metrics
+    assert (
+        'flexmeasures_request_duration_seconds_count{endpoint="flexmeasures_api_ops.get_ping"} 3'
+        in metrics
+    )
+    assert (
+        'flexmeasures_request_sql_queries_bucket{endpoint="flexmeasures_api_ops.get_ping",le="+Inf"} 3'
+        in metrics
+    )
+    assert (
+        'flexmeasures_request_sql_queries_count{endpoint="flexmeasures_api_ops.get_task_run"} 1'
+        in metrics
+    )
@@ -53,7 +53,7 @@ from flexmeasures.data.queries.generic_assets import (
     filter_assets_under_root,
     query_assets_by_search_terms,
 )
-from flexmeasures.data.queries.utils import id_prefix_filter
+from flexmeasures.data.queries.utils import id_prefix_filter, keyset_paginate
 from flexmeasures.data.schemas import AwareDateTimeField
 from flexmeasures.data.schemas.annotations import AnnotationSchema
 from flexmeasures.data.services.annotations import prepare_annotations_for_chart
@@ -70,8 +70,10 @@ from flexmeasures.data.services.scheduling import (
     create_simultaneous_scheduling_job,
 )
 from flexmeasures.api.common.utils.api_utils import (
+    as_json_or_stream,
     get_accessible_accounts,
     copy_asset,
+    stream_ndjson,
 )
 from flexmeasures.api.common.responses import (
     unprocessable_entity,
@@ -411,8 +413,8 @@ class AssetAPI(FlaskView):
 
     @route("", methods=["GET"])
     @use_kwargs(AssetAPIQuerySchema, location="query")
-    @as_json
-    def index(
+    @as_json_or_stream
+    def index(  # noqa: C901
         self,
         fields_in_response: list[str] | None,
         all_accessible: bool,
@@ -426,6 +428,8 @@ class AssetAPI(FlaskView):
         filter: list[str] | None = None,
         sort_by: str | None = None,
         sort_dir: str | None = None,
+        after: int | None = None,
+        response_format: str = "json",
     ):
         """
         .. :quickref: Assets; List assets accessible by the user.
@@ -447,6 +451,8 @@ class AssetAPI(FlaskView):
               - If a `page` parameter is provided, the response will be paginated, showing a specific number of assets per page as defined by `per-page` (default is 10).
               - If a search 'filter' such as 'solar "ACME corp"' is provided, the response will return only assets where each search term is either present in their name or account name, or is a prefix of their ID.
               The response schema for pagination is inspired by [DataTables](https://datatables.net/manual/server-side#Returned-data)
+              - For long asset lists, use keyset pagination instead: if an `after` cursor is provided (start with 0), the response contains the next `per-page` assets with an ID greater than `after`, ordered by ID, and a `next-cursor` to pass as `after` for the next page (`null` on the last page). Deep pages are then as fast as the first one.
+              - If `format` is set to `ndjson`, all assets (optionally after an `after` cursor) are streamed as newline-delimited JSON, with one asset per line.
 
             Per default, the response only includes a limited set of asset fields (id, name, account_id, generic_asset_type).
             You can use the `fields` query parameter to specify a custom set of fields to include in the response.
@@ -487,6 +493,23 @@ class AssetAPI(FlaskView):
                             name: battery
                         num-records: 1
                         filtered-records: 1
+                    keyset_paginated_assets:
+                      summary: A keyset-paginated list of assets being returned in the response
+                      value:
+                        data:
+                        - id: 1
+                          name: Test battery
+                          latitude: 10
+                          longitude: 100
+                          account_id: 2
+                          generic_asset_type:
+                            id: 1
+                            name: battery
+                        next-cursor: null
+                application/x-ndjson:
+                  schema:
+                    type: string
+                    description: One asset per line
             400:
               description: INVALID_REQUEST
             401:
@@ -551,7 +574,27 @@ class AssetAPI(FlaskView):
             except (KeyError, IndexError, sa_exc.ArgumentError):
                 pass
 
-        if page is None:
+        if after is not None:
+            # Under search filters, the query selects from an aliased GenericAsset
+            root_entity = query.column_descriptions[0]["entity"]
+            query = keyset_paginate(
+                query,
+                root_entity.id,
+                after=after,
+                limit=(per_page or 10) if response_format == "json" else None,
+            )
+        if response_format == "ndjson":
+            return stream_ndjson(query, response_schema)
+
+        if after is not None:
+            assets = db.session.scalars(query).all()
+            response = {
+                "data": response_schema.dump(assets, many=True),
+                "next-cursor": (
+                    assets[-1].id if len(assets) == (per_page or 10) else None
+                ),
+            }
+        elif page is None:
             response = response_schema.dump(db.session.scalars(query).all(), many=True)
         else:
             if per_page is None:
@@ -1599,6 +1642,7 @@ class AssetAPI(FlaskView):
         flex_model: dict | None = None,
         flex_context: dict | None = None,
         sequential: bool = False,
+        sequential_tiers: list[list[Sensor]] | None = None,
         force_new_job_creation: bool | None = False,
         **kwargs,
     ):
@@ -1626,6 +1670,8 @@ class AssetAPI(FlaskView):
             > It can do so jointly (the default) or sequentially
             > (considering previously scheduled sensors as inflexible).
             > To use sequential scheduling, use ``sequential=true`` in the JSON body.
+            > To let devices of equal priority be scheduled in parallel, group them into ordered ``sequential-tiers``
+            > (e.g. ``[[1, 2, 3], [4]]``), in which case only the tiers are scheduled one after the other.
 
             The length of the schedule can be set explicitly through the 'duration' field.
             Otherwise, it is set by [a config setting](https://flexmeasures.readthedocs.io/stable/configuration.html#flexmeasures-planning-horizon), which defaults to 48 hours.
@@ -1776,6 +1822,8 @@ class AssetAPI(FlaskView):
         )
         if sequential:
             f = create_sequential_scheduling_job
+            if sequential_tiers is not None:
+                scheduler_kwargs["tiers"] = sequential_tiers
         else:
             f = create_simultaneous_scheduling_job
         try:
@@ -169,6 +169,25 @@ class JobAPI(FlaskView):
                         type: string
                         nullable: true
                         description: Traceback information for failed jobs, or null otherwise.
+                      timings:
+                        type: object
+                        nullable: true
+                        additionalProperties:
+                          type: number
+                        description: >
+                          For finished scheduling jobs, the wall-clock seconds spent per stage
+                          (e.g. ``deserialize``, ``prepare``, ``build``, ``solve``, ``postprocess`` and ``save``),
+                          or null when the scheduler does not record them.
+                      problem-size:
+                        type: object
+                        nullable: true
+                        additionalProperties:
+                          type: integer
+                        description: >
+                          For finished scheduling jobs, the size of the optimization problem:
+                          the number of ``devices`` and ``timesteps``, and the number of
+                          constraint ``rows``, variable ``cols`` and (for matrix-based solver backends)
+                          non-zero coefficients (``nnz``), or null when the scheduler does not record them.
                       func_name:
                         type: string
                         description: Legacy alias of `func-name`, kept for backward compatibility. Prefer `func-name`.
@@ -230,6 +249,19 @@ class JobAPI(FlaskView):
                         started-at: "2026-04-28T10:00:01+00:00"
                         ended-at: "2026-04-28T10:00:05+00:00"
                         exc-info: null
+                        timings:
+                          deserialize: 0.021
+                          prepare: 0.412
+                          build: 0.087
+                          solve: 0.134
+                          postprocess: 0.018
+                          save: 0.096
+                        problem-size:
+                          devices: 1
+                          timesteps: 96
+                          rows: 481
+                          cols: 772
+                          nnz: 1633
                     failed:
                       summary: Failed job
                       value:
@@ -307,6 +339,8 @@ class JobAPI(FlaskView):
         response["started_at"] = response["started-at"]
         response["ended_at"] = response["ended-at"]
         response["exc_info"] = response["exc-info"]
+        response["timings"] = job.meta.get("timings")
+        response["problem-size"] = job.meta.get("problem_size")
 
         if status_name == JobStatus.FAILED.name:
             status_code = 422
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import isodate
 from datetime import datetime, timedelta
+import pandas as pd
 
 from flexmeasures.data.services.sensors import (
     serialize_sensor_status_data,
@@ -12,11 +13,12 @@ from flask import current_app, url_for, request
 from flask_classful import FlaskView, route
 from flask_json import as_json
 from flask_security import auth_required, current_user
-from marshmallow import fields, Schema, ValidationError, validates_schema
+from marshmallow import fields, post_load, Schema, ValidationError, validates_schema
 import marshmallow.validate as validate
 from rq.job import Job, JobStatus, NoSuchJobError
 from webargs.flaskparser import use_args, use_kwargs
 from sqlalchemy import delete, select, or_
+from sqlalchemy.orm import selectinload
 
 from flexmeasures.api.common.responses import (
     request_accepted_for_processing,
@@ -27,6 +29,7 @@ from flexmeasures.api.common.responses import (
     unprocessable_entity,
     fallback_schedule_redirect,
 )
+from flexmeasures.api.common.schemas.generic_schemas import CursorPaginationSchema
 from flexmeasures.api.common.schemas.utils import (
     make_openapi_compatible,
     SupportsLegacyFieldAliases,
@@ -41,7 +44,12 @@ from flexmeasures.api.common.schemas.sensor_data import (  # noqa F401
 from flexmeasures.api.common.schemas.sensors import SensorId  # noqa F401
 from flexmeasures.api.common.schemas.users import AccountIdField
 from flexmeasures.api.common.rate_limiting import limit_triggers
-from flexmeasures.api.common.utils.api_utils import process_sensor_data_ingestion
+from flexmeasures.api.common.utils.api_utils import (
+    as_json_or_stream,
+    is_readable,
+    process_sensor_data_ingestion,
+    stream_ndjson,
+)
 from flexmeasures.data.services.utils import job_status_description
 from flexmeasures.api.common.utils.deprecation_utils import (
     _add_headers as add_deprecation_header,
@@ -52,10 +60,15 @@ from flexmeasures.auth.loaders import flex_context_loader, flex_model_loader
 from flexmeasures.data import db
 from flexmeasures.data.models.annotations import Annotation, get_or_create_annotation
 from flexmeasures.data.models.audit_log import AssetAuditLog
+from flexmeasures.data.models.data_sources import DataSource
 from flexmeasures.data.models.user import Account
 from flexmeasures.data.models.generic_assets import GenericAsset
 from flexmeasures.data.models.time_series import Sensor, TimedBelief
-from flexmeasures.data.queries.utils import id_prefix_filter, simplify_index
+from flexmeasures.data.queries.utils import (
+    id_prefix_filter,
+    keyset_paginate,
+    simplify_index,
+)
 from flexmeasures.data.schemas.annotations import AnnotationSchema
 from flexmeasures.data.schemas.sensors import (  # noqa F401
     SensorReference,
@@ -77,6 +90,7 @@ from flexmeasures.data.schemas.scheduling import (
 )
 from flexmeasures.data.schemas.units import UnitField
 from flexmeasures.data.services.sensors import get_sensor_stats
+from flexmeasures.data.services.latest_beliefs import refresh_latest_beliefs
 from flexmeasures.data.services.sensors import delete_sensor as delete_sensor_and_data
 from flexmeasures.data.services.scheduling import (
     create_scheduling_job,
@@ -87,6 +101,7 @@ from flexmeasures.utils.flexmeasures_inflection import join_words_into_a_list
 from flexmeasures.utils.unit_utils import convert_units
 from flexmeasures.data.models.forecasting import Forecaster
 from flexmeasures.data.services.data_sources import get_data_generator
+from flexmeasures.data.services.data_ingestion import stage_uploaded_file
 from flexmeasures.data.schemas.forecasting.pipeline import (
     ForecastingTriggerSchema,
 )
@@ -237,7 +252,7 @@ class DeleteSensorDataSchema(Schema):
                 )
 
 
-class SensorKwargsSchema(SupportsLegacyFieldAliases, Schema):
+class SensorKwargsSchema(SupportsLegacyFieldAliases, CursorPaginationSchema):
     legacy_field_aliases = {
         "account_id": "account",
         "asset_id": "asset",
@@ -264,6 +279,46 @@ class SensorKwargsSchema(SupportsLegacyFieldAliases, Schema):
     unit = UnitField(required=False)
 
 
+class LatestStatesKwargsSchema(Schema):
+    """Schema for the query parameters of the GET /sensors/latest-states endpoint."""
+
+    sensors = fields.List(
+        fields.Int(),
+        required=True,
+        validate=validate.Length(min=1, max=1000),
+        metadata=dict(
+            description="IDs of the sensors to look up the current state of (at most 1000).",
+            example=[1, 2],
+        ),
+    )
+    source = SourceIdField(
+        required=False,
+        metadata=dict(
+            description="ID of the data source to look up data for. If not provided, the latest data of each source is returned.",
+        ),
+    )
+
+    @post_load
+    def load_sensors(self, data, **kwargs):
+        """Load all sensors (and what is needed to check access to them) in one go."""
+        sensor_ids = list(dict.fromkeys(data["sensors"]))
+        sensors = db.session.scalars(
+            select(Sensor)
+            .filter(Sensor.id.in_(sensor_ids))
+            .options(
+                selectinload(Sensor.generic_asset).selectinload(GenericAsset.owner)
+            )
+        ).all()
+        unknown_ids = set(sensor_ids) - {sensor.id for sensor in sensors}
+        if unknown_ids:
+            raise ValidationError(
+                {"sensors": [f"No sensor found with ID(s) {sorted(unknown_ids)}."]}
+            )
+        sensors_by_id = {sensor.id: sensor for sensor in sensors}
+        data["sensors"] = [sensors_by_id[sensor_id] for sensor_id in sensor_ids]
+        return data
+
+
 class TriggerScheduleKwargsSchema(SupportsLegacyFieldAliases, Schema):
     legacy_field_aliases = {
         "force_new_job_creation": "force-new-job-creation",
@@ -333,8 +388,8 @@ class SensorAPI(FlaskView):
 
     @route("", methods=["GET"])
     @use_kwargs(SensorKwargsSchema, location="query")
-    @as_json
-    def index(
+    @as_json_or_stream
+    def index(  # noqa: C901
         self,
         account: Account | None = None,
         asset: GenericAsset | None = None,
@@ -344,6 +399,8 @@ class SensorAPI(FlaskView):
         per_page: int | None = None,
         filter: list[str] | None = None,
         unit: str | None = None,
+        after: int | None = None,
+        response_format: str = "json",
     ):
         """
         .. :quickref: Sensors; Get list of sensors
@@ -375,6 +432,13 @@ class SensorAPI(FlaskView):
             all accessible sensors are returned, without pagination. If `page` is provided, the response is paginated, using `per-page` (default 10) to
             specify the number of records per page.
 
+            For long sensor lists, use keyset pagination instead: pass `after` (start with 0) to get the next `per-page` sensors
+            with an ID greater than `after`, ordered by ID. The response then includes a `next-cursor`, to pass as `after`
+            for the next page (it is `null` on the last page). Unlike with `page`, deep pages are as fast as the first one.
+
+            Set `format` to `ndjson` to stream all sensors (optionally after an `after` cursor) as newline-delimited JSON,
+            with one sensor per line.
+
           security:
             - ApiKeyAuth: []
           parameters:
@@ -406,6 +470,19 @@ class SensorAPI(FlaskView):
                           - data
                           - num-records
                           - filtered-records
+                      - type: object
+                        description: Keyset-paginated response
+                        properties:
+                          data:
+                            type: array
+                            items: Sensor
+                          next-cursor:
+                            type: integer
+                            nullable: true
+                            description: Cursor to pass as `after` to get the next page (null on the last page)
+                        required:
+                          - data
+                          - next-cursor
                   examples:
                     direct_list:
                       summary: Direct sensor list
@@ -433,6 +510,23 @@ class SensorAPI(FlaskView):
                             id: 2
                         num-records: 1
                         filtered-records: 1
+                    keyset_paginated_response:
+                      summary: Keyset-paginated sensor list
+                      description: Example of a page of sensors after cursor 1 (requested with `after=1&per-page=1`)
+                      value:
+                        data:
+                          - entity_address: "ea1.2021-01.io.flexmeasures.company:fm1.42"
+                            event_resolution: "PT15M"
+                            generic_asset_id: 1
+                            name: "Gas demand"
+                            timezone: "Europe/Amsterdam"
+                            unit: "m³/h"
+                            id: 2
+                        next-cursor: 2
+                application/x-ndjson:
+                  schema:
+                    type: string
+                    description: One sensor per line
             400:
               description: INVALID_REQUEST
             401:
@@ -516,6 +610,26 @@ class SensorAPI(FlaskView):
         if unit:
             sensor_query = sensor_query.filter(Sensor.unit == unit)
 
+        if response_format == "ndjson" or after is not None:
+            sensor_query = keyset_paginate(
+                sensor_query.options(
+                    selectinload(Sensor.generic_asset).selectinload(GenericAsset.owner)
+                ),
+                Sensor.id,
+                after=after,
+                limit=per_page if response_format == "json" else None,
+            )
+        if response_format == "ndjson":
+            return stream_ndjson(sensor_query, sensors_schema, keep=is_readable)
+        if after is not None:
+            sensors = db.session.scalars(sensor_query).all()
+            next_cursor = sensors[-1].id if len(sensors) == per_page else None
+            sensors = [sensor for sensor in sensors if is_readable(sensor)]
+            return {
+                "data": sensors_schema.dump(sensors),
+                "next-cursor": next_cursor,
+            }, 200
+
         sensors = (
             db.session.scalars(sensor_query).all()
             if page is None
@@ -657,15 +771,8 @@ class SensorAPI(FlaskView):
             sensor.generic_asset,
             f"Data from {join_words_into_a_list(filenames)} uploaded to sensor '{sensor.name}': {sensor.id}",
         )
-        files_for_job = []
-        for file in uploaded_files:
-            files_for_job.append(
-                dict(
-                    filename=file.filename,
-                    content_type=file.content_type,
-                    content=file.read(),
-                )
-            )
+        # Pass references to staged files to the ingestion job, rather than the file contents
+        files_for_job = [stage_uploaded_file(file) for file in uploaded_files]
         upload_data = {
             "belief-time-measured-instantly": (
                 "on" if belief_time_measured_instantly else "off"
@@ -1760,6 +1867,7 @@ class SensorAPI(FlaskView):
                 TimedBelief.event_start <= until - sensor.event_resolution
             )
         db.session.execute(query)
+        refresh_latest_beliefs([sensor.id])
 
         audit_message = f"Deleted data for sensor '{sensor.name}': {sensor.id}"
         if source is not None:
@@ -1932,6 +2040,84 @@ class SensorAPI(FlaskView):
 
         return {"sensors_data": status_data}, 200
 
+    @route("/latest-states", methods=["GET"])
+    @use_kwargs(LatestStatesKwargsSchema, location="query")
+    @permission_required_for_context("read", ctx_arg_name="sensors")
+    @as_json
+    def get_latest_states(
+        self, sensors: list[Sensor], source: DataSource | None = None
+    ):
+        """
+        .. :quickref: Data; Get the current state of many sensors
+        ---
+        get:
+          summary: Get the current state of many sensors
+          description: |
+            This endpoint fetches the most recent measurement (i.e. ex-post belief) about the most recent event of each of the given sensors,
+            per data source, in one go.
+            This is a lot faster than fetching sensor data for each sensor separately, e.g. to show the current state of all devices on a dashboard.
+
+            Sensors without measurements are listed with an empty list of states.
+          security:
+            - ApiKeyAuth: []
+          parameters:
+            - in: query
+              schema: LatestStatesKwargsSchema
+          responses:
+            200:
+              description: PROCESSED
+              content:
+                application/json:
+                  examples:
+                    successful_response:
+                      summary: Successful response
+                      description: The current state of two sensors, one of which has no data yet.
+                      value:
+                        sensors:
+                          - sensor: 1
+                            unit: "kW"
+                            states:
+                              - source: 3
+                                event_start: "2026-01-15T14:45:00+01:00"
+                                belief_time: "2026-01-15T15:00:12+01:00"
+                                value: 3.7
+                          - sensor: 2
+                            unit: "°C"
+                            states: []
+            400:
+              description: INVALID_REQUEST, REQUIRED_INFO_MISSING, UNEXPECTED_PARAMS
+            401:
+              description: UNAUTHORIZED
+            403:
+              description: INVALID_SENDER
+            422:
+              description: UNPROCESSABLE_ENTITY
+          tags:
+            - Sensors
+        """
+        latest_states = Sensor.latest_states(sensors, source=source)
+        states = {sensor.id: [] for sensor in sensors}
+        timezones = {sensor.id: sensor.timezone for sensor in sensors}
+        for row in latest_states.itertuples():
+            states[row.sensor_id].append(
+                dict(
+                    source=row.source.id,
+                    event_start=row.event_start.tz_convert(
+                        timezones[row.sensor_id]
+                    ).isoformat(),
+                    belief_time=row.belief_time.tz_convert(
+                        timezones[row.sensor_id]
+                    ).isoformat(),
+                    value=None if pd.isnull(row.event_value) else row.event_value,
+                )
+            )
+        return {
+            "sensors": [
+                dict(sensor=sensor.id, unit=sensor.unit, states=states[sensor.id])
+                for sensor in sensors
+            ]
+        }, 200
+
     @route("/<id>/forecasts/trigger", methods=["POST"])
     @limit_triggers()
     @use_args(
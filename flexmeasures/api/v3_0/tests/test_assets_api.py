@@ -170,6 +170,44 @@ def test_get_assets(
         assert turbine["account_id"] == setup_accounts["Supplier"].id
 
 
+@pytest.mark.parametrize("requesting_user", ["test_admin_user@seita.nl"], indirect=True)
+def test_get_assets_with_keyset_pagination_and_streaming(
+    client, setup_api_test_data, setup_accounts, requesting_user
+):
+    """Walking through the pages after a cursor, or streaming, gives the same assets as listing them all at once."""
+    query = {"all_accessible": True, "fields": "id|name|sensors"}
+    all_assets = client.get(url_for("AssetAPI:index"), query_string=query).json
+    expected_ids = sorted(asset["id"] for asset in all_assets)
+
+    ids, cursor = [], 0
+    while cursor is not None:
+        response = client.get(
+            url_for("AssetAPI:index"),
+            query_string={**query, "after": cursor, "per-page": 3},
+        )
+        assert response.status_code == 200
+        ids += [asset["id"] for asset in response.json["data"]]
+        cursor = response.json["next-cursor"]
+    assert ids == expected_ids
+
+    response = client.get(
+        url_for("AssetAPI:index"), query_string={**query, "format": "ndjson"}
+    )
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    streamed = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert sorted(streamed, key=lambda asset: asset["id"]) == sorted(
+        all_assets, key=lambda asset: asset["id"]
+    )
+
+    # Keyset pagination relies on sorting by ID
+    response = client.get(
+        url_for("AssetAPI:index"),
+        query_string={**query, "after": 0, "sort_by": "name", "sort_dir": "asc"},
+    )
+    assert response.status_code == 422
+
+
 @pytest.mark.parametrize("requesting_user", ["test_admin_user@seita.nl"], indirect=True)
 def test_get_assets_sort_by_owner_uses_account_name(
     client, setup_api_test_data, setup_accounts, requesting_user
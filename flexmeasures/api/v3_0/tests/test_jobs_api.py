@@ -146,8 +146,10 @@ def test_get_job_status_queued(
     assert data["enqueued-at"] is not None
     assert data["started-at"] is None
     assert data["ended-at"] is None
-    # result is not yet available
+    # result, timings and problem size are not yet available
     assert data["result"] is None
+    assert data["timings"] is None
+    assert data["problem-size"] is None
     assert data["exc-info"] is None
     assert_legacy_job_status_fields(data)
 
@@ -258,6 +260,20 @@ def test_get_job_status_finished(
     assert result["resolved"] == []
     assert result["num-beliefs"] == 96
     assert data["exc-info"] is None
+    # stage timings and problem size of the scheduling job
+    assert set(data["timings"]) == {
+        "deserialize",
+        "prepare",
+        "build",
+        "solve",
+        "postprocess",
+        "save",
+    }
+    assert all(seconds >= 0 for seconds in data["timings"].values())
+    assert data["problem-size"]["devices"] >= 1
+    assert data["problem-size"]["timesteps"] == 96
+    assert data["problem-size"]["rows"] > 0
+    assert data["problem-size"]["cols"] > 0
     assert_legacy_job_status_fields(data)
 
 
@@ -222,6 +222,47 @@ def test_fetch_sensors(
                 assert response.json[0]["unit"] == search_value
 
 
+@pytest.mark.parametrize(
+    "requesting_user", ["test_supplier_user_4@seita.nl"], indirect=True
+)
+def test_fetch_sensors_with_keyset_pagination_and_streaming(
+    client, setup_api_test_data, add_battery_assets, requesting_user
+):
+    """Walking through the pages after a cursor, or streaming, gives the same sensors as listing them all at once."""
+    all_sensors = client.get(url_for("SensorAPI:index")).json
+    expected_ids = sorted(sensor["id"] for sensor in all_sensors)
+    assert len(expected_ids) > 2
+
+    ids, cursor, num_pages = [], 0, 0
+    while cursor is not None:
+        response = client.get(
+            url_for("SensorAPI:index"), query_string={"after": cursor, "per-page": 2}
+        )
+        assert response.status_code == 200
+        assert len(response.json["data"]) <= 2
+        ids += [sensor["id"] for sensor in response.json["data"]]
+        cursor = response.json["next-cursor"]
+        num_pages += 1
+    assert ids == expected_ids
+    assert num_pages == len(expected_ids) // 2 + 1
+
+    response = client.get(
+        url_for("SensorAPI:index"),
+        query_string={"format": "ndjson", "after": expected_ids[0]},
+    )
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    streamed = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert [sensor["id"] for sensor in streamed] == expected_ids[1:]
+    assert streamed[0] == next(s for s in all_sensors if s["id"] == expected_ids[1])
+
+    # Keyset pagination can't be combined with page-based pagination
+    response = client.get(
+        url_for("SensorAPI:index"), query_string={"after": 0, "page": 1}
+    )
+    assert response.status_code == 422
+
+
 @pytest.mark.parametrize(
     "requesting_user", ["test_supplier_user_4@seita.nl"], indirect=True
 )
@@ -371,7 +412,10 @@ def test_upload_csv_file_returns_accepted_job(
     job = current_app.queues["ingestion"].fetch_job(response.json["job"])
     assert job.kwargs["sensor_id"] == sensor.id
     assert job.kwargs["uploaded_files"][0]["filename"] == "test.csv"
-    assert job.kwargs["uploaded_files"][0]["content"] == csv_content.encode("utf-8")
+    # The file is staged on disk, rather than passed to the job (and Redis) as a whole
+    assert "content" not in job.kwargs["uploaded_files"][0]
+    with open(job.kwargs["uploaded_files"][0]["path"], "rb") as staged_file:
+        assert staged_file.read() == csv_content.encode("utf-8")
     assert "data" not in job.kwargs
 
 
@@ -9,6 +9,7 @@ from timely_beliefs import BeliefsDataFrame
 
 from flexmeasures import Sensor
 from flexmeasures.data.models.time_series import TimedBelief
+from flexmeasures.data.services.latest_beliefs import refresh_latest_beliefs
 from flexmeasures.api.v3_0.tests.utils import generate_csv_content, get_sensor_by_name
 
 
@@ -477,3 +478,78 @@ def test_fetch_sensors_can_filter_by_sensor_id_prefix(
 
     assert full_id_response.status_code == 200
     assert [s["id"] for s in full_id_response.json] == [matching_sensor.id]
+
+
+@pytest.mark.parametrize("requesting_user", ["test_admin_user@seita.nl"], indirect=True)
+def test_get_latest_states(
+    client,
+    fresh_db,
+    setup_api_fresh_test_data,
+    requesting_user,
+):
+    # The test data was not saved with save_to_db, so we build the latest beliefs ourselves
+    refresh_latest_beliefs()
+    sensors = [
+        setup_api_fresh_test_data[name]
+        for name in (
+            "some gas sensor",
+            "some temperature sensor",
+            "empty temperature sensor",
+        )
+    ]
+    response = client.get(
+        url_for("SensorAPI:get_latest_states"),
+        query_string={"sensors": [sensor.id for sensor in sensors]},
+    )
+    assert response.status_code == 200
+    results = response.json["sensors"]
+    assert [result["sensor"] for result in results] == [sensor.id for sensor in sensors]
+    for sensor, result in zip(sensors, results):
+        assert result["unit"] == sensor.unit
+        for state in result["states"]:
+            expected = sensor.latest_state(source=state["source"]).reset_index()
+            assert state["event_start"] == expected["event_start"][0].isoformat()
+            assert state["belief_time"] == expected["belief_time"][0].isoformat()
+            assert state["value"] == expected["event_value"][0]
+    assert len(results[0]["states"]) == 2
+    assert results[2]["states"] == []
+
+    # Deleting the latest data updates the latest states
+    gas_sensor = sensors[0]
+    response = client.delete(
+        url_for("SensorAPI:delete_data", id=gas_sensor.id),
+        json={"start": "2021-05-02T00:20:00+02:00"},
+    )
+    assert response.status_code == 204
+    response = client.get(
+        url_for("SensorAPI:get_latest_states"),
+        query_string={"sensors": [gas_sensor.id]},
+    )
+    assert (
+        sorted(state["event_start"] for state in response.json["sensors"][0]["states"])
+        == ["2021-05-01T22:10:00+00:00"] * 2
+    )
+
+    # Unknown sensors are reported
+    response = client.get(
+        url_for("SensorAPI:get_latest_states"),
+        query_string={"sensors": [gas_sensor.id, 9999999]},
+    )
+    assert response.status_code == 422
+    assert "9999999" in str(response.json)
+
+
+@pytest.mark.parametrize(
+    "requesting_user", ["test_prosumer_user_2@seita.nl"], indirect=True
+)
+def test_get_latest_states_requires_read_access_to_all_sensors(
+    client,
+    fresh_db,
+    setup_api_fresh_test_data,
+    requesting_user,
+):
+    response = client.get(
+        url_for("SensorAPI:get_latest_states"),
+        query_string={"sensors": [setup_api_fresh_test_data["some gas sensor"].id]},
+    )
+    assert response.status_code == 403
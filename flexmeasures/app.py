@@ -5,7 +5,6 @@ Starting point of the Flask application.
 from __future__ import annotations
 
 import time
-from copy import copy
 import os
 from pathlib import Path
 from datetime import date
@@ -124,7 +123,11 @@ def create(  # noqa C901
             name="ingestion",
             default_timeout=get_job_timeout("ingestion", app.config, app.logger),
         ),
-        # reporting=Queue(connection=redis_conn, name="reporting"),
+        reporting=Queue(
+            connection=redis_conn,
+            name="reporting",
+            default_timeout=get_job_timeout("reporting", app.config, app.logger),
+        ),
         # labelling=Queue(connection=redis_conn, name="labelling"),
         # alerting=Queue(connection=redis_conn, name="alerting"),
     )
@@ -161,20 +164,22 @@ def create(  # noqa C901
 
     register_db_at(app)
 
-    # Register Forecasters, Reporters and Schedulers
-    from flexmeasures.utils.coding_utils import get_classes_module
-    from flexmeasures import Forecaster, Reporter, Scheduler
+    # Measure wall time and SQL queries of requests and jobs
+
+    from flexmeasures.utils.instrumentation import (
+        register_at as register_instrumentation_at,
+    )
+
+    register_instrumentation_at(app)
 
-    forecasters = get_classes_module("flexmeasures.data.models", Forecaster)
-    reporters = get_classes_module("flexmeasures.data.models", Reporter)
-    schedulers = get_classes_module("flexmeasures.data.models", Scheduler)
+    # Register Forecasters, Reporters and Schedulers (their modules are imported on first use)
+    from flexmeasures.utils.coding_utils import LazyClassRegistry
+    from flexmeasures.data.models import data_generators
 
-    app.data_generators = dict()
-    app.data_generators["forecaster"] = forecasters
-    app.data_generators["reporter"] = copy(
-        reporters
-    )  # use copy to avoid mutating app.reporters
-    app.data_generators["scheduler"] = schedulers
+    app.data_generators = {
+        generator_type: LazyClassRegistry(generators)
+        for generator_type, generators in data_generators.items()
+    }
 
     # add auth policy
 
@@ -93,6 +93,8 @@ from flexmeasures.data.models.user import User
 from flexmeasures.data.services.data_sources import (
     get_source_or_none,
 )
+from flexmeasures.data.services.reporting import register_report_dependencies
+from flexmeasures.data.services.rollups import update_rollups
 from flexmeasures.data.services.utils import get_or_create_model
 from flexmeasures.utils import flexmeasures_inflection
 from flexmeasures.utils.time_utils import server_now, apply_offset_chain
@@ -914,6 +916,57 @@ def add_beliefs(
             )
 
 
+@fm_add_data.command("rollups")
+@with_appcontext
+@click.option(
+    "--sensor",
+    "sensors",
+    type=SensorIdField(),
+    multiple=True,
+    help="Roll up the data of this sensor. Follow up with the sensor's ID. This argument can be given multiple times."
+    " By default, the data of all sensors is rolled up.",
+)
+@click.option(
+    "--start",
+    "start",
+    type=AwareDateTimeField(),
+    required=False,
+    help="Roll up data from (the start of the day of) this datetime onwards. Follow up with a timezone-aware datetime in ISO 6801 format.",
+)
+@click.option(
+    "--end",
+    "end",
+    type=AwareDateTimeField(),
+    required=False,
+    help="Roll up data until (the end of the day of) this datetime. Follow up with a timezone-aware datetime in ISO 6801 format.",
+)
+def add_rollups(
+    sensors: tuple[Sensor, ...],
+    start: datetime | None = None,
+    end: datetime | None = None,
+):
+    """(Re)build the hourly and daily rollups of sensor data.
+
+    The rollups are used to serve coarse data (see the FLEXMEASURES_ROLLUPS_ENABLED setting).
+    Rebuild them after deleting data or changing a sensor's timezone.
+    """
+    if not app.config.get("FLEXMEASURES_ROLLUPS_ENABLED", False):
+        click.secho(
+            "FLEXMEASURES_ROLLUPS_ENABLED is not set, so these rollups will neither be used nor kept up to date.",
+            **MsgStyle.WARN,
+        )
+    if not sensors:
+        sensors = db.session.scalars(select(Sensor).order_by(Sensor.id)).all()
+    for sensor in sensors:
+        update_rollups(sensor, start, end)
+        db.session.commit()
+        click.echo(f"Rolled up the data of {sensor}.")
+    click.secho(
+        f"Successfully rolled up the data of {len(sensors)} {flexmeasures_inflection.pluralize('sensor', len(sensors))}.",
+        **MsgStyle.SUCCESS,
+    )
+
+
 @fm_add_data.command("annotation", cls=DeprecatedOptionsCommand)
 @with_appcontext
 @click.option(
@@ -1834,6 +1887,22 @@ def add_schedule(  # noqa C901
     is_flag=True,
     help="Add this flag to save the `config` in the attributes of the DataSource for future reference.",
 )
+@click.option(
+    "--chunk-duration",
+    "chunk_duration",
+    type=DurationField(),
+    required=False,
+    help="Compute the report window by window, each window spanning this duration and saved in its own transaction,"
+    " which bounds the memory needed for long reports. Follow up with a duration in ISO 6801 format that covers whole events"
+    " of the output sensors, e.g. P30D (30 days). Set `chunk_overlap` in the reporter config if transformations need data beyond the window edges.",
+)
+@click.option(
+    "--recompute-on-new-data",
+    "recompute_on_new_data",
+    is_flag=True,
+    help="Add this flag to recompute the report (in jobs on the reporting queue) whenever new data is saved for its input sensors,"
+    " for the time window affected by the new data. The `config` and `parameters` are saved in the attributes of the DataSource.",
+)
 def add_report(  # noqa: C901
     reporter_class: str,
     source: DataSource | None = None,
@@ -1850,6 +1919,8 @@ def add_report(  # noqa: C901
     edit_parameters: bool = False,
     save_config: bool = False,
     timezone: str | None = None,
+    recompute_on_new_data: bool = False,
+    chunk_duration: timedelta | None = None,
 ):
     """
     Create a new report using the Reporter class and save the results
@@ -1873,14 +1944,18 @@ def add_report(  # noqa: C901
         parameters = launch_editor("/tmp/parameters.yml")
 
     # check if sensor is not provided in the `parameters` description
-    if "output" not in parameters or len(parameters["output"]) == 0:
+    # (in a batch, each entry describes its own output sensors)
+    output = parameters.get("output", []) + [
+        o for entry in parameters.get("batch", []) for o in entry.get("output", [])
+    ]
+    if len(output) == 0:
         click.secho(
             "At least one output sensor needs to be specified in the parameters description.",
             **MsgStyle.ERROR,
         )
         raise click.Abort()
 
-    output = [Output().load(o) for o in parameters["output"]]
+    output = [Output().load(o) for o in output]
 
     # compute now in the timezone local to the output sensor
     if timezone is not None:
@@ -1950,17 +2025,47 @@ def add_report(  # noqa: C901
         data_generator_type=Reporter,
     )
 
+    if recompute_on_new_data:
+        # the data source of the report should describe it fully, so it can be recomputed
+        reporter._save_config = True
+        reporter._save_parameters = True
+        reporter._data_source = None
+
     if ("start" not in parameters) and (start is not None):
         parameters["start"] = start.isoformat()
     if ("end" not in parameters) and (end is not None):
         parameters["end"] = end.isoformat()
     if ("resolution" not in parameters) and (resolution is not None):
         parameters["resolution"] = pd.Timedelta(resolution).isoformat()
+    if ("chunk_duration" not in parameters) and (chunk_duration is not None):
+        parameters["chunk_duration"] = isodate.duration_isoformat(chunk_duration)
 
     click.echo("Report computation is running...")
 
     # compute the report
-    results = reporter.compute(parameters=parameters)
+    if "chunk_duration" in parameters and not (dry_run or output_file_pattern):
+        # save the report chunk by chunk, rather than holding all of it in memory
+        for chunk_results in reporter.compute_in_chunks(parameters=parameters):
+            save_to_db([result["data"] for result in chunk_results])
+            db.session.commit()
+            click.echo(
+                f"Saved {sum(len(result['data']) for result in chunk_results)} report values of the next chunk."
+            )
+        results = []
+    else:
+        results = reporter.compute(parameters=parameters)
+
+    if recompute_on_new_data and not dry_run:
+        try:
+            input_ids = register_report_dependencies(reporter.data_source)
+        except ValueError as exc:
+            click.secho(str(exc), **MsgStyle.ERROR)
+            raise click.Abort()
+        db.session.commit()
+        click.secho(
+            f"The report will be recomputed whenever new data is saved for sensor(s) {input_ids}.",
+            **MsgStyle.SUCCESS,
+        )
 
     for result in results:
         data = result["data"]
@@ -1975,8 +2080,12 @@ def add_report(  # noqa: C901
                 **MsgStyle.WARN,
             )
 
-        # save the report if it's not running in dry mode
-        if not dry_run:
+        # save the report if it's not running in dry mode (a batch of reports is saved at once, below)
+        if dry_run:
+            click.echo(
+                f"Not saving report for sensor `{sensor}` to the database  (because of --dry-run), but this is what I computed:\n{data}"
+            )
+        elif "batch" not in parameters:
             click.echo(f"Saving report for sensor `{sensor}` to the database...")
             save_to_db(data)
             db.session.commit()
@@ -1984,10 +2093,6 @@ def add_report(  # noqa: C901
                 f"Success. The report for sensor `{sensor}` has been saved to the database.",
                 **MsgStyle.SUCCESS,
             )
-        else:
-            click.echo(
-                f"Not saving report for sensor `{sensor}` to the database  (because of --dry-run), but this is what I computed:\n{data}"
-            )
 
         # if an output file path is provided, save the data
         if output_file_pattern:
@@ -2032,6 +2137,15 @@ def add_report(  # noqa: C901
                 **MsgStyle.SUCCESS,
             )
 
+    if not dry_run and "batch" in parameters and results:
+        click.echo(f"Saving {len(results)} reports to the database...")
+        save_to_db([result["data"] for result in results])
+        db.session.commit()
+        click.secho(
+            f"Success. {len(results)} reports have been saved to the database.",
+            **MsgStyle.SUCCESS,
+        )
+
 
 def launch_editor(filename: str) -> dict:
     """Launch editor to create/edit a json object"""
@@ -5,9 +5,10 @@ CLI commands for removing data
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from itertools import chain
+import time
 
 import click
+from marshmallow import ValidationError
 from flask import current_app as app
 from flask.cli import with_appcontext
 from timely_beliefs.beliefs.queries import query_unchanged_beliefs
@@ -26,8 +27,14 @@ from flexmeasures.data.schemas import (
     SensorIdField,
     SourceIdField,
 )
+from flexmeasures.data.services.latest_beliefs import refresh_latest_beliefs
+from flexmeasures.data.services.retention import apply_retention_policies
+from flexmeasures.data.services.rollups import update_rollups
 from flexmeasures.data.services.users import find_user_by_email, delete_user
-from flexmeasures.data.services.sensors import delete_sensor as delete_sensor_and_data
+from flexmeasures.data.services.sensors import (
+    delete_beliefs_in_batches,
+    delete_sensor as delete_sensor_and_data,
+)
 from flexmeasures.cli.utils import (
     abort,
     done,
@@ -38,6 +45,28 @@ from flexmeasures.utils.flexmeasures_inflection import join_words_into_a_list
 from flexmeasures.utils.secrets_utils import delete_secret, get_secret_paths
 
 
+def _delete_beliefs_with_progress(
+    queries: list, num_beliefs_up_for_deletion: int, batch_size: int
+) -> int:
+    """Delete the beliefs selected by the given queries in batches, reporting progress and throughput."""
+    num_deleted = 0
+    start_time = time.perf_counter()
+    for query in queries:
+        for num_deleted_in_batch in delete_beliefs_in_batches(query, batch_size):
+            num_deleted += num_deleted_in_batch
+            elapsed = time.perf_counter() - start_time
+            click.echo(
+                f"{num_deleted}/{num_beliefs_up_for_deletion} beliefs deleted"
+                f" ({num_deleted / max(elapsed, 1e-9):.0f} beliefs/s) ..."
+            )
+    elapsed = time.perf_counter() - start_time
+    click.secho(
+        f"Removed {num_deleted} beliefs in {elapsed:.1f} seconds"
+        f" ({num_deleted / max(elapsed, 1e-9):.0f} beliefs/s)."
+    )
+    return num_deleted
+
+
 def _resolve_secret_path(
     secret: str | None, secret_path_parts: tuple[str, ...]
 ) -> str | tuple[str, ...]:
@@ -392,6 +421,21 @@ def delete_prognoses(
     "--force/--no-force", default=False, help="Skip warning about consequences."
 )
 @click.option("--offspring", type=bool, required=False, default=False, is_flag=True)
+@click.option(
+    "--batch-size",
+    "batch_size",
+    type=click.IntRange(min=1),
+    default=10000,
+    show_default=True,
+    help="Maximum number of beliefs to delete per transaction.",
+)
+@click.option(
+    "--dry-run",
+    "dry_run",
+    is_flag=True,
+    default=False,
+    help="Only count the beliefs up for deletion, without deleting them.",
+)
 def delete_beliefs(  # noqa: C901
     generic_assets: list[GenericAsset],
     sensors: list[Sensor],
@@ -400,8 +444,13 @@ def delete_beliefs(  # noqa: C901
     end: datetime | None = None,
     force: bool = False,
     offspring: bool = False,
+    batch_size: int = 10000,
+    dry_run: bool = False,
 ):
-    """Delete all beliefs recorded on a given sensor (or on sensors of a given asset)."""
+    """Delete all beliefs recorded on a given sensor (or on sensors of a given asset).
+
+    Beliefs are deleted in batches, each committed in its own transaction.
+    """
 
     # Validate input
     if not generic_assets and not sensors:
@@ -456,17 +505,27 @@ def delete_beliefs(  # noqa: C901
     if num_beliefs_up_for_deletion == 0:
         done("0 beliefs found.")
         return
+    if dry_run:
+        done(f"{num_beliefs_up_for_deletion} beliefs up for deletion (dry run).")
+        return
     if not force:
         if sensors:
             prompt = f"Delete all {num_beliefs_up_for_deletion} beliefs on {join_words_into_a_list([repr(sensor) for sensor in sensors])}?"
         elif generic_assets:
             prompt = f"Delete all {num_beliefs_up_for_deletion} beliefs on sensors of {join_words_into_a_list([repr(asset) for asset in generic_assets])}?"
         click.confirm(prompt, abort=True)
-    db.session.execute(
-        delete(TimedBelief).where(*entity_filters, *event_filters, *source_filters)
-    )
     click.secho(f"Removing {num_beliefs_up_for_deletion} beliefs ...")
-    db.session.commit()
+    _delete_beliefs_with_progress([q], num_beliefs_up_for_deletion, batch_size)
+    if app.config.get("FLEXMEASURES_ROLLUPS_ENABLED", False):
+        # Bring the rollups of the affected sensors up to date
+        affected_sensors = sensors or db.session.scalars(
+            select(Sensor).filter(
+                Sensor.generic_asset_id.in_([asset.id for asset in generic_assets])
+            )
+        )
+        for sensor in affected_sensors:
+            update_rollups(sensor, start, end)
+        db.session.commit()
     num_beliefs_after = db.session.scalar(select(func.count()).select_from(q))
     # only show the entity names for the final confirmation
     message = f"{num_beliefs_after} beliefs left on sensors "
@@ -531,6 +590,21 @@ def delete_beliefs(  # noqa: C901
     " Instantaneous events exactly at this datetime are kept."
     " Follow up with a timezone-aware datetime in ISO 6801 format.",
 )
+@click.option(
+    "--batch-size",
+    "batch_size",
+    type=click.IntRange(min=1),
+    default=10000,
+    show_default=True,
+    help="Maximum number of beliefs to delete per transaction.",
+)
+@click.option(
+    "--dry-run",
+    "dry_run",
+    is_flag=True,
+    default=False,
+    help="Only count the beliefs up for deletion, without deleting them.",
+)
 def delete_unchanged_beliefs(
     sources: list[Source],
     sensor: Sensor | None = None,
@@ -538,8 +612,13 @@ def delete_unchanged_beliefs(
     delete_unchanged_measurements: bool = True,
     start: datetime | None = None,
     end: datetime | None = None,
+    batch_size: int = 10000,
+    dry_run: bool = False,
 ):
-    """Delete unchanged beliefs (i.e. updated beliefs with a later belief time, but with the same event value)."""
+    """Delete unchanged beliefs (i.e. updated beliefs with a later belief time, but with the same event value).
+
+    Beliefs are deleted in batches, each committed in its own transaction.
+    """
     q = select(TimedBelief)
     if sensor:
         q = q.filter_by(sensor_id=sensor.id)
@@ -587,19 +666,16 @@ def delete_unchanged_beliefs(
     if num_beliefs_up_for_deletion == 0:
         done("0 unchanged beliefs found.")
         return
-    prompt = f"Delete {num_beliefs_up_for_deletion} unchanged beliefs ({num_measurements_up_for_deletion} measurements and {num_forecasts_up_for_deletion} forecasts) out of {num_beliefs_before} beliefs?"
-    click.confirm(prompt, abort=True)
+    summary = f"{num_beliefs_up_for_deletion} unchanged beliefs ({num_measurements_up_for_deletion} measurements and {num_forecasts_up_for_deletion} forecasts) out of {num_beliefs_before} beliefs"
+    if dry_run:
+        done(f"{summary} up for deletion (dry run).")
+        return
+    click.confirm(f"Delete {summary}?", abort=True)
 
-    beliefs_up_for_deletion = list(
-        chain(*[db.session.scalars(q).all() for q in unchanged_queries])
-    )
-    batch_size = 10000
-    for i, b in enumerate(beliefs_up_for_deletion, start=1):
-        if i % batch_size == 0 or i == num_beliefs_up_for_deletion:
-            click.echo(f"{i} beliefs processed ...")
-        db.session.delete(b)
     click.secho(f"Removing {num_beliefs_up_for_deletion} beliefs ...")
-    db.session.commit()
+    _delete_beliefs_with_progress(
+        unchanged_queries, num_beliefs_up_for_deletion, batch_size
+    )
     num_beliefs_after = db.session.scalar(select(func.count()).select_from(q))
     done(f"{num_beliefs_after} beliefs left.")
 
@@ -639,10 +715,79 @@ def delete_nan_beliefs(
     prompt = f"Delete {query.count()} NaN beliefs out of {q.count()} beliefs?"
     click.confirm(prompt, abort=True)
     query.delete()
+    refresh_latest_beliefs([sensor.id] if sensor is not None else None)
     db.session.commit()
     done(f"Done! {q.count()} beliefs left")
 
 
+@fm_delete_data.command("beliefs-past-retention")
+@with_appcontext
+@click.option(
+    "--sensor",
+    "sensors",
+    type=SensorIdField(),
+    required=False,
+    multiple=True,
+    help="Apply the retention policies of this sensor only. Follow up with the sensor's ID. "
+    "This argument can be given multiple times. Defaults to all sensors.",
+)
+@click.option(
+    "--batch-size",
+    "batch_size",
+    type=click.IntRange(min=1),
+    default=10000,
+    show_default=True,
+    help="Maximum number of beliefs to delete per transaction.",
+)
+@click.option(
+    "--dry-run",
+    "dry_run",
+    is_flag=True,
+    default=False,
+    help="Only count the beliefs up for deletion, without deleting them.",
+)
+def delete_beliefs_past_retention(
+    sensors: list[Sensor],
+    batch_size: int = 10000,
+    dry_run: bool = False,
+):
+    """Delete beliefs according to retention policies.
+
+    Retention policies are configured with the FLEXMEASURES_RETENTION_POLICIES setting,
+    or per sensor, with its retention-policies attribute.
+    Beliefs are deleted in batches, each committed in its own transaction,
+    so an interrupted run can be resumed by running this command again.
+    Meant to be run regularly, e.g. as a daily cron job.
+    """
+    num_deleted_per_policy: dict[tuple[int, str], int] = {}
+    start_time = time.perf_counter()
+    try:
+        for sensor, policy, num_deleted in apply_retention_policies(
+            sensors=list(sensors) or None, batch_size=batch_size, dry_run=dry_run
+        ):
+            key = (sensor.id, policy["action"])
+            num_deleted_per_policy[key] = (
+                num_deleted_per_policy.get(key, 0) + num_deleted
+            )
+            if not dry_run:
+                click.echo(
+                    f"{num_deleted_per_policy[key]} beliefs deleted from {sensor} ({policy['action']}) ..."
+                )
+    except ValidationError as exc:
+        abort(f"Invalid retention policy: {exc.messages}")
+    num_deleted = sum(num_deleted_per_policy.values())
+    if dry_run:
+        for (sensor_id, action), num_beliefs in num_deleted_per_policy.items():
+            click.echo(f"Sensor {sensor_id} ({action}): {num_beliefs} beliefs")
+        done(f"{num_deleted} beliefs up for deletion (dry run).")
+        return
+    elapsed = time.perf_counter() - start_time
+    done(
+        f"Removed {num_deleted} beliefs in {elapsed:.1f} seconds"
+        f" ({num_deleted / max(elapsed, 1e-9):.0f} beliefs/s)."
+    )
+
+
 @fm_delete_data.command("sensor")
 @with_appcontext
 @click.option(
@@ -11,16 +11,19 @@ from flask.cli import with_appcontext
 import json
 from flexmeasures.data.models.user import Account, Plan, RateLimitKey
 from flexmeasures.data.schemas.account import AccountIdField
-from sqlalchemy import delete, select
+from isodate import duration_isoformat
+from sqlalchemy import delete, func, select
 
 from flexmeasures import Sensor, Asset
 from flexmeasures.data import db
 from flexmeasures.data.schemas.attributes import validate_special_attributes
 from flexmeasures.data.schemas import AssetIdField
 from flexmeasures.data.schemas.sensors import SensorIdField
+from flexmeasures.data.schemas.times import DurationField
 from flexmeasures.data.models.generic_assets import GenericAsset
 from flexmeasures.data.models.audit_log import AssetAuditLog, AuditLog
 from flexmeasures.data.models.time_series import TimedBelief
+from flexmeasures.data.services.latest_beliefs import refresh_latest_beliefs
 from flexmeasures.data.utils import save_to_db
 from flexmeasures.cli.utils import (
     MsgStyle,
@@ -454,12 +457,22 @@ def edit_secret(
     " By default, an excerpt and the mean value of the original"
     " and resampled data will be shown for manual approval.",
 )
+@click.option(
+    "--chunk-duration",
+    "chunk_duration",
+    type=DurationField(),
+    required=False,
+    help="Resample the data window by window, each window spanning this duration and saved in its own transaction,"
+    " so that resampling can be resumed (by running the same command again) after an interruption."
+    " Follow up with a duration in ISO 6801 format that is a multiple of both the old and the new event resolution, e.g. P30D (30 days).",
+)
 def resample_sensor_data(
     sensor_ids: list[int],
     event_resolution_in_minutes: int,
     start_str: str | None = None,
     end_str: str | None = None,
     skip_integrity_check: bool = False,
+    chunk_duration: timedelta | None = None,
 ):
     """Assign a new event resolution to an existing sensor and resample its data accordingly."""
     event_resolution = timedelta(minutes=event_resolution_in_minutes)
@@ -470,6 +483,16 @@ def resample_sensor_data(
         if sensor.event_resolution == event_resolution:
             click.echo(f"{sensor} already has the desired event resolution.")
             continue
+        if chunk_duration is not None:
+            _resample_sensor_data_in_chunks(
+                sensor,
+                event_resolution=event_resolution,
+                event_starts_after=event_starts_after,
+                event_ends_before=event_ends_before,
+                chunk_duration=chunk_duration,
+                skip_integrity_check=skip_integrity_check,
+            )
+            continue
         df_original = sensor.search_beliefs(
             most_recent_beliefs_only=False,
             event_starts_after=event_starts_after,
@@ -507,10 +530,113 @@ def resample_sensor_data(
             )
         db.session.execute(query)
         save_to_db(df_resampled, bulk_save_objects=True)
+        refresh_latest_beliefs([sensor.id])
     db.session.commit()
     click.secho("Successfully resampled sensor data.", **MsgStyle.SUCCESS)
 
 
+#: Sensor attribute keeping track of the progress of resampling its data in chunks
+RESAMPLING_PROGRESS_ATTRIBUTE = "resampling-progress"
+
+
+def _resample_sensor_data_in_chunks(
+    sensor: Sensor,
+    event_resolution: timedelta,
+    event_starts_after: pd.Timestamp,
+    event_ends_before: pd.Timestamp,
+    chunk_duration: timedelta,
+    skip_integrity_check: bool = False,
+):
+    """Resample the sensor's data window by window, and commit each window.
+
+    Windows start at the sensor's first event (within the given period) and are multiples of both event resolutions,
+    so resampling periods line up with those from resampling all data at once.
+    The end of the last resampled window is kept in the sensor's "resampling-progress" attribute,
+    and the sensor's event resolution is only updated once all windows are resampled.
+    Running this function again after an interruption picks up where it left off.
+    """
+    original_resolution = sensor.event_resolution
+    if not isinstance(chunk_duration, timedelta) or any(
+        resolution > timedelta(0) and chunk_duration % resolution != timedelta(0)
+        for resolution in (original_resolution, event_resolution)
+    ):
+        abort(
+            f"The chunk duration should be a multiple of both {original_resolution} and {event_resolution}."
+        )
+    progress = sensor.attributes.get(RESAMPLING_PROGRESS_ATTRIBUTE)
+    if progress is not None and progress["event-resolution"] != duration_isoformat(
+        event_resolution
+    ):
+        abort(
+            f"{sensor} is being resampled to {progress['event-resolution']}. Finish resampling to that event resolution first."
+        )
+
+    # Find the period of data to resample
+    query = select(
+        func.min(TimedBelief.event_start), func.max(TimedBelief.event_start)
+    ).filter(TimedBelief.sensor_id == sensor.id)
+    if not pd.isnull(event_starts_after):
+        query = query.filter(TimedBelief.event_start >= event_starts_after)
+    if not pd.isnull(event_ends_before):
+        query = query.filter(
+            TimedBelief.event_start + original_resolution <= event_ends_before
+        )
+    first_event_start, last_event_start = db.session.execute(query).one()
+
+    if first_event_start is not None:
+        chunk_start = pd.Timestamp(first_event_start)
+        end = pd.Timestamp(last_event_start) + original_resolution
+        if progress is not None:
+            click.echo(
+                f"Resuming to resample {sensor} from {progress['resampled-until']} ..."
+            )
+            chunk_start = max(chunk_start, pd.Timestamp(progress["resampled-until"]))
+        check_integrity = not skip_integrity_check
+        while chunk_start < end:
+            chunk_end = chunk_start + chunk_duration
+            df_original = sensor.search_beliefs(
+                most_recent_beliefs_only=False,
+                event_starts_after=chunk_start,
+                event_ends_before=chunk_end,
+            ).sort_values("event_start")
+            df_resampled = df_original.resample_events(event_resolution).sort_values(
+                "event_start"
+            )
+            if check_integrity and not df_original.empty:
+                click.confirm(
+                    f"Data before (first window):\n{df_original}\nData after (first window):\n{df_resampled}\nContinue?",
+                    abort=True,
+                )
+                check_integrity = False
+            db.session.execute(
+                delete(TimedBelief).filter(
+                    TimedBelief.sensor_id == sensor.id,
+                    TimedBelief.event_start >= chunk_start,
+                    TimedBelief.event_start < chunk_end,
+                )
+            )
+            if not df_resampled.empty:
+                save_to_db(df_resampled, bulk_save_objects=True)
+            sensor.attributes[RESAMPLING_PROGRESS_ATTRIBUTE] = {
+                "event-resolution": duration_isoformat(event_resolution),
+                "resampled-until": chunk_end.isoformat(),
+            }
+            db.session.commit()
+            click.echo(
+                f"Resampled {len(df_original)} into {len(df_resampled)} beliefs, until {chunk_end}."
+            )
+            chunk_start = chunk_end
+
+    AssetAuditLog.add_record(
+        sensor.generic_asset,
+        f"Resampled sensor data for sensor '{sensor.name}': {sensor.id} to {event_resolution} from {original_resolution}",
+    )
+    sensor.event_resolution = event_resolution
+    sensor.attributes.pop(RESAMPLING_PROGRESS_ATTRIBUTE, None)
+    refresh_latest_beliefs([sensor.id])
+    db.session.commit()
+
+
 @fm_edit_data.command("transfer-ownership")
 @with_appcontext
 @click.option(
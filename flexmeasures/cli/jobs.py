@@ -8,14 +8,14 @@ import os
 import random
 import string
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from types import TracebackType
 from typing import Type
 
 import click
 from flask import current_app as app
 from flask.cli import with_appcontext
-from rq import Queue, Worker, SimpleWorker
+from rq import Queue, Worker
 from rq.job import Job, JobStatus, NoSuchJobError
 from rq.registry import (
     BaseRegistry,
@@ -33,6 +33,11 @@ import pandas as pd
 from flexmeasures.data.schemas import AssetIdField, SensorIdField
 from flexmeasures.data.services.scheduling import handle_scheduling_exception
 from flexmeasures.data.services.forecasting import handle_forecasting_exception
+from flexmeasures.utils.instrumentation import (
+    InstrumentedSimpleWorker,
+    InstrumentedWorker,
+    get_job_profile,
+)
 from flexmeasures.utils.job_utils import work_on_rq
 from flexmeasures.cli.utils import MsgStyle
 from flexmeasures.utils.flexmeasures_inflection import join_words_into_a_list
@@ -92,6 +97,10 @@ def stats(window: int):
 
         W = L / λ
 
+    \b
+    Stage timings per queue (for jobs that record them, like scheduling jobs):
+    -   median and 95th percentile of the time spent per stage (e.g. prepare, build, solve, save)
+    -   median problem size (e.g. devices, timesteps, rows, cols, nnz)
     """
     click.echo(
         f"Estimating arrival rates using a {window}-minute historical window from the recent jobs on all queues & registries...  Use --help to read more."
@@ -167,6 +176,34 @@ def stats(window: int):
     click.echo(tabulate(rows, headers=headers, tablefmt="simple"))
     click.echo("\n")
 
+    for queue_name, rq_queue in app.queues.items():
+        timings, problem_sizes = _collect_stage_timings(rq_queue, cutoff)
+        if timings.empty:
+            continue
+        click.echo(
+            f"Stage timings (s) of {len(timings)} recently finished {queue_name} jobs:"
+        )
+        stage_rows = [
+            [stage, seconds.median(), seconds.quantile(0.95)]
+            for stage, seconds in timings.items()
+        ]
+        click.echo(
+            tabulate(
+                stage_rows,
+                headers=["Stage", "median", "p95"],
+                tablefmt="simple",
+                floatfmt=".3f",
+            )
+        )
+        if not problem_sizes.empty:
+            click.echo(
+                "Median problem size: "
+                + ", ".join(
+                    f"{key}={size:.0f}" for key, size in problem_sizes.median().items()
+                )
+            )
+        click.echo("\n")
+
 
 def _estimate_arrival_rate_all_registries(
     queue: Queue, cutoff: datetime, window: int
@@ -264,6 +301,39 @@ def _estimate_service_time(
     return sum(durations) / len(durations)
 
 
+def _collect_stage_timings(
+    queue: Queue, cutoff: datetime, max_jobs: int = 200
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Collect the stage timings and problem sizes stored in the meta data of recently finished jobs.
+
+    Uses finished_job_registry and processes newest → oldest.
+    Returns one row per job, with a column per stage or problem size dimension.
+    """
+    try:
+        job_ids = queue.finished_job_registry.get_job_ids()
+    except Exception:
+        return pd.DataFrame(), pd.DataFrame()
+
+    timings = []
+    problem_sizes = []
+    job_ids = list(reversed(job_ids))[:max_jobs]
+    for job in Job.fetch_many(job_ids, connection=queue.connection):
+        if job is None or job.ended_at is None:
+            continue
+        ended_at = job.ended_at
+        if ended_at.tzinfo is None:
+            ended_at = ended_at.replace(tzinfo=timezone.utc)
+        if ended_at < cutoff:
+            break
+        if job.meta.get("timings"):
+            timings.append(job.meta["timings"])
+        if job.meta.get("problem_size"):
+            problem_sizes.append(job.meta["problem_size"])
+
+    return pd.DataFrame(timings), pd.DataFrame(problem_sizes)
+
+
 @fm_jobs.command("run-job")
 @with_appcontext
 @click.option(
@@ -293,7 +363,14 @@ def run_job(job_id: str):
     required=True,
     help="Job UUID of the job you want to inspect.",
 )
-def inspect_job(job_id: str):
+@click.option(
+    "--profile",
+    "show_profile",
+    is_flag=True,
+    default=False,
+    help="Also print the profiling report of the job (see the FLEXMEASURES_PROFILE_JOBS setting).",
+)
+def inspect_job(job_id: str, show_profile: bool = False):
     """
     Inspect a background job and print its current status, result and metadata.
 
@@ -342,12 +419,26 @@ def inspect_job(job_id: str):
         ["Ended At", job.ended_at.isoformat() if job.ended_at else "—"],
     ]
 
+    profile = get_job_profile(job)
+    if profile is not None:
+        info_data.append(["Profile", "available (use --profile to show it)"])
+
     click.echo(tabulate(info_data, headers=["Field", "Value"]))
 
     if exc_info:
         click.echo("\nException Info:")
         click.echo(exc_info)
 
+    if show_profile:
+        if profile is None:
+            click.secho(
+                "\nNo profiling report available for this job (it was not profiled, or its report has expired).",
+                **MsgStyle.WARN,
+            )
+        else:
+            click.echo("\nProfile:")
+            click.echo(profile)
+
 
 @fm_jobs.command("run-worker")
 @with_appcontext
@@ -355,7 +446,7 @@ def inspect_job(job_id: str):
     "--queue",
     default=None,
     required=True,
-    help="State which queue(s) to work on (using '|' as separator), e.g. 'forecasting', 'scheduling', 'ingestion' or 'forecasting|scheduling'.",
+    help="State which queue(s) to work on (using '|' as separator), e.g. 'forecasting', 'scheduling', 'ingestion', 'reporting' or 'forecasting|scheduling'.",
 )
 @click.option(
     "--name",
@@ -374,7 +465,7 @@ def inspect_job(job_id: str):
 )
 def run_worker(queue: str, name: str | None, with_scheduler: bool):
     """
-    Start a worker process for forecasting, scheduling and/or ingestion jobs.
+    Start a worker process for forecasting, scheduling, ingestion and/or reporting jobs.
 
     We use the app context to find out which redis queues to use.
     """
@@ -384,6 +475,9 @@ def run_worker(queue: str, name: str | None, with_scheduler: bool):
     # https://stackoverflow.com/questions/50822822/high-sqlalchemy-initialization-overhead
     configure_mappers()
 
+    # Import the data generators used by jobs on these queues once, rather than in each forked job process
+    preload_data_generators(q_list)
+
     connection = app.queues["forecasting"].connection
 
     # provide a random name if none was given
@@ -408,14 +502,14 @@ def run_worker(queue: str, name: str | None, with_scheduler: bool):
     # SimpleWorker executes jobs in-process (no fork) and is therefore the correct
     # choice for macOS development environments.
     if sys.platform == "darwin":
-        worker = SimpleWorker(
+        worker = InstrumentedSimpleWorker(
             q_list,
             connection=connection,
             name=used_name,
             exception_handlers=[error_handler],
         )
     else:
-        worker = Worker(
+        worker = InstrumentedWorker(
             q_list,
             connection=connection,
             name=used_name,
@@ -734,6 +828,27 @@ def handle_worker_exception(
     job.save_meta()
 
 
+#: Types of data generators used by jobs on each queue
+QUEUE_DATA_GENERATOR_TYPES = dict(
+    forecasting="forecaster",
+    scheduling="scheduler",
+    reporting="reporter",
+)
+
+
+def preload_data_generators(queues: list[Queue]):
+    """Import the data generator classes used by jobs on the given queues.
+
+    The app registers data generators lazily, so that starting the app does not import heavy dependencies
+    (such as Pyomo or LightGBM) that only some of its jobs need.
+    A worker does need them, though, and should import them before it forks off processes to run jobs.
+    """
+    for queue in queues:
+        generator_type = QUEUE_DATA_GENERATOR_TYPES.get(queue.name)
+        if generator_type is not None:
+            app.data_generators[generator_type].load_all()
+
+
 def parse_queue_list(queue_names_str: str) -> list[Queue]:
     """Parse a | separated string of queue names against the app.queues dict.
 
@@ -14,7 +14,6 @@ else:
 
 from flexmeasures.data.models.time_series import TimedBelief
 from flexmeasures.utils.time_utils import as_server_time
-from flexmeasures.data.models.forecasting.pipelines import TrainPredictPipeline
 from flexmeasures.data.services.forecasting import handle_forecasting_exception
 
 """
@@ -31,6 +30,8 @@ def test_making_forecasts():
     Manual test to enqueue and process a fixed-viewpoint forecasting job via redis queue.
     """
 
+    from flexmeasures.data.models.forecasting.pipelines import TrainPredictPipeline
+
     click.echo("Manual forecasting job queuing started ...")
 
     sensor_id = 1
@@ -198,6 +198,25 @@ def test_add_holidays(app, fresh_db, setup_roles_users_fresh_db):
     )
 
 
+def test_add_rollups(app, fresh_db, setup_dummy_data):
+    from flexmeasures.cli.data_add import add_rollups
+    from flexmeasures.data.models.rollups import TimedBeliefRollup
+
+    sensor1_id, sensor2_id, _, _ = setup_dummy_data
+    runner = app.test_cli_runner()
+    result = runner.invoke(add_rollups, ["--sensor", str(sensor1_id)])
+    check_command_ran_without_error(result)
+    assert "Successfully rolled up the data of 1 sensor." in result.output
+
+    # 200 hourly beliefs span 9 days, and hourly data is only rolled up per day
+    rollups = fresh_db.session.scalars(select(TimedBeliefRollup)).all()
+    assert len(rollups) == 9
+    assert {rollup.sensor_id for rollup in rollups} == {sensor1_id}
+    assert {rollup.period for rollup in rollups} == {"day"}
+    assert sum(rollup.count for rollup in rollups) == 200
+    assert sum(rollup.sum_value for rollup in rollups) == sum(range(200))
+
+
 def test_cli_help(app):
     """Test that showing help does not throw an error."""
     from flexmeasures.cli import data_add
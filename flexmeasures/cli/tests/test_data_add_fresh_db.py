@@ -5,6 +5,7 @@ import logging
 import os
 from datetime import datetime
 import pytz
+import pandas as pd
 from sqlalchemy import select
 
 from flexmeasures import Asset
@@ -226,6 +227,161 @@ def test_add_reporter(app, fresh_db, setup_dummy_data, caplog):
         assert len(stored_report) == 95
 
 
+def test_add_report_in_chunks(app, fresh_db, setup_dummy_data):
+    """The report of test_add_reporter, computed and saved in chunks of 4 hours."""
+
+    from flexmeasures.cli.data_add import add_report
+
+    sensor1_id, sensor2_id, report_sensor_id, _ = setup_dummy_data
+
+    reporter_config = dict(
+        required_input=[{"name": "sensor_1"}, {"name": "sensor_2"}],
+        required_output=[{"name": "df_agg"}],
+        transformations=[
+            dict(
+                df_input="sensor_1",
+                method="add",
+                args=["@sensor_2"],
+                df_output="df_agg",
+            ),
+            dict(method="resample_events", args=["2h"]),
+        ],
+    )
+    parameters = dict(
+        input=[
+            dict(name="sensor_1", sensor=sensor1_id),
+            dict(name="sensor_2", sensor=sensor2_id),
+        ],
+        output=[dict(name="df_agg", sensor=report_sensor_id)],
+    )
+    cli_input = to_flags(
+        {
+            "config": "reporter_config.yaml",
+            "parameters": "parameters.json",
+            "reporter": "PandasReporter",
+            "start": "2023-04-10T00:00:00+00:00",
+            "end": "2023-04-10T10:00:00+00:00",
+            "chunk-duration": "PT4H",
+        }
+    )
+
+    runner = app.test_cli_runner()
+    with runner.isolated_filesystem():
+        with open("reporter_config.yaml", "w") as f:
+            yaml.dump(reporter_config, f)
+        with open("parameters.json", "w") as f:
+            json.dump(parameters, f)
+        result = runner.invoke(add_report, cli_input)
+        check_command_ran_without_error(result)
+    assert result.output.count("report values of the next chunk") == 3
+
+    report_sensor = fresh_db.session.get(Sensor, report_sensor_id)
+    stored_report = report_sensor.search_beliefs(
+        event_starts_after=datetime(2023, 4, 10, tzinfo=pytz.utc),
+        event_ends_before=datetime(2023, 4, 10, 10, tzinfo=pytz.utc),
+    )
+    assert (stored_report.values.T == [1, 2 + 3, 4 + 5, 6 + 7, 8 + 9]).all()
+
+
+def test_add_report_recomputed_on_new_data(app, fresh_db, setup_dummy_data):
+    """
+    The report (as in test_add_reporter) is registered to be recomputed whenever new data is saved for its input sensors.
+    Corrected values at 3 AM lead to recomputing only the report's 2-hour event starting at 2 AM.
+    """
+
+    from flexmeasures.cli.data_add import add_report
+    from flexmeasures.data.models.report_dependencies import ReportDependency
+    from flexmeasures.data.utils import save_to_db
+    from flexmeasures.utils.job_utils import work_on_rq
+
+    sensor1_id, sensor2_id, report_sensor_id, _ = setup_dummy_data
+
+    reporter_config = dict(
+        required_input=[{"name": "sensor_1"}, {"name": "sensor_2"}],
+        required_output=[{"name": "df_agg"}],
+        transformations=[
+            dict(
+                df_input="sensor_1",
+                method="add",
+                args=["@sensor_2"],
+                df_output="df_agg",
+            ),
+            dict(method="resample_events", args=["2h"]),
+        ],
+    )
+    parameters = dict(
+        input=[
+            dict(name="sensor_1", sensor=sensor1_id),
+            dict(name="sensor_2", sensor=sensor2_id),
+        ],
+        output=[dict(name="df_agg", sensor=report_sensor_id)],
+    )
+    cli_input = to_flags(
+        {
+            "config": "reporter_config.yaml",
+            "parameters": "parameters.json",
+            "reporter": "PandasReporter",
+            "start": "2023-04-10T00:00:00+00:00",
+            "end": "2023-04-10T10:00:00+00:00",
+        }
+    ) + ["--recompute-on-new-data"]
+
+    runner = app.test_cli_runner()
+    with runner.isolated_filesystem():
+        with open("reporter_config.yaml", "w") as f:
+            yaml.dump(reporter_config, f)
+        with open("parameters.json", "w") as f:
+            json.dump(parameters, f)
+        result = runner.invoke(add_report, cli_input)
+        check_command_ran_without_error(result)
+    assert "The report will be recomputed whenever new data is saved" in result.output
+
+    dependencies = fresh_db.session.scalars(select(ReportDependency)).all()
+    assert sorted(d.sensor_id for d in dependencies) == [sensor1_id, sensor2_id]
+    reporter_source = fresh_db.session.get(DataSource, dependencies[0].source_id)
+    assert reporter_source.attributes["data_generator"]["parameters"]["input"]
+
+    # Save corrected values for both input sensors
+    new_data = []
+    for sensor_id in (sensor1_id, sensor2_id):
+        sensor = fresh_db.session.get(Sensor, sensor_id)
+        bdf = sensor.search_beliefs(
+            event_starts_after=datetime(2023, 4, 10, 3, tzinfo=pytz.utc),
+            event_ends_before=datetime(2023, 4, 10, 4, tzinfo=pytz.utc),
+        ).reset_index()
+        bdf["belief_time"] = datetime(2023, 4, 11, tzinfo=pytz.utc)
+        bdf["event_value"] = 100
+        bdf = bdf.set_index(
+            ["event_start", "belief_time", "source", "cumulative_probability"]
+        )
+        bdf.sensor = sensor
+        new_data.append(bdf)
+    reporting_queue = app.queues["reporting"]
+    save_to_db(new_data)
+    assert reporting_queue.count == 0  # nothing is queued before committing
+    fresh_db.session.commit()
+    assert reporting_queue.count == 1
+    job = reporting_queue.jobs[0]
+    assert job.kwargs["start"] == "2023-04-10T03:00:00+00:00"
+    assert job.kwargs["end"] == "2023-04-10T04:00:00+00:00"
+
+    work_on_rq(reporting_queue)
+    assert job.get_status(refresh=True) == "finished"
+
+    report_sensor = fresh_db.session.get(Sensor, report_sensor_id)
+    report = report_sensor.search_beliefs(
+        event_starts_after=datetime(2023, 4, 10, tzinfo=pytz.utc),
+        event_ends_before=datetime(2023, 4, 10, 10, tzinfo=pytz.utc),
+        most_recent_beliefs_only=False,
+    )
+    # only the report's event at 2 AM was recomputed
+    beliefs_per_event = report.groupby(level="event_start").size()
+    assert beliefs_per_event.index[beliefs_per_event > 1].tolist() == [
+        pd.Timestamp("2023-04-10T02:00:00+00:00")
+    ]
+    assert len(beliefs_per_event) == 5
+
+
 def test_add_multiple_output(app, fresh_db, setup_dummy_data, caplog):
     """ """
 
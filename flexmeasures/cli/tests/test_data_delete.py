@@ -1,8 +1,13 @@
+from datetime import datetime, timedelta
+
 import pytest
+from pytz import utc
 from sqlalchemy import select, func
 
 from flexmeasures.cli.tests.utils import check_command_ran_without_error, to_flags
 from flexmeasures.data.models.audit_log import AuditLog
+from flexmeasures.data.models.data_sources import DataSource
+from flexmeasures.data.models.time_series import Sensor, TimedBelief
 from flexmeasures.data.models.user import Account, User
 from flexmeasures.data.services.users import find_user_by_email
 from flexmeasures.utils.secrets_utils import (
@@ -366,3 +371,155 @@ def test_delete_user(fresh_db, setup_roles_users_fresh_db, setup_assets_fresh_db
             f"Data source {data_source_id} account_id should be preserved (not nullified) "
             "after user deletion for lineage purposes."
         )
+
+
+def count_beliefs(db, sensor_id: int) -> int:
+    return db.session.scalar(
+        select(func.count()).select_from(TimedBelief).filter_by(sensor_id=sensor_id)
+    )
+
+
+def test_delete_beliefs_in_batches(app, fresh_db, setup_dummy_asset, setup_dummy_data):
+    from flexmeasures.cli.data_delete import delete_beliefs
+
+    sensor_1_id, sensor_2_id, _, _ = setup_dummy_data
+    runner = app.test_cli_runner()
+
+    # A dry run only counts
+    result = runner.invoke(
+        delete_beliefs, to_flags({"sensor": sensor_1_id}) + ["--dry-run"]
+    )
+    check_command_ran_without_error(result)
+    assert "200 beliefs up for deletion (dry run)" in result.output
+    assert count_beliefs(fresh_db, sensor_1_id) == 200
+
+    result = runner.invoke(
+        delete_beliefs,
+        to_flags({"sensor": sensor_1_id, "batch-size": 30}) + ["--force"],
+    )
+    check_command_ran_without_error(result)
+    assert "30/200 beliefs deleted" in result.output
+    assert "beliefs/s" in result.output
+    assert count_beliefs(fresh_db, sensor_1_id) == 0
+    assert count_beliefs(fresh_db, sensor_2_id) == 200
+
+    # Delete the remaining beliefs on sensors of the asset, within a time window
+    result = runner.invoke(
+        delete_beliefs,
+        to_flags(
+            {
+                "asset": setup_dummy_asset,
+                "start": "2023-04-10T00:00+00:00",
+                "end": "2023-04-11T00:00+00:00",
+                "batch-size": 1000,
+            }
+        )
+        + ["--force"],
+    )
+    check_command_ran_without_error(result)
+    assert count_beliefs(fresh_db, sensor_2_id) == 200 - 24
+
+
+def test_delete_unchanged_beliefs_in_batches(app, fresh_db, setup_dummy_data):
+    """Delete unchanged beliefs from chains of beliefs about the same events, across batch boundaries.
+
+    The dummy data contains one belief per event, formed on 9 April.
+    We add an earlier belief (formed on 8 April), which differs for odd events,
+    and a later belief (formed on 9 April at noon), which is unchanged for all events.
+    """
+    from flexmeasures.cli.data_delete import delete_unchanged_beliefs
+
+    sensor_1_id, sensor_2_id, _, _ = setup_dummy_data
+    sensor_1 = fresh_db.session.get(Sensor, sensor_1_id)
+    source = fresh_db.session.scalars(
+        select(DataSource).filter_by(name="source1")
+    ).one()
+    for belief_time, sign in (
+        (datetime(2023, 4, 8, tzinfo=utc), lambda t: 1 if t % 2 == 0 else -1),
+        (datetime(2023, 4, 9, 12, tzinfo=utc), lambda t: 1),
+    ):
+        fresh_db.session.add_all(
+            [
+                TimedBelief(
+                    event_start=datetime(2023, 4, 10, tzinfo=utc) + timedelta(hours=t),
+                    belief_time=belief_time,
+                    event_value=sign(t) * t,
+                    sensor=sensor_1,
+                    source=source,
+                )
+                for t in range(200)
+            ]
+        )
+    fresh_db.session.commit()
+    assert count_beliefs(fresh_db, sensor_1_id) == 600
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(
+        delete_unchanged_beliefs,
+        to_flags({"sensor": sensor_1_id}) + ["--dry-run"],
+    )
+    check_command_ran_without_error(result)
+    assert "300 unchanged beliefs" in result.output
+    assert count_beliefs(fresh_db, sensor_1_id) == 600
+
+    result = runner.invoke(
+        delete_unchanged_beliefs,
+        to_flags({"sensor": sensor_1_id, "batch-size": 7}),
+        input="y\n",
+    )
+    check_command_ran_without_error(result)
+    assert "Removed 300 beliefs" in result.output
+
+    # Only the beliefs that changed the value of the event are left
+    values = fresh_db.session.scalars(
+        select(TimedBelief.event_value)
+        .filter_by(sensor_id=sensor_1_id)
+        .order_by(TimedBelief.event_start, TimedBelief.belief_horizon.desc())
+    ).all()
+    expected_values = []
+    for t in range(200):
+        expected_values += [t] if t % 2 == 0 else [-t, t]
+    assert values == expected_values
+    assert count_beliefs(fresh_db, sensor_2_id) == 200
+
+
+def test_delete_beliefs_past_retention(app, fresh_db, setup_dummy_data):
+    from flexmeasures.cli.data_delete import delete_beliefs_past_retention
+
+    sensor_1_id, sensor_2_id, _, _ = setup_dummy_data
+    sensor_1 = fresh_db.session.get(Sensor, sensor_1_id)
+    source = fresh_db.session.scalars(
+        select(DataSource).filter_by(name="source1")
+    ).one()
+    # Add a more recent belief about each event on sensor 1
+    fresh_db.session.add_all(
+        [
+            TimedBelief(
+                event_start=datetime(2023, 4, 10, tzinfo=utc) + timedelta(hours=t),
+                belief_time=datetime(2023, 4, 9, 12, tzinfo=utc),
+                event_value=-t,
+                sensor=sensor_1,
+                source=source,
+            )
+            for t in range(200)
+        ]
+    )
+    sensor_1.attributes["retention-policies"] = [
+        {"action": "keep-most-recent-belief", "older-than": "P30D"}
+    ]
+    fresh_db.session.commit()
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(delete_beliefs_past_retention, ["--dry-run"])
+    check_command_ran_without_error(result)
+    assert "200 beliefs up for deletion (dry run)" in result.output
+    assert count_beliefs(fresh_db, sensor_1_id) == 400
+
+    result = runner.invoke(
+        delete_beliefs_past_retention,
+        to_flags({"sensor": sensor_1_id, "batch-size": 64}),
+    )
+    check_command_ran_without_error(result)
+    assert "Removed 200 beliefs" in result.output
+    assert count_beliefs(fresh_db, sensor_1_id) == 200
+    assert count_beliefs(fresh_db, sensor_2_id) == 200
@@ -0,0 +1,67 @@
+import pandas as pd
+
+from flexmeasures.cli.tests.utils import check_command_ran_without_error, to_flags
+from flexmeasures.data.models.time_series import Sensor
+
+
+def test_resample_sensor_data_in_chunks(app, fresh_db, setup_dummy_data, monkeypatch):
+    """Check resampling hourly data to a 2-hour resolution in daily chunks, with an interruption halfway."""
+    from flexmeasures.cli import data_edit
+
+    sensor_id, other_sensor_id, _, _ = setup_dummy_data
+    sensor = fresh_db.session.get(Sensor, sensor_id)
+    beliefs_before = sensor.search_beliefs(most_recent_beliefs_only=False)
+    expected_beliefs = beliefs_before.resample_events(pd.Timedelta(hours=2))
+
+    # Interrupt resampling after 3 chunks
+    original_save_to_db = data_edit.save_to_db
+    saved_chunks = []
+
+    def interrupted_save_to_db(*args, **kwargs):
+        if len(saved_chunks) == 3:
+            raise KeyboardInterrupt
+        saved_chunks.append(args[0])
+        return original_save_to_db(*args, **kwargs)
+
+    monkeypatch.setattr(data_edit, "save_to_db", interrupted_save_to_db)
+    cli_input = {
+        "sensor": sensor_id,
+        "event-resolution": 120,
+        "chunk-duration": "P1D",
+    }
+    runner = app.test_cli_runner()
+    result = runner.invoke(
+        data_edit.resample_sensor_data,
+        to_flags(cli_input) + ["--skip-integrity-check"],
+    )
+    assert result.exit_code != 0
+    fresh_db.session.rollback()
+    sensor = fresh_db.session.get(Sensor, sensor_id)
+    assert sensor.event_resolution == pd.Timedelta(hours=1)
+    assert sensor.attributes["resampling-progress"] == {
+        "event-resolution": "PT2H",
+        "resampled-until": "2023-04-13T00:00:00+00:00",
+    }
+
+    # Resume
+    monkeypatch.setattr(data_edit, "save_to_db", original_save_to_db)
+    result = runner.invoke(
+        data_edit.resample_sensor_data,
+        to_flags(cli_input) + ["--skip-integrity-check"],
+    )
+    check_command_ran_without_error(result)
+    assert "Resuming" in result.output
+    assert "Successfully resampled" in result.output
+
+    sensor = fresh_db.session.get(Sensor, sensor_id)
+    assert sensor.event_resolution == pd.Timedelta(hours=2)
+    assert "resampling-progress" not in sensor.attributes
+    beliefs_after = sensor.search_beliefs(most_recent_beliefs_only=False)
+    assert len(beliefs_after) == len(expected_beliefs) == 100
+    pd.testing.assert_series_equal(
+        beliefs_after["event_value"], expected_beliefs["event_value"]
+    )
+
+    # The other sensor's data was left alone
+    other_sensor = fresh_db.session.get(Sensor, other_sensor_id)
+    assert len(other_sensor.search_beliefs(most_recent_beliefs_only=False)) == 200
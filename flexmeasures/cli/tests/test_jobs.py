@@ -60,6 +60,33 @@ def test_inspect_failed_job_uses_rq_result_exception_info(app, clean_job_redis):
     assert "does not state why it failed" not in output
 
 
+def test_inspect_job_shows_profile(app, clean_job_redis):
+    from flexmeasures.cli.jobs import fm_jobs
+
+    runner = app.test_cli_runner()
+
+    with app.app_context():
+        job = app.queues["scheduling"].enqueue(sum, [1, 2])
+        job.meta["profile"] = f"flexmeasures:profile:{job.id}"
+        job.save_meta()
+        app.redis_connection.set(job.meta["profile"], "1.000 sum  <built-in>")
+
+    result = runner.invoke(fm_jobs, ["inspect-job", "--job", job.id])
+    assert result.exit_code == 0, result.output
+    assert "available (use --profile to show it)" in result.output
+    assert "1.000 sum" not in result.output
+
+    result = runner.invoke(fm_jobs, ["inspect-job", "--job", job.id, "--profile"])
+    assert result.exit_code == 0, result.output
+    assert "Profile:\n1.000 sum  <built-in>" in result.output
+
+    # The report has expired
+    app.redis_connection.delete(job.meta["profile"])
+    result = runner.invoke(fm_jobs, ["inspect-job", "--job", job.id, "--profile"])
+    assert result.exit_code == 0, result.output
+    assert "No profiling report available" in result.output
+
+
 def test_inspect_job_error_when_job_not_found(app):
     from flexmeasures.cli.jobs import fm_jobs
 
@@ -70,3 +97,28 @@ def test_inspect_job_error_when_job_not_found(app):
     )
     assert result.exit_code != 0
     assert "not found" in result.output.lower()
+
+
+def test_stats_aggregates_stage_timings(app, clean_job_redis):
+    from flexmeasures.cli.jobs import fm_jobs
+
+    runner = app.test_cli_runner()
+
+    with app.app_context():
+        queue = app.queues["scheduling"]
+        worker = SimpleWorker([queue], connection=queue.connection)
+        for solve_time in (1, 2, 3):
+            job = queue.enqueue(sum, [1, 2])
+            worker.perform_job(job, queue)
+            job.meta["timings"] = dict(prepare=0.5, solve=solve_time)
+            job.meta["problem_size"] = dict(devices=2, timesteps=96)
+            job.save_meta()
+
+    result = runner.invoke(fm_jobs, ["stats"])
+    assert result.exit_code == 0, result.output
+
+    output = result.output
+    assert "Stage timings (s) of 3 recently finished scheduling jobs" in output
+    assert "prepare     0.500  0.500" in output
+    assert "solve       2.000  2.900" in output
+    assert "Median problem size: devices=2, timesteps=96" in output
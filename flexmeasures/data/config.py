@@ -48,6 +48,9 @@ def configure_db_for(app: Flask):
             user,
             task_runs,
             forecasting,
+            rollups,
+            report_dependencies,
+            latest_beliefs,
         )  # noqa: F401
 
         # This would create db structure based on models, but you should use `flask db upgrade` for that.
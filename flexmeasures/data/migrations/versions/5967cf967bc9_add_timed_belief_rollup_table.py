@@ -0,0 +1,57 @@
+"""add timed_belief_rollup table
+
+Revision ID: 5967cf967bc9
+Revises: 3bc1e29ca1f4
+Create Date: 2026-10-18 22:40:12.381904
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "5967cf967bc9"
+down_revision = "3bc1e29ca1f4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "timed_belief_rollup",
+        sa.Column("sensor_id", sa.Integer(), nullable=False),
+        sa.Column("source_id", sa.Integer(), nullable=False),
+        sa.Column("period", sa.String(length=8), nullable=False),
+        sa.Column("period_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("first_event_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_event_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_belief_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("min_value", sa.Float(), nullable=True),
+        sa.Column("max_value", sa.Float(), nullable=True),
+        sa.Column("sum_value", sa.Float(), nullable=True),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("last_value", sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["sensor_id"],
+            ["sensor.id"],
+            name=op.f("timed_belief_rollup_sensor_id_sensor_fkey"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["source_id"],
+            ["data_source.id"],
+            name=op.f("timed_belief_rollup_source_id_data_source_fkey"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "sensor_id",
+            "source_id",
+            "period",
+            "period_start",
+            name=op.f("timed_belief_rollup_pkey"),
+        ),
+    )
+
+
+def downgrade():
+    op.drop_table("timed_belief_rollup")
@@ -0,0 +1,45 @@
+"""add report_dependency table
+
+Revision ID: b7e3d1a0c925
+Revises: 5967cf967bc9
+Create Date: 2026-10-18 23:52:41.204518
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "b7e3d1a0c925"
+down_revision = "5967cf967bc9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "report_dependency",
+        sa.Column("sensor_id", sa.Integer(), nullable=False),
+        sa.Column("source_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["sensor_id"],
+            ["sensor.id"],
+            name=op.f("report_dependency_sensor_id_sensor_fkey"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["source_id"],
+            ["data_source.id"],
+            name=op.f("report_dependency_source_id_data_source_fkey"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "sensor_id",
+            "source_id",
+            name=op.f("report_dependency_pkey"),
+        ),
+    )
+
+
+def downgrade():
+    op.drop_table("report_dependency")
@@ -0,0 +1,59 @@
+"""add sensor_latest_belief table
+
+Revision ID: c4a9e2f1d873
+Revises: b7e3d1a0c925
+Create Date: 2026-10-19 10:14:27.530941
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "c4a9e2f1d873"
+down_revision = "b7e3d1a0c925"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "sensor_latest_belief",
+        sa.Column("sensor_id", sa.Integer(), nullable=False),
+        sa.Column("source_id", sa.Integer(), nullable=False),
+        sa.Column("event_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("belief_horizon", sa.Interval(), nullable=False),
+        sa.Column("cumulative_probability", sa.Float(), nullable=False),
+        sa.Column("event_value", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["sensor_id"],
+            ["sensor.id"],
+            name=op.f("sensor_latest_belief_sensor_id_sensor_fkey"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["source_id"],
+            ["data_source.id"],
+            name=op.f("sensor_latest_belief_source_id_data_source_fkey"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "sensor_id",
+            "source_id",
+            name=op.f("sensor_latest_belief_pkey"),
+        ),
+    )
+
+    # Fill in the latest ex-post belief per sensor and source from the existing beliefs
+    op.execute("""
+        INSERT INTO sensor_latest_belief (sensor_id, source_id, event_start, belief_horizon, cumulative_probability, event_value)
+        SELECT DISTINCT ON (sensor_id, source_id)
+            sensor_id, source_id, event_start, belief_horizon, cumulative_probability, event_value
+        FROM timed_belief
+        WHERE belief_horizon <= interval '0'
+        ORDER BY sensor_id, source_id, event_start DESC, belief_horizon, abs(cumulative_probability - 0.5)
+        """)
+
+
+def downgrade():
+    op.drop_table("sensor_latest_belief")
@@ -17,5 +17,24 @@ naming_convention = {
 }
 
 
+# Data generators (forecasters, reporters and schedulers) shipped with FlexMeasures, by type and name.
+# Their modules are only imported when first used (see LazyClassRegistry), to keep startup light.
+data_generators = {
+    "forecaster": {
+        "TrainPredictPipeline": "flexmeasures.data.models.forecasting.pipelines.train_predict:TrainPredictPipeline",
+    },
+    "reporter": {
+        "AggregatorReporter": "flexmeasures.data.models.reporting.aggregator:AggregatorReporter",
+        "PandasReporter": "flexmeasures.data.models.reporting.pandas_reporter:PandasReporter",
+        "ProfitOrLossReporter": "flexmeasures.data.models.reporting.profit:ProfitOrLossReporter",
+    },
+    "scheduler": {
+        "MetaStorageScheduler": "flexmeasures.data.models.planning.storage:MetaStorageScheduler",
+        "ProcessScheduler": "flexmeasures.data.models.planning.process:ProcessScheduler",
+        "StorageScheduler": "flexmeasures.data.models.planning.storage:StorageScheduler",
+    },
+}
+
+
 class ModelException(Exception):
     pass
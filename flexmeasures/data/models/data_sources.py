@@ -126,15 +126,9 @@ class DataGenerator:
         :param kwargs:      Deserialized parameters (can be used as an alternative to the `parameters` kwarg).
         """
 
-        if self._parameters is None:
-            self._parameters = {}
-
-        if parameters is None:
-            self._parameters.update(self._parameters_schema.dump(kwargs))
-        else:
-            self._parameters.update(parameters)
-
-        self._parameters = self._parameters_schema.load(self._parameters)
+        self._parameters = self._parameters_schema.load(
+            self._collect_parameters(parameters, **kwargs)
+        )
 
         sig = inspect.signature(inspect.unwrap(self._compute))
         accepts_as_job = "as_job" in sig.parameters
@@ -147,6 +141,17 @@ class DataGenerator:
             results = self._assign_sensors_and_source(results)
         return results
 
+    def _collect_parameters(self, parameters: dict | None = None, **kwargs) -> dict:
+        """Update the (serialized) parameters with the given serialized `parameters` or deserialized `kwargs`."""
+        if self._parameters is None:
+            self._parameters = {}
+
+        if parameters is None:
+            self._parameters.update(self._parameters_schema.dump(kwargs))
+        else:
+            self._parameters.update(parameters)
+        return self._parameters
+
     def _assign_sensors_and_source(
         self, results: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
@@ -249,7 +254,12 @@ class DataGenerator:
             "resolution",
         ]
 
-        for _input in _parameters["input"]:
+        inputs = _parameters.get("input", []) + [
+            _input
+            for entry in _parameters.get("batch", [])
+            for _input in entry["input"]
+        ]
+        for _input in inputs:
             for field in fields_to_remove_input:
                 _input.pop(field, None)
 
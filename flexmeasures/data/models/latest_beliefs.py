@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from flexmeasures.data import db
+
+
+class SensorLatestBelief(db.Model):
+    """The most recent ex-post belief about the most recent event of a sensor, per data source.
+
+    This is what ``Sensor.latest_state`` searches for: of the beliefs formed after knowledge time,
+    the belief about the latest event, formed most recently, and (for probabilistic beliefs) the one closest to the median.
+    Keeping one row per sensor and source lets us look up the current state of many sensors in a single indexed query.
+
+    Rows are maintained by ``save_to_db``, refreshed after deleting beliefs,
+    and can be rebuilt with ``refresh_latest_beliefs`` (see ``flexmeasures.data.services.latest_beliefs``).
+    """
+
+    __tablename__ = "sensor_latest_belief"
+
+    sensor_id = db.Column(
+        db.Integer, db.ForeignKey("sensor.id", ondelete="CASCADE"), primary_key=True
+    )
+    source_id = db.Column(
+        db.Integer,
+        db.ForeignKey("data_source.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    event_start = db.Column(db.DateTime(timezone=True), nullable=False)
+    belief_horizon = db.Column(db.Interval(), nullable=False)
+    cumulative_probability = db.Column(db.Float, nullable=False)
+    event_value = db.Column(db.Float, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<SensorLatestBelief sensor={self.sensor_id} source={self.source_id} {self.event_start}: {self.event_value}>"
@@ -90,6 +90,12 @@ class Scheduler:
 
     fallback_scheduler_class: "Type[Scheduler] | None" = None
     info: dict | None = None
+    #: Wall-clock seconds spent per computation stage (e.g. "prepare", "build", "solve"),
+    #: recorded during compute() by schedulers that support it.
+    timings: dict | None = None
+    #: Size of the optimization problem (e.g. "devices", "timesteps", "rows", "cols" and "nnz"),
+    #: recorded during compute() by schedulers that support it.
+    problem_size: dict | None = None
 
     config_deserialized = False  # This flag allows you to let the scheduler skip checking config, like timing, flex_model and flex_context
 
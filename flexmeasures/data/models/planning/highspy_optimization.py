@@ -26,6 +26,9 @@ Deviations from the Pyomo implementation (all verified against the behavior of t
 
 from __future__ import annotations
 
+import time
+from dataclasses import dataclass
+
 import numpy as np
 import pandas as pd
 
@@ -35,6 +38,7 @@ from flexmeasures.data.models.planning import (
     StockCommitment,
 )
 from flexmeasures.data.models.planning.scheduling_problem import (
+    SchedulingProblem,
     aggregate_commodity_costs,
     aggregate_subcommitment_costs,
     planned_power_per_device,
@@ -105,6 +109,9 @@ class HighspyModel:
     - ``d`` and ``j``: the device and datetime index ranges
     - ``ems_power``, ``device_power_up``, ``device_power_down``, ``device_power_sign``:
       indexed variable views supporting ``var[d, j].value`` and ``var.extract_values()``
+    - ``timings``: wall-clock seconds spent building (``build``) and solving (``solve``) the model
+    - ``problem_size``: the number of constraint rows (``rows``), variable columns (``cols``)
+      and non-zero coefficients (``nnz``) of the model
     """
 
     def __init__(self):
@@ -117,6 +124,8 @@ class HighspyModel:
         self.device_power_up = _IndexedVarView({})
         self.device_power_down = _IndexedVarView({})
         self.device_power_sign = _IndexedVarView({})
+        self.timings: dict[str, float] = {}
+        self.problem_size: dict[str, int] = {}
 
 
 def _column(df: pd.DataFrame, name: str) -> np.ndarray:
@@ -201,18 +210,135 @@ class _RowBuilder:
         )
 
     def build(self):
+        """Return the row bounds and the CSR arrays (row starts, column indices and values)."""
         if not self._lower:
-            return 0, None, None, 0, None, None, None
+            return (
+                np.empty(0),
+                np.empty(0),
+                np.empty(0, dtype=np.int32),
+                np.empty(0, dtype=np.int32),
+                np.empty(0),
+            )
         lower = np.concatenate(self._lower)
         upper = np.concatenate(self._upper)
         counts = np.concatenate(self._counts)
         index = np.concatenate(self._index).astype(np.int32)
         value = np.concatenate(self._value)
         starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int32)
-        return len(counts), lower, upper, len(index), starts, index, value
+        return lower, upper, starts, index, value
+
+
+@dataclass
+class ScheduleMatrix:
+    """The scheduling problem in matrix form, as built by :func:`build_schedule_matrix`.
+
+    Columns (variables) come with bounds, objective costs and integrality;
+    constraint rows come with bounds and a CSR-encoded coefficient matrix (as taken by HiGHS' ``addRows``).
+    Any solver interface that accepts a matrix can solve it:
+    :func:`device_scheduler_highspy` hands it to HiGHS directly,
+    and :mod:`flexmeasures.data.models.planning.matrix_optimization` to a Pyomo solver.
+    """
+
+    problem: SchedulingProblem
+
+    #: Number of devices and time steps
+    D: int
+    T: int
+
+    #: First column of each (device, time step) block of variables, and of the commitment deviations
+    col_ems: int
+    col_down: int
+    col_up: int
+    col_sign: int
+    col_cdown: int
+    col_cup: int
+
+    col_lower: np.ndarray
+    col_upper: np.ndarray
+    col_cost: np.ndarray
+    #: Columns of the binary variables
+    integer_cols: np.ndarray
+
+    row_lower: np.ndarray
+    row_upper: np.ndarray
+    row_starts: np.ndarray
+    row_index: np.ndarray
+    row_value: np.ndarray
+
+    #: Deviation prices per sub-commitment
+    down_price: np.ndarray
+    up_price: np.ndarray
+
+    @property
+    def n_cols(self) -> int:
+        return len(self.col_lower)
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.row_lower)
 
+    @property
+    def nnz(self) -> int:
+        return len(self.row_index)
 
-def device_scheduler_highspy(  # noqa C901
+    def extract_results(
+        self, col_value: np.ndarray, model
+    ) -> tuple[list[pd.Series], float]:
+        """Turn solved column values into schedules and costs, mirroring the Pyomo path's return contract.
+
+        Also sets the costs and variable views on the given model shim (see :class:`HighspyModel`).
+
+        :returns: the planned power per device, and the planned costs
+        """
+        D, T, C = self.D, self.T, len(self.down_price)
+        nd = D * T
+        ems_values = col_value[self.col_ems : self.col_ems + nd].reshape(D, T)
+        down_values = col_value[self.col_down : self.col_down + nd].reshape(D, T)
+        up_values = col_value[self.col_up : self.col_up + nd].reshape(D, T)
+        sign_values = col_value[self.col_sign : self.col_sign + nd].reshape(D, T)
+        cdown_values = col_value[self.col_cdown : self.col_cdown + C]
+        cup_values = col_value[self.col_cup : self.col_cup + C]
+
+        # Sum the planned costs in the same (subcommitment) order as the Pyomo path
+        subcommitment_costs = {
+            c: float(cdown_values[c]) * self.down_price[c]
+            + float(cup_values[c]) * self.up_price[c]
+            for c in range(C)
+        }
+        planned_costs = 0
+        for c in range(C):
+            planned_costs += subcommitment_costs[c]
+
+        problem = self.problem
+        planned_power = planned_power_per_device(
+            ems_values, problem.start, problem.end, problem.resolution
+        )
+
+        model.commitment_costs = aggregate_subcommitment_costs(
+            subcommitment_costs, problem.commitment_mapping
+        )
+        model.commodity_costs = aggregate_commodity_costs(
+            problem.commitments, subcommitment_costs
+        )
+        model.costs = planned_costs
+        model.d = range(D)
+        model.j = range(T)
+        model.ems_power = _IndexedVarView(
+            {(d, j): float(ems_values[d, j]) for d in range(D) for j in range(T)}
+        )
+        model.device_power_up = _IndexedVarView(
+            {(d, j): float(up_values[d, j]) for d in range(D) for j in range(T)}
+        )
+        model.device_power_down = _IndexedVarView(
+            {(d, j): float(down_values[d, j]) for d in range(D) for j in range(T)}
+        )
+        model.device_power_sign = _IndexedVarView(
+            {(d, j): float(sign_values[d, j]) for d in range(D) for j in range(T)}
+        )
+        return planned_power, planned_costs
+
+
+def build_schedule_matrix(  # noqa C901
     device_constraints: list[pd.DataFrame],
     ems_constraints: pd.DataFrame | list[pd.DataFrame],
     commitment_quantities: list[pd.Series] | None = None,
@@ -225,25 +351,13 @@ def device_scheduler_highspy(  # noqa C901
     device_power_bands: list[list[tuple[float, float]] | None] | None = None,
     coupling_groups: dict[str, list[tuple[int, float]]] | None = None,
     balance_groups: dict[str, list[int]] | None = None,
-) -> tuple[list[pd.Series], float, HighspySolverResults, HighspyModel]:
-    """Direct HiGHS implementation of ``device_scheduler``.
+) -> ScheduleMatrix:
+    """Build the model of ``device_scheduler`` in matrix form.
 
-    Same inputs and same return contract as
+    Takes the same inputs as
     :func:`flexmeasures.data.models.planning.linear_optimization.device_scheduler`,
-    which also documents the semantics of all arguments; the third and fourth
-    returned objects are lightweight shims rather than Pyomo objects (see
-    :class:`HighspySolverResults` and :class:`HighspyModel`).
+    which also documents their semantics, and requires at least one device.
     """
-    import highspy
-
-    model = HighspyModel()
-
-    # If the EMS has no devices, don't bother
-    # (mirrors the Pyomo path returning an empty SolverResults, whose
-    # termination condition is "unknown" and status "ok")
-    if len(device_constraints) == 0:
-        return [], 0, HighspySolverResults("unknown", "ok"), model
-
     problem = prepare_scheduling_problem(
         device_constraints=device_constraints,
         ems_constraints=ems_constraints,
@@ -261,14 +375,12 @@ def device_scheduler_highspy(  # noqa C901
 
     # Local aliases, so that the model below reads as it did before the (solver-agnostic)
     # input handling moved to the scheduling_problem module.
-    start, end, resolution = problem.start, problem.end, problem.resolution
     device_constraints = problem.device_constraints
     ems_constraints_list = problem.ems_constraints_list
     ems_constraint_device_groups = problem.ems_constraint_device_groups
     device_to_group = problem.device_to_group
     group_to_devices = problem.group_to_devices
     commitments = problem.commitments
-    commitment_mapping = problem.commitment_mapping
     device_group_lookup = problem.device_group_lookup
     convex_cost_curve = problem.convex_cost_curve
     Md, Mc = problem.Md, problem.Mc
@@ -669,21 +781,98 @@ def device_scheduler_highspy(  # noqa C901
             np.zeros(T), np.zeros(T), idx, np.ones_like(idx, dtype=float)
         )
 
-    # ---------------------------------------------------------------
-    # Build and solve the HiGHS model
-    # ---------------------------------------------------------------
-    h = highspy.Highs()
-
-    h.addVars(ncol, lower, upper)
-    h.changeColsCost(ncol, np.arange(ncol, dtype=np.int32), cost)
-
     # Binary variables: device signs (only where their constraints exist), commitment signs (if any) and bands
     integer_cols = [(col_sign + ks).astype(np.int32)]
     if col_csign is not None:
         integer_cols.append(np.arange(col_csign, col_csign + C, dtype=np.int32))
     if band_pairs:
         integer_cols.append(np.arange(col_band, ncol, dtype=np.int32))
-    integer_cols = np.concatenate(integer_cols)
+
+    row_lower, row_upper, row_starts, row_index, row_value = rows.build()
+    return ScheduleMatrix(
+        problem=problem,
+        D=D,
+        T=T,
+        col_ems=col_ems,
+        col_down=col_down,
+        col_up=col_up,
+        col_sign=col_sign,
+        col_cdown=col_cdown,
+        col_cup=col_cup,
+        col_lower=lower,
+        col_upper=upper,
+        col_cost=cost,
+        integer_cols=np.concatenate(integer_cols),
+        row_lower=row_lower,
+        row_upper=row_upper,
+        row_starts=row_starts,
+        row_index=row_index,
+        row_value=row_value,
+        down_price=down_price,
+        up_price=up_price,
+    )
+
+
+def device_scheduler_highspy(
+    device_constraints: list[pd.DataFrame],
+    ems_constraints: pd.DataFrame | list[pd.DataFrame],
+    commitment_quantities: list[pd.Series] | None = None,
+    commitment_downwards_deviation_price: list[pd.Series] | list[float] | None = None,
+    commitment_upwards_deviation_price: list[pd.Series] | list[float] | None = None,
+    commitments: list[pd.DataFrame] | list[Commitment] | None = None,
+    initial_stock: float | list[float] = 0,
+    stock_groups: dict[int, list[int]] | None = None,
+    ems_constraint_groups: list[list[int]] | None = None,
+    device_power_bands: list[list[tuple[float, float]] | None] | None = None,
+    coupling_groups: dict[str, list[tuple[int, float]]] | None = None,
+    balance_groups: dict[str, list[int]] | None = None,
+) -> tuple[list[pd.Series], float, HighspySolverResults, HighspyModel]:
+    """Direct HiGHS implementation of ``device_scheduler``.
+
+    Same inputs and same return contract as
+    :func:`flexmeasures.data.models.planning.linear_optimization.device_scheduler`,
+    which also documents the semantics of all arguments; the third and fourth
+    returned objects are lightweight shims rather than Pyomo objects (see
+    :class:`HighspySolverResults` and :class:`HighspyModel`).
+    """
+    import highspy
+
+    build_start = time.perf_counter()
+    model = HighspyModel()
+
+    # If the EMS has no devices, don't bother
+    # (mirrors the Pyomo path returning an empty SolverResults, whose
+    # termination condition is "unknown" and status "ok")
+    if len(device_constraints) == 0:
+        model.timings = dict(build=time.perf_counter() - build_start, solve=0.0)
+        return [], 0, HighspySolverResults("unknown", "ok"), model
+
+    matrix = build_schedule_matrix(
+        device_constraints=device_constraints,
+        ems_constraints=ems_constraints,
+        commitment_quantities=commitment_quantities,
+        commitment_downwards_deviation_price=commitment_downwards_deviation_price,
+        commitment_upwards_deviation_price=commitment_upwards_deviation_price,
+        commitments=commitments,
+        initial_stock=initial_stock,
+        stock_groups=stock_groups,
+        ems_constraint_groups=ems_constraint_groups,
+        device_power_bands=device_power_bands,
+        coupling_groups=coupling_groups,
+        balance_groups=balance_groups,
+    )
+    model.problem_size = dict(rows=matrix.n_rows, cols=matrix.n_cols, nnz=matrix.nnz)
+
+    # ---------------------------------------------------------------
+    # Build and solve the HiGHS model
+    # ---------------------------------------------------------------
+    h = highspy.Highs()
+
+    ncol = matrix.n_cols
+    h.addVars(ncol, matrix.col_lower, matrix.col_upper)
+    h.changeColsCost(ncol, np.arange(ncol, dtype=np.int32), matrix.col_cost)
+
+    integer_cols = matrix.integer_cols
     if len(integer_cols) > 0:
         h.changeColsIntegrality(
             len(integer_cols),
@@ -693,15 +882,23 @@ def device_scheduler_highspy(  # noqa C901
             ),
         )
 
-    nrow, row_lower, row_upper, nnz, row_starts, a_index, a_value = rows.build()
-    if nrow > 0:
-        h.addRows(nrow, row_lower, row_upper, nnz, row_starts, a_index, a_value)
+    if matrix.n_rows > 0:
+        h.addRows(
+            matrix.n_rows,
+            matrix.row_lower,
+            matrix.row_upper,
+            matrix.nnz,
+            matrix.row_starts,
+            matrix.row_index,
+            matrix.row_value,
+        )
 
     # The same options the Pyomo path applies for HiGHS solvers ("highspy" matches on "highs"),
     # so the two backends cannot disagree on tolerances.
     for option_name, option_value in solver_options("highspy").items():
         h.setOptionValue(option_name, option_value)
 
+    solve_start = time.perf_counter()
     h.run()
 
     status = h.getModelStatus()
@@ -725,46 +922,10 @@ def device_scheduler_highspy(  # noqa C901
         # Mirror the Pyomo path: when no feasible solution was found, the
         # variables keep their initial values (all zeros).
         col_value = np.zeros(ncol)
-
-    # ---------------------------------------------------------------
-    # Extract results (mirroring the Pyomo path's return contract)
-    # ---------------------------------------------------------------
-    ems_values = col_value[col_ems : col_ems + nd].reshape(D, T)
-    down_values = col_value[col_down : col_down + nd].reshape(D, T)
-    up_values = col_value[col_up : col_up + nd].reshape(D, T)
-    sign_values = col_value[col_sign : col_sign + nd].reshape(D, T)
-    cdown_values = col_value[col_cdown : col_cdown + C]
-    cup_values = col_value[col_cup : col_cup + C]
-
-    # Sum the planned costs in the same (subcommitment) order as the Pyomo path
-    subcommitment_costs = {
-        c: float(cdown_values[c]) * down_price[c] + float(cup_values[c]) * up_price[c]
-        for c in range(C)
-    }
-    planned_costs = 0
-    for c in range(C):
-        planned_costs += subcommitment_costs[c]
-
-    planned_power = planned_power_per_device(ems_values, start, end, resolution)
-
-    model.commitment_costs = aggregate_subcommitment_costs(
-        subcommitment_costs, commitment_mapping
-    )
-    model.commodity_costs = aggregate_commodity_costs(commitments, subcommitment_costs)
-    model.costs = planned_costs
-    model.d = range(D)
-    model.j = range(T)
-    model.ems_power = _IndexedVarView(
-        {(d, j): float(ems_values[d, j]) for d in range(D) for j in range(T)}
-    )
-    model.device_power_up = _IndexedVarView(
-        {(d, j): float(up_values[d, j]) for d in range(D) for j in range(T)}
-    )
-    model.device_power_down = _IndexedVarView(
-        {(d, j): float(down_values[d, j]) for d in range(D) for j in range(T)}
-    )
-    model.device_power_sign = _IndexedVarView(
-        {(d, j): float(sign_values[d, j]) for d in range(D) for j in range(T)}
+    model.timings = dict(
+        build=solve_start - build_start,
+        solve=time.perf_counter() - solve_start,
     )
 
+    planned_power, planned_costs = matrix.extract_results(col_value, model)
     return planned_power, planned_costs, results, model
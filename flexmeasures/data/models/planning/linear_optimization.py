@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import inspect
+import time
 from functools import lru_cache
 
 from flask import current_app
@@ -124,6 +125,25 @@ def _arguments_for_highspy_backend(passed_arguments: dict) -> dict:
     }
 
 
+def get_pyomo_solver(solver_name: str):
+    """Create the Pyomo interface to the given solver, with our solver options applied."""
+    solver = SolverFactory(solver_name)
+
+    # Temporary fix for https://github.com/Pyomo/pyomo/issues/3841
+    if solver_name == "cbc":
+        import shutil
+
+        cbc_path = shutil.which("cbc") or shutil.which("Cbc")
+        if cbc_path is not None:
+            solver.set_executable(cbc_path)
+
+    # Tight tolerances for HiGHS, then operator-configured options last
+    # (shared with the direct HiGHS backend, so both apply the same settings).
+    for option_name, option_value in solver_options(solver_name).items():
+        solver.options[option_name] = option_value
+    return solver
+
+
 def device_scheduler(  # noqa C901
     device_constraints: list[pd.DataFrame],
     ems_constraints: pd.DataFrame | list[pd.DataFrame],
@@ -208,6 +228,12 @@ def device_scheduler(  # noqa C901
         commitment_upwards_deviation_price: penalty for upwards deviations of the flow
 
     Separate costs for each commitment are stored in a dictionary under `model.commitment_costs` (indexed by commitment).
+    Wall-clock timings (in seconds) of building and solving the model are stored under `model.timings`,
+    and the number of constraints ("rows") and variables ("cols") under `model.problem_size`
+    (the matrix-based backends also count the non-zero coefficients, as "nnz").
+    Note that Pyomo translates the model into the solver's own form within `solver.solve()`,
+    so for Pyomo-based solvers, the "solve" timing includes that translation
+    (the direct HiGHS backend builds its solver model before solving, and counts it as "build").
 
     All Series and DataFrames should have the same resolution.
 
@@ -230,10 +256,24 @@ def device_scheduler(  # noqa C901
 
         return device_scheduler_highspy(**highspy_arguments)
 
+    # Pyomo-based solvers can also be handed the matrix that the direct HiGHS backend builds,
+    # instead of the rule-based model built below (which takes longer to construct than to solve).
+    # See the matrix_optimization module.
+    if current_app.config.get("FLEXMEASURES_LP_MODEL_BUILDER") == "matrix":
+        matrix_arguments = _arguments_for_highspy_backend(locals())
+
+        from flexmeasures.data.models.planning.matrix_optimization import (
+            device_scheduler_pyomo_matrix,
+        )
+
+        return device_scheduler_pyomo_matrix(**matrix_arguments)
+
+    build_start = time.perf_counter()
     model = ConcreteModel()
 
     # If the EMS has no devices, don't bother
     if len(device_constraints) == 0:
+        model.timings = dict(build=time.perf_counter() - build_start, solve=0.0)
         return [], 0, SolverResults(), model
 
     problem = prepare_scheduling_problem(
@@ -786,24 +826,12 @@ def device_scheduler(  # noqa C901
         return costs
 
     model.costs = Objective(rule=cost_function, sense=minimize)
+    model.problem_size = dict(rows=model.nconstraints(), cols=model.nvariables())
 
     # Solve
-    solver_name = current_app.config.get("FLEXMEASURES_LP_SOLVER")
+    solver = get_pyomo_solver(current_app.config.get("FLEXMEASURES_LP_SOLVER"))
 
-    solver = SolverFactory(solver_name)
-
-    # Temporary fix for https://github.com/Pyomo/pyomo/issues/3841
-    if solver_name == "cbc":
-        import shutil
-
-        cbc_path = shutil.which("cbc") or shutil.which("Cbc")
-        if cbc_path is not None:
-            solver.set_executable(cbc_path)
-
-    # Tight tolerances for HiGHS, then operator-configured options last
-    # (shared with the direct HiGHS backend, so both apply the same settings).
-    for option_name, option_value in solver_options(solver_name).items():
-        solver.options[option_name] = option_value
+    solve_start = time.perf_counter()
 
     # load_solutions=False to avoid a RuntimeError exception in appsi solvers when solving an infeasible problem.
     results = solver.solve(model, load_solutions=False)
@@ -811,6 +839,10 @@ def device_scheduler(  # noqa C901
     # load the results only if a feasible solution has been found
     if len(results.solution) > 0:
         model.solutions.load_from(results)
+    model.timings = dict(
+        build=solve_start - build_start,
+        solve=time.perf_counter() - solve_start,
+    )
 
     planned_costs = value(model.costs)
     subcommitment_costs = {g: value(cost) for g, cost in model.commitment_costs.items()}
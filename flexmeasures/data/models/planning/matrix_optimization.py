@@ -0,0 +1,167 @@
+"""Pyomo model built from the matrix form of the scheduling problem.
+
+The Pyomo model in :func:`flexmeasures.data.models.planning.linear_optimization.device_scheduler`
+is declared through dozens of rules, called per device and time step, which index into pandas frames element by element.
+For the solvers that still go through Pyomo (e.g. ``cbc``, ``glpk`` or ``appsi_highs``),
+constructing that model can take longer than solving it.
+
+This module offers an alternative model builder for those solvers,
+selected by setting ``FLEXMEASURES_LP_MODEL_BUILDER`` to ``"matrix"``.
+It takes the matrix that :func:`flexmeasures.data.models.planning.highspy_optimization.build_schedule_matrix`
+builds with vectorized NumPy operations for the direct HiGHS backend,
+and declares it to Pyomo as a single indexed variable (one entry per matrix column)
+and a single indexed constraint (one linear expression per matrix row).
+
+This is not a third model to keep in sync: the mathematical model is the one of the direct HiGHS backend,
+and only its hand-off to the solver differs.
+The equivalence tests in ``tests/test_matrix_equivalence.py`` compare it with the rule-based Pyomo model.
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pandas as pd
+from flask import current_app
+from pyomo.core import (
+    Binary,
+    ConcreteModel,
+    Constraint,
+    Objective,
+    Var,
+    minimize,
+)
+from pyomo.core.expr.numeric_expr import LinearExpression
+from pyomo.opt import SolverResults
+
+from flexmeasures.data.models.planning import Commitment
+from flexmeasures.data.models.planning.highspy_optimization import (
+    HighspyModel,
+    ScheduleMatrix,
+    build_schedule_matrix,
+)
+from flexmeasures.data.models.planning.linear_optimization import get_pyomo_solver
+
+
+def _bound(value: float) -> float | None:
+    """Pyomo denotes a missing bound by None rather than by an infinite value."""
+    return None if np.isinf(value) else float(value)
+
+
+def build_pyomo_model(matrix: ScheduleMatrix) -> ConcreteModel:
+    """Declare the scheduling matrix as a Pyomo model.
+
+    The model has one indexed variable ``x`` (one entry per matrix column),
+    one indexed constraint ``rows`` (one entry per matrix row) and the objective ``costs``.
+    """
+    model = ConcreteModel()
+
+    col_lower = [_bound(v) for v in matrix.col_lower]
+    col_upper = [_bound(v) for v in matrix.col_upper]
+    model.x = Var(
+        range(matrix.n_cols), bounds=lambda m, i: (col_lower[i], col_upper[i])
+    )
+    for i in matrix.integer_cols.tolist():
+        model.x[i].domain = Binary
+
+    # Split the CSR arrays into the coefficients and variables of each row
+    x = model.x
+    row_coefficients = np.split(matrix.row_value, matrix.row_starts[1:])
+    row_columns = np.split(matrix.row_index, matrix.row_starts[1:])
+    row_lower = matrix.row_lower.tolist()
+    row_upper = matrix.row_upper.tolist()
+
+    def row_rule(m, r):
+        expression = LinearExpression(
+            constant=0,
+            linear_coefs=row_coefficients[r].tolist(),
+            linear_vars=[x[i] for i in row_columns[r].tolist()],
+        )
+        if row_lower[r] == row_upper[r]:
+            return expression == row_lower[r]
+        return (_bound(row_lower[r]), expression, _bound(row_upper[r]))
+
+    model.rows = Constraint(range(matrix.n_rows), rule=row_rule)
+
+    cost_columns = np.flatnonzero(matrix.col_cost).tolist()
+    model.costs = Objective(
+        expr=LinearExpression(
+            constant=0,
+            linear_coefs=matrix.col_cost[cost_columns].tolist(),
+            linear_vars=[x[i] for i in cost_columns],
+        ),
+        sense=minimize,
+    )
+    return model
+
+
+def device_scheduler_pyomo_matrix(
+    device_constraints: list[pd.DataFrame],
+    ems_constraints: pd.DataFrame | list[pd.DataFrame],
+    commitment_quantities: list[pd.Series] | None = None,
+    commitment_downwards_deviation_price: list[pd.Series] | list[float] | None = None,
+    commitment_upwards_deviation_price: list[pd.Series] | list[float] | None = None,
+    commitments: list[pd.DataFrame] | list[Commitment] | None = None,
+    initial_stock: float | list[float] = 0,
+    stock_groups: dict[int, list[int]] | None = None,
+    ems_constraint_groups: list[list[int]] | None = None,
+    device_power_bands: list[list[tuple[float, float]] | None] | None = None,
+    coupling_groups: dict[str, list[tuple[int, float]]] | None = None,
+    balance_groups: dict[str, list[int]] | None = None,
+) -> tuple[list[pd.Series], float, SolverResults, HighspyModel]:
+    """Matrix-based Pyomo implementation of ``device_scheduler``, solving with the configured Pyomo solver.
+
+    Same inputs and same return contract as
+    :func:`flexmeasures.data.models.planning.linear_optimization.device_scheduler`,
+    which also documents the semantics of all arguments.
+    The solver results are Pyomo's own, while the returned model is a lightweight shim
+    (see :class:`flexmeasures.data.models.planning.highspy_optimization.HighspyModel`).
+    """
+    build_start = time.perf_counter()
+    model = HighspyModel()
+
+    # If the EMS has no devices, don't bother
+    if len(device_constraints) == 0:
+        model.timings = dict(build=time.perf_counter() - build_start, solve=0.0)
+        return [], 0, SolverResults(), model
+
+    matrix = build_schedule_matrix(
+        device_constraints=device_constraints,
+        ems_constraints=ems_constraints,
+        commitment_quantities=commitment_quantities,
+        commitment_downwards_deviation_price=commitment_downwards_deviation_price,
+        commitment_upwards_deviation_price=commitment_upwards_deviation_price,
+        commitments=commitments,
+        initial_stock=initial_stock,
+        stock_groups=stock_groups,
+        ems_constraint_groups=ems_constraint_groups,
+        device_power_bands=device_power_bands,
+        coupling_groups=coupling_groups,
+        balance_groups=balance_groups,
+    )
+    model.problem_size = dict(rows=matrix.n_rows, cols=matrix.n_cols, nnz=matrix.nnz)
+    pyomo_model = build_pyomo_model(matrix)
+    solver = get_pyomo_solver(current_app.config.get("FLEXMEASURES_LP_SOLVER"))
+
+    solve_start = time.perf_counter()
+
+    # load_solutions=False to avoid a RuntimeError exception in appsi solvers when solving an infeasible problem.
+    results = solver.solve(pyomo_model, load_solutions=False)
+
+    # load the results only if a feasible solution has been found
+    if len(results.solution) > 0:
+        pyomo_model.solutions.load_from(results)
+    model.timings = dict(
+        build=solve_start - build_start,
+        solve=time.perf_counter() - solve_start,
+    )
+
+    # Variables without a value (no feasible solution was found) count as zero, like on the direct HiGHS backend
+    col_value = np.array(
+        [pyomo_model.x[i].value for i in range(matrix.n_cols)], dtype=float
+    )
+    col_value = np.nan_to_num(col_value, nan=0.0)
+
+    planned_power, planned_costs = matrix.extract_results(col_value, model)
+    return planned_power, planned_costs, results, model
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 import copy
+import time
 from datetime import datetime, timedelta
 
 import pandas as pd
@@ -54,7 +55,10 @@ from flexmeasures.data.schemas.scheduling.utils import (
     should_project_off_tick_soc_constraints,
 )
 from flexmeasures.data.schemas.sensors import SensorReference, VariableQuantityField
-from flexmeasures.data.services.scheduling_result import SchedulingJobResult
+from flexmeasures.data.services.scheduling_result import (
+    SCHEDULING_RESULT_KEY,
+    SchedulingJobResult,
+)
 from flexmeasures.utils.calculations import (
     integrate_time_series,
 )
@@ -65,11 +69,6 @@ from flexmeasures.utils.unit_utils import ur, convert_units, units_are_convertib
 storage_asset_types = ["one-way_evse", "two-way_evse", "battery", "heat-storage"]
 
 
-#: Key used to store and retrieve the ``SchedulingJobResult`` in RQ job metadata
-#: and in the multi-result list returned by ``StorageScheduler.compute()``.
-SCHEDULING_RESULT_KEY = "scheduling_result"
-
-
 class MetaStorageScheduler(Scheduler):
     """This class defines the constraints of a schedule for a storage device from the
     flex-model, flex-context, and sensor and asset attributes"""
@@ -3419,7 +3418,18 @@ class StorageScheduler(MetaStorageScheduler):
             )
         return group_output_schedules
 
-    def compute(self, skip_validation: bool = False) -> SchedulerOutputType:
+    @staticmethod
+    def _problem_size(device_constraints: list[pd.DataFrame], model) -> dict:
+        """Count the devices and timesteps, plus what the solver backend counted (e.g. rows, cols and nnz)."""
+        return dict(
+            devices=len(device_constraints),
+            timesteps=len(device_constraints[0]) if device_constraints else 0,
+            **getattr(model, "problem_size", {}),
+        )
+
+    def compute(  # noqa: C901
+        self, skip_validation: bool = False
+    ) -> SchedulerOutputType:
         """Schedule a battery or Charge Point based directly on the latest beliefs regarding market prices within the specified time window.
         For the resulting consumption schedule, consumption is defined as positive values.
 
@@ -3427,6 +3437,10 @@ class StorageScheduler(MetaStorageScheduler):
         :returns:               The computed schedule.
         """
 
+        deserialize_start = time.perf_counter()
+        if not self.config_deserialized:
+            self.deserialize_config()
+        prepare_start = time.perf_counter()
         (
             sensors,
             start,
@@ -3437,6 +3451,10 @@ class StorageScheduler(MetaStorageScheduler):
             ems_constraints,
             commitments,
         ) = self._prepare(skip_validation=skip_validation)
+        self.timings = dict(
+            deserialize=prepare_start - deserialize_start,
+            prepare=time.perf_counter() - prepare_start,
+        )
 
         initial_stock = [0] * len(soc_at_start)
 
@@ -3462,8 +3480,11 @@ class StorageScheduler(MetaStorageScheduler):
                 dc.attrs.get("operation_modes") for dc in device_constraints
             ],
         )
+        self.timings.update(getattr(model, "timings", {}))
+        self.problem_size = self._problem_size(device_constraints, model)
         if "infeasible" in (tc := scheduler_results.solver.termination_condition):
             raise InfeasibleProblemException(tc)
+        postprocess_start = time.perf_counter()
 
         # Obtain the storage schedule from all device schedules within the EMS
         storage_schedule = dict()
@@ -3651,14 +3672,17 @@ class StorageScheduler(MetaStorageScheduler):
                     ),
                 }
             ]
-            return self._deduplicate_outputs(
+            outputs = self._deduplicate_outputs(
                 storage_schedules
                 + commitment_costs
                 + soc_schedules
                 + consumption_production_schedules
                 + scheduling_result
             )
+            self.timings["postprocess"] = time.perf_counter() - postprocess_start
+            return outputs
         else:
+            self.timings["postprocess"] = time.perf_counter() - postprocess_start
             return storage_schedule[sensors[0]]
 
     @staticmethod
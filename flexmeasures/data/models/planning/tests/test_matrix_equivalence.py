@@ -0,0 +1,106 @@
+"""Equivalence tests for the matrix-based Pyomo model builder.
+
+Each scenario of ``test_highspy_equivalence.py`` is run through ``device_scheduler`` with the same Pyomo solver twice:
+once with the rule-based model (``FLEXMEASURES_LP_MODEL_BUILDER = "rules"``)
+and once with the model declared from the scheduling matrix (``"matrix"``),
+and the resulting schedules, costs and termination handling are compared.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from flexmeasures.data.models.planning.highspy_optimization import (
+    build_schedule_matrix,
+)
+from flexmeasures.data.models.planning.matrix_optimization import build_pyomo_model
+from flexmeasures.data.models.planning.tests.test_highspy_equivalence import (
+    run_with_solver,
+    scenario_battery_with_prices,
+    scenario_battery_with_site_capacity_and_breach_prices,
+    scenario_battery_with_soc_targets,
+    scenario_chp_coupling_groups,
+    scenario_ems_level_commodity_commitment,
+    scenario_ems_level_flow_commitment,
+    scenario_infeasible,
+    scenario_internal_commodity_balance,
+    scenario_one_way_consumer,
+    scenario_two_devices_with_stock_commitment,
+)
+
+
+def run_with_model_builder(app, builder: str, make_scenario, solver="appsi_highs"):
+    """Run a freshly built scenario with the given model builder configured."""
+    original_builder = app.config["FLEXMEASURES_LP_MODEL_BUILDER"]
+    app.config["FLEXMEASURES_LP_MODEL_BUILDER"] = builder
+    try:
+        return run_with_solver(app, solver, make_scenario)
+    finally:
+        app.config["FLEXMEASURES_LP_MODEL_BUILDER"] = original_builder
+
+
+@pytest.mark.parametrize(
+    "make_scenario",
+    [
+        scenario_battery_with_prices,
+        scenario_battery_with_soc_targets,
+        scenario_battery_with_site_capacity_and_breach_prices,
+        scenario_two_devices_with_stock_commitment,
+        scenario_one_way_consumer,
+        scenario_ems_level_flow_commitment,
+        scenario_ems_level_commodity_commitment,
+        scenario_chp_coupling_groups,
+        scenario_internal_commodity_balance,
+    ],
+    ids=lambda f: f.__name__.replace("scenario_", ""),
+)
+def test_matrix_builder_matches_rule_builder(app, make_scenario):
+    """The matrix-based Pyomo model should produce the same schedules and costs as the rule-based one."""
+    schedule_r, costs_r, results_r, model_r = run_with_model_builder(
+        app, "rules", make_scenario
+    )
+    schedule_m, costs_m, results_m, model_m = run_with_model_builder(
+        app, "matrix", make_scenario
+    )
+
+    assert results_r.solver.termination_condition == "optimal"
+    assert results_m.solver.termination_condition == "optimal"
+
+    # Same schedule for every device
+    assert len(schedule_r) == len(schedule_m)
+    for d in range(len(schedule_r)):
+        assert schedule_r[d].index.equals(schedule_m[d].index)
+        np.testing.assert_allclose(
+            schedule_r[d].values, schedule_m[d].values, atol=1e-5
+        )
+
+    # Same total costs and same per-commitment costs
+    assert costs_m == pytest.approx(costs_r, abs=1e-5)
+    assert set(model_r.commitment_costs.keys()) == set(model_m.commitment_costs.keys())
+    for c in model_r.commitment_costs:
+        assert model_m.commitment_costs[c] == pytest.approx(
+            model_r.commitment_costs[c], abs=1e-5
+        )
+
+
+def test_matrix_builder_matches_rule_builder_when_infeasible(app):
+    """Both model builders should report an infeasible problem the same way."""
+    _, costs_r, results_r, _ = run_with_model_builder(app, "rules", scenario_infeasible)
+    _, costs_m, results_m, _ = run_with_model_builder(
+        app, "matrix", scenario_infeasible
+    )
+
+    assert "infeasible" in results_r.solver.termination_condition
+    assert "infeasible" in results_m.solver.termination_condition
+    assert costs_r == costs_m == 0
+
+
+def test_pyomo_model_mirrors_matrix(app):
+    """The Pyomo model declares one variable per matrix column and one constraint per matrix row."""
+    matrix = build_schedule_matrix(**scenario_two_devices_with_stock_commitment())
+    model = build_pyomo_model(matrix)
+
+    assert len(model.x) == matrix.n_cols
+    assert len(model.rows) == matrix.n_rows
+    assert sum(v.is_binary() for v in model.x.values()) == len(matrix.integer_cols)
@@ -4830,3 +4830,78 @@ def test_battery_solver_inflexible_sign_flip(
     )
     assert np.allclose(power_as_production, -power_as_consumption)
     assert (power_as_production != 0).any()
+
+
+@pytest.mark.parametrize("solver", ["highspy", "appsi_highs"])
+def test_scheduler_records_stage_timings(app, db, add_battery_assets, solver):
+    """The StorageScheduler records how long each computation stage took, under either backend."""
+    _epex_da, battery = get_sensors_from_db(db, add_battery_assets)
+    start = pd.Timestamp("2020-03-03T00:00:00", tz="Europe/Amsterdam")
+    resolution = timedelta(hours=1)
+
+    original_solver = app.config["FLEXMEASURES_LP_SOLVER"]
+    app.config["FLEXMEASURES_LP_SOLVER"] = solver
+    try:
+        scheduler: Scheduler = StorageScheduler(
+            battery,
+            start,
+            start + 4 * resolution,
+            resolution,
+            flex_model={
+                "soc-at-start": "1 MWh",
+                "soc-min": "0 MWh",
+                "soc-max": "5 MWh",
+                "power-capacity": "0.5 MW",
+            },
+            flex_context={
+                "consumption-price": "10 EUR/MWh",
+                "production-price": "5 EUR/MWh",
+                "site-power-capacity": "2 MW",
+            },
+        )
+        scheduler.compute()
+    finally:
+        app.config["FLEXMEASURES_LP_SOLVER"] = original_solver
+
+    assert set(scheduler.timings) == {
+        "deserialize",
+        "prepare",
+        "build",
+        "solve",
+        "postprocess",
+    }
+    for stage, seconds in scheduler.timings.items():
+        assert isinstance(seconds, float), stage
+        assert seconds >= 0, stage
+
+    # 1 device over 4 timesteps
+    assert scheduler.problem_size["devices"] == 1
+    assert scheduler.problem_size["timesteps"] == 4
+    assert scheduler.problem_size["rows"] > 0
+    assert scheduler.problem_size["cols"] > 0
+    if solver == "highspy":
+        assert scheduler.problem_size["nnz"] >= scheduler.problem_size["rows"]
+
+
+@pytest.mark.parametrize("solver", ["highspy", "appsi_highs"])
+def test_device_scheduler_records_timings_without_devices(app, solver):
+    """Also the early return for an EMS without devices reports its (build) timings."""
+    original_solver = app.config["FLEXMEASURES_LP_SOLVER"]
+    app.config["FLEXMEASURES_LP_SOLVER"] = solver
+    try:
+        planned_power, planned_costs, _results, model = device_scheduler(
+            device_constraints=[],
+            ems_constraints=initialize_df(
+                ["derivative max", "derivative min"],
+                datetime(2020, 1, 1),
+                datetime(2020, 1, 2),
+                timedelta(hours=1),
+            ),
+        )
+    finally:
+        app.config["FLEXMEASURES_LP_SOLVER"] = original_solver
+
+    assert planned_power == []
+    assert planned_costs == 0
+    assert set(model.timings) == {"build", "solve"}
+    assert all(seconds >= 0 for seconds in model.timings.values())
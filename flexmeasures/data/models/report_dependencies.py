@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from flexmeasures.data import db
+
+
+class ReportDependency(db.Model):
+    """Registers that a report depends on the data of an input sensor.
+
+    The report is described by the data source of its reporter,
+    which stores the reporter's configuration and parameters (including the report's input and output sensors).
+    Whenever new data is saved for the input sensor (see ``save_to_db``),
+    the report is recomputed for the affected time window, in a job on the reporting queue
+    (see ``flexmeasures.data.services.reporting``).
+    """
+
+    __tablename__ = "report_dependency"
+
+    sensor_id = db.Column(
+        db.Integer, db.ForeignKey("sensor.id", ondelete="CASCADE"), primary_key=True
+    )
+    source_id = db.Column(
+        db.Integer,
+        db.ForeignKey("data_source.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    def __repr__(self) -> str:
+        return f"<ReportDependency sensor={self.sensor_id} source={self.source_id}>"
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from typing import Any
+from datetime import datetime, timedelta
+from typing import Any, Iterator
+
+import isodate
+import pandas as pd
+
 from flexmeasures.data.models.data_sources import DataGenerator
 
 from flexmeasures.data.schemas.reporting import (
     ReporterParametersSchema,
     ReporterConfigSchema,
 )
+from flexmeasures.data.schemas.times import DurationField
 
 
 class Reporter(DataGenerator):
@@ -28,7 +34,11 @@ class Reporter(DataGenerator):
                                         matches that of the sensor it is supposed to be recorded on.
         """
 
-        results = self._compute_report(**kwargs)
+        if kwargs.get("chunk_duration") is not None:
+            results = self._stitch_chunks(list(self._compute_chunks(**kwargs)))
+        else:
+            kwargs.pop("chunk_duration", None)
+            results = self._compute_results(**kwargs)
 
         for result in results:
             # checking that the event_resolution of the output BeliefDataFrame is equal to the one of the output sensor
@@ -38,6 +48,90 @@ class Reporter(DataGenerator):
 
         return results
 
+    def _compute_results(self, **kwargs) -> list[dict[str, Any]]:
+        if "batch" in kwargs:
+            return self._compute_report_batch(**kwargs)
+        return self._compute_report(**kwargs)
+
+    def compute_in_chunks(
+        self, parameters: dict | None = None, **kwargs
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Compute the report chunk by chunk (see the `chunk_duration` parameter), yielding the results of each chunk.
+
+        This lets callers save each chunk before the next one is computed,
+        so that neither the inputs nor the outputs of the full report window are held in memory at once.
+        The parameters are passed like in `compute`.
+        """
+        self._parameters = self._parameters_schema.load(
+            self._collect_parameters(parameters, **kwargs)
+        )
+        parameters = dict(self._parameters)
+        check_output_resolution = parameters.pop("check_output_resolution", True)
+        if parameters.get("chunk_duration") is None:
+            parameters["chunk_duration"] = parameters["end"] - parameters["start"]
+        for results in self._compute_chunks(**parameters):
+            for result in results:
+                assert not check_output_resolution or (
+                    result["sensor"].event_resolution == result["data"].event_resolution
+                ), f"The resolution of the results ({result['data'].event_resolution}) should match that of the output sensor ({result['sensor'].event_resolution}, ID {result['sensor'].id})."
+            yield self._assign_sensors_and_source(results)
+
+    def _compute_chunks(
+        self,
+        start: datetime,
+        end: datetime,
+        chunk_duration: timedelta | isodate.Duration,
+        **kwargs,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Split the report window into chunks, and compute the results of each chunk.
+
+        Each chunk is computed over a window extended by the `chunk_overlap` (from the config, if set),
+        to give transformations such as differences, shifts and rolling windows the data they need near the chunk edges.
+        Only the results within the chunk itself are kept, so the chunked results equal those of a single computation.
+        Chunks should therefore cover whole events of the output sensors.
+        """
+        overlap = self._config.get("chunk_overlap", timedelta(0))
+        chunk_start = start
+        while chunk_start < end:
+            chunk_end = min(
+                chunk_start + DurationField.ground_from(chunk_duration, chunk_start),
+                end,
+            )
+            results = self._compute_results(
+                start=max(start, chunk_start - overlap),
+                end=min(end, chunk_end + overlap),
+                **kwargs,
+            )
+            for result in results:
+                data = result["data"]
+                resolution = data.event_resolution
+                if resolution and (
+                    (chunk_start - start) % resolution
+                    or (chunk_end < end and (chunk_end - start) % resolution)
+                ):
+                    raise ValueError(
+                        f"Chunks should cover whole events of {result['sensor']} (with a resolution of {resolution}). Adjust the chunk duration."
+                    )
+                event_starts = data.index.get_level_values("event_start")
+                result["data"] = data[
+                    (event_starts >= chunk_start) & (event_starts < chunk_end)
+                ]
+            yield results
+            chunk_start = chunk_end
+
+    @staticmethod
+    def _stitch_chunks(
+        chunks: list[list[dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        """Concatenate the data of corresponding results of each chunk."""
+        results = chunks[0]
+        for i, result in enumerate(results):
+            data = pd.concat([chunk[i]["data"] for chunk in chunks])
+            data.sensor = result["data"].sensor
+            data.event_resolution = result["data"].event_resolution
+            result["data"] = data
+        return results
+
     def _compute_report(self, **kwargs) -> list[dict[str, Any]]:
         """Overwrite with the actual computation of your report.
 
@@ -50,3 +144,29 @@ class Reporter(DataGenerator):
                  ]
         """
         raise NotImplementedError()
+
+    def _compute_report_batch(
+        self, batch: list[dict[str, Any]], **kwargs
+    ) -> list[dict[str, Any]]:
+        """Compute the reports for a batch of input and output descriptions, sharing all other parameters.
+
+        By default, the reports are computed one after the other.
+        Overwrite to share work among them, such as loading inputs they have in common.
+
+        :param batch:   list of dictionaries, each with an input and an output description, for example:
+                        [
+                            {
+                                "input": [{"sensor": 42}],
+                                "output": [{"sensor": 501}],
+                            },
+                        ]
+        :returns list of dictionaries, with the results of all reports (see `_compute_report`)
+        """
+        results = []
+        for entry in batch:
+            results.extend(
+                self._compute_report(
+                    input=entry["input"], output=entry["output"], **kwargs
+                )
+            )
+        return results
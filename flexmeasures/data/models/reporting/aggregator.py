@@ -42,104 +42,152 @@ class AggregatorReporter(Reporter):
         all indexes but event_start, and applies an aggregation function over the
         columns.
         """
+        return self._compute_report_batch(
+            start=start,
+            end=end,
+            batch=[dict(input=input, output=output)],
+            resolution=resolution,
+            belief_time=belief_time,
+            belief_horizon=belief_horizon,
+        )
+
+    def _compute_report_batch(
+        self,
+        start: datetime,
+        end: datetime,
+        batch: list[dict[str, Any]],
+        resolution: timedelta | None = None,
+        belief_time: datetime | None = None,
+        belief_horizon: timedelta | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        This method aggregates the inputs of each entry in the batch into its output (see `_compute_report`).
+        Inputs shared among entries (with the same sensor and search parameters) are loaded only once.
+        """
 
         method: str = self._config.get("method")
         weights: dict = self._config.get("weights", {})
 
-        dataframes = []
-
         if belief_time is None and belief_horizon is None:
             belief_time = server_now()
 
-        for input_description in input:
-            sensor: Sensor = input_description.pop("sensor")
-            # if name is not in belief_search_config, using the Sensor id instead
-            column_name = input_description.pop("name", f"sensor_{sensor.id}")
-
-            source = input_description.pop(
-                "source", input_description.pop("sources", None)
+        input_data: dict[tuple, pd.DataFrame] = {}
+        results = []
+        for entry in batch:
+            dataframes = []
+            for input_description in entry["input"]:
+                input_description = dict(input_description)
+                sensor: Sensor = input_description.pop("sensor")
+                # if name is not in belief_search_config, using the Sensor id instead
+                column_name = input_description.pop("name", f"sensor_{sensor.id}")
+
+                key = (sensor.id, repr(sorted(input_description.items())))
+                if key not in input_data:
+                    input_data[key] = self._search_input(
+                        sensor,
+                        input_description,
+                        start=start,
+                        end=end,
+                        resolution=resolution,
+                        belief_time=belief_time,
+                        belief_horizon=belief_horizon,
+                    )
+                df = input_data[key]
+
+                # apply weight
+                if column_name in weights:
+                    df = df * weights[column_name]
+
+                dataframes.append(df)
+
+            output_df = pd.concat(dataframes, axis=1)
+
+            # apply aggregation method
+            output_df = output_df.aggregate(method, axis=1)
+
+            # convert BeliefsSeries into a BeliefsDataFrame
+            output_sensor = entry["output"][0]["sensor"]
+            output_df = output_df.to_frame("event_value")
+            if belief_time is not None:
+                belief_col = "belief_time"
+                output_df[belief_col] = belief_time
+            elif belief_horizon is not None:
+                belief_col = "belief_horizon"
+                output_df[belief_col] = belief_horizon
+            output_df["cumulative_probability"] = 0.5
+            output_df["source"] = self.data_source
+            output_df.sensor = output_sensor
+            output_df.event_resolution = output_sensor.event_resolution
+
+            output_df = output_df.set_index(
+                [belief_col, "source", "cumulative_probability"], append=True
             )
-            if source is not None and not isinstance(source, list):
-                source = [source]
-
-            df = sensor.search_beliefs(
-                event_starts_after=start,
-                event_ends_before=end,
-                resolution=resolution,
-                beliefs_before=belief_time,
-                horizons_at_most=belief_horizon,
-                source=source,
-                one_deterministic_belief_per_event=True,
-                **input_description,
+
+            results.append(
+                {
+                    "name": "aggregate",
+                    "column": "event_value",
+                    "sensor": output_sensor,
+                    "data": output_df,
+                }
             )
+        return results
 
-            # Check for multi-sourced events (i.e. multiple sources for a single event)
-            if len(df.lineage.events) != len(df):
-                duplicate_events = df[
-                    df.index.get_level_values("event_start").duplicated()
-                ]
-                raise ValueError(
-                    f"{len(duplicate_events)} event(s) are duplicate. First duplicate: {duplicate_events[0]}. Consider using (more) source filters."
-                )
-
-            # Check for multiple sources within the entire frame (excluding different versions of the same source)
-            # Raise error if that is the case and no source filter was applied - user should be explicit here
-            unique_sources = df.lineage.sources
-            properties = [
-                "name",
-                "type",
-                "model",
-            ]  # properties to identify different versions of the same source
-            if (
-                len(unique_sources) > 1
-                and not all(
-                    getattr(source, prop) == getattr(unique_sources[0], prop)
-                    for prop in properties
-                    for source in unique_sources
-                )
-                and (source is None or len(source) == 0)
-            ):
-                raise ValueError(
-                    f"Missing attribute 'sources' for input sensor {sensor.id}: {sensor.name} (to identify one specific source). The field  `sources` is required when having data with multiple sources within the time window, to ensure only required data is used in the reporter. "
-                    f"We found data from the following sources: {[source.id for source in unique_sources]}."
-                )
-
-            # drop all indexes but event_start
-            df = df.droplevel([1, 2, 3])
-
-            # apply weight
-            if column_name in weights:
-                df *= weights[column_name]
-
-            dataframes.append(df)
-
-        output_df = pd.concat(dataframes, axis=1)
-
-        # apply aggregation method
-        output_df = output_df.aggregate(method, axis=1)
-
-        # convert BeliefsSeries into a BeliefsDataFrame
-        output_df = output_df.to_frame("event_value")
-        if belief_time is not None:
-            belief_col = "belief_time"
-            output_df[belief_col] = belief_time
-        elif belief_horizon is not None:
-            belief_col = "belief_horizon"
-            output_df[belief_col] = belief_horizon
-        output_df["cumulative_probability"] = 0.5
-        output_df["source"] = self.data_source
-        output_df.sensor = output[0]["sensor"]
-        output_df.event_resolution = output[0]["sensor"].event_resolution
-
-        output_df = output_df.set_index(
-            [belief_col, "source", "cumulative_probability"], append=True
+    @staticmethod
+    def _search_input(
+        sensor: Sensor,
+        input_description: dict[str, Any],
+        start: datetime,
+        end: datetime,
+        resolution: timedelta | None,
+        belief_time: datetime | None,
+        belief_horizon: timedelta | None,
+    ) -> pd.DataFrame:
+        """Search the beliefs of an input sensor, checking that they come from a single source."""
+        input_description = dict(input_description)
+        source = input_description.pop("source", input_description.pop("sources", None))
+        if source is not None and not isinstance(source, list):
+            source = [source]
+
+        df = sensor.search_beliefs(
+            event_starts_after=start,
+            event_ends_before=end,
+            resolution=resolution,
+            beliefs_before=belief_time,
+            horizons_at_most=belief_horizon,
+            source=source,
+            one_deterministic_belief_per_event=True,
+            **input_description,
         )
 
-        return [
-            {
-                "name": "aggregate",
-                "column": "event_value",
-                "sensor": output[0]["sensor"],
-                "data": output_df,
-            }
-        ]
+        # Check for multi-sourced events (i.e. multiple sources for a single event)
+        if len(df.lineage.events) != len(df):
+            duplicate_events = df[df.index.get_level_values("event_start").duplicated()]
+            raise ValueError(
+                f"{len(duplicate_events)} event(s) are duplicate. First duplicate: {duplicate_events[0]}. Consider using (more) source filters."
+            )
+
+        # Check for multiple sources within the entire frame (excluding different versions of the same source)
+        # Raise error if that is the case and no source filter was applied - user should be explicit here
+        unique_sources = df.lineage.sources
+        properties = [
+            "name",
+            "type",
+            "model",
+        ]  # properties to identify different versions of the same source
+        if (
+            len(unique_sources) > 1
+            and not all(
+                getattr(source, prop) == getattr(unique_sources[0], prop)
+                for prop in properties
+                for source in unique_sources
+            )
+            and (source is None or len(source) == 0)
+        ):
+            raise ValueError(
+                f"Missing attribute 'sources' for input sensor {sensor.id}: {sensor.name} (to identify one specific source). The field  `sources` is required when having data with multiple sources within the time window, to ensure only required data is used in the reporter. "
+                f"We found data from the following sources: {[source.id for source in unique_sources]}."
+            )
+
+        # drop all indexes but event_start
+        return df.droplevel([1, 2, 3])
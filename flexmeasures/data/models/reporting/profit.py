@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Any
 
+import pandas as pd
 
 from flexmeasures.data.models.reporting import Reporter
 from flexmeasures.data.schemas.reporting.profit import (
@@ -66,61 +68,155 @@ class ProfitOrLossReporter(Reporter):
         :param belief_time: datetime used to indicate we are interested in the state of knowledge at that time.
                             It is used to filter input, and to assign a recording time to output.
         """
+        return self._compute_report_batch(
+            start=start,
+            end=end,
+            batch=[dict(input=input, output=output)],
+            belief_time=belief_time,
+        )
+
+    def _compute_report_batch(
+        self,
+        start: datetime,
+        end: datetime,
+        batch: list[dict[str, Any]],
+        belief_time: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Compute the profit or loss of many power/energy sensors.
+
+        The prices are loaded only once per input resolution, and the data of each power/energy sensor only once.
+        The profit or loss of all inputs sharing a resolution and timezone is computed in one vectorized pass.
+
+        :param batch: list of input and output descriptions (see `_compute_report`),
+                      e.g. `batch=[{"input": [{"sensor": 42}], "output": [{"sensor": 43}]}]`
+        """
 
         production_price_sensor: Sensor = self._config.get("production_price_sensor")
         consumption_price_sensor: Sensor = self._config.get("consumption_price_sensor")
         loss_is_positive: bool = self._config.get("loss_is_positive", False)
 
-        input_sensor: Sensor = input[0]["sensor"]  # power or energy sensor
-        input_source: Sensor = input[0].get("sources", None)
-
-        timezone = input_sensor.timezone
-
         if belief_time is None:
             belief_time = server_now()
 
-        # get prices
-        production_price = simplify_index(
-            production_price_sensor.search_beliefs(
-                event_starts_after=start,
-                event_ends_before=end,
-                beliefs_before=belief_time,
-                resolution=input_sensor.event_resolution,
-                most_recent_beliefs_only=True,
-                one_deterministic_belief_per_event=True,
+        search_kwargs = dict(start=start, end=end, belief_time=belief_time)
+
+        # get power/energy time series (once per sensor and source)
+        input_data: dict[tuple, pd.DataFrame] = {}
+        input_keys = []
+        for entry in batch:
+            input_sensor: Sensor = entry["input"][0]["sensor"]  # power or energy sensor
+            input_source = entry["input"][0].get("sources", None)
+            key = (input_sensor.id, repr(input_source))
+            if key not in input_data:
+                input_data[key] = self._search(
+                    input_sensor, source=input_source, **search_kwargs
+                )
+            input_keys.append(key)
+
+        # group the inputs that share a resolution and timezone
+        groups = defaultdict(list)
+        for j, entry in enumerate(batch):
+            input_sensor = entry["input"][0]["sensor"]
+            groups[(input_sensor.event_resolution, input_sensor.timezone)].append(j)
+
+        # get prices (once per resolution), and compute the profit of each group of inputs in one pass
+        prices: dict[timedelta, list[pd.Series]] = {}
+        profits: dict[int, pd.DataFrame] = {}
+        for (resolution, timezone), group in groups.items():
+            if resolution not in prices:
+                prices[resolution] = [
+                    self._search(price_sensor, resolution=resolution, **search_kwargs)[
+                        "event_value"
+                    ]
+                    for price_sensor in (
+                        production_price_sensor,
+                        consumption_price_sensor,
+                    )
+                ]
+            production_price, consumption_price = (
+                price.tz_convert(timezone) for price in prices[resolution]
             )
-        )
-        production_price = production_price.tz_convert(timezone)
-        consumption_price = simplify_index(
-            consumption_price_sensor.search_beliefs(
-                event_starts_after=start,
-                event_ends_before=end,
-                beliefs_before=belief_time,
-                resolution=input_sensor.event_resolution,
-                most_recent_beliefs_only=True,
-                one_deterministic_belief_per_event=True,
+            flows = pd.DataFrame(
+                {
+                    j: self._production_flow(
+                        batch[j]["input"][0]["sensor"],
+                        input_data[input_keys[j]]["event_value"],
+                    )
+                    for j in group
+                }
             )
-        )
-        consumption_price = consumption_price.tz_convert(timezone)
 
-        # get power/energy time series
-        power_energy_data = simplify_index(
-            input_sensor.search_beliefs(
+            # compute profit
+            # this step assumes that positive flows represent production and negative flows consumption
+            profit = flows.clip(lower=0).mul(production_price, axis=0) + flows.clip(
+                upper=0
+            ).mul(consumption_price, axis=0)
+
+            # transform a losses in negative to positive
+            if loss_is_positive:
+                profit *= -1.0
+
+            price_index = production_price.index.union(consumption_price.index)
+            for j in group:
+                data = input_data[input_keys[j]]
+                index = data.index.union(price_index)
+                profits[j] = data.reindex(index)
+                profits[j]["event_value"] = profit[j].reindex(index)
+
+        output_name = "loss" if loss_is_positive else "profit"
+        results = []
+        for j, entry in enumerate(batch):
+            output_unit = self._output_unit(entry["input"][0]["sensor"])
+            for output_description in entry["output"]:
+                output_sensor = output_description["sensor"]
+
+                # check output sensor unit coincides with the units of the result
+                assert output_unit == output_sensor.unit
+
+                results.append(
+                    {
+                        "name": output_name,
+                        "column": "event_value",
+                        "sensor": output_sensor,
+                        "data": self._to_output_frame(
+                            profits[j], output_sensor, belief_time
+                        ),
+                    }
+                )
+
+        return results
+
+    @staticmethod
+    def _search(
+        sensor: Sensor, start: datetime, end: datetime, belief_time: datetime, **kwargs
+    ) -> pd.DataFrame:
+        return simplify_index(
+            sensor.search_beliefs(
                 event_starts_after=start,
                 event_ends_before=end,
                 beliefs_before=belief_time,
-                source=input_source,
                 most_recent_beliefs_only=True,
                 one_deterministic_belief_per_event=True,
+                **kwargs,
             )
         )
 
-        unit_consumption_price = ur.Unit(consumption_price_sensor.unit)
-        unit_production_price = ur.Unit(production_price_sensor.unit)
+    @staticmethod
+    def _production_flow(input_sensor: Sensor, flow: pd.Series) -> pd.Series:
+        """Compute the energy flow, with positive values for production and negative values for consumption."""
 
         # compute energy flow from power flow
         if input_sensor.measures_power:
-            power_energy_data *= input_sensor.event_resolution / timedelta(hours=1)
+            flow = flow * (input_sensor.event_resolution / timedelta(hours=1))
+
+        # transform time series as to get positive values for production and negative for consumption
+        if input_sensor.get_attribute("consumption_is_positive", False):
+            flow = flow * -1.0
+        return flow
+
+    def _output_unit(self, input_sensor: Sensor) -> str:
+        """Determine the currency unit of the results, from the units of the prices and the input sensor."""
+        if input_sensor.measures_power:
             power_energy_unit = ur.Unit(
                 determine_stock_unit(input_sensor.unit, time_unit="h")
             )
@@ -128,62 +224,30 @@ class ProfitOrLossReporter(Reporter):
             power_energy_unit = ur.Unit(input_sensor.unit)
 
         # check that the unit of the results are a currency
-        cost_unit = unit_consumption_price * power_energy_unit
-        revenue_unit = unit_production_price * power_energy_unit
+        cost_unit = (
+            ur.Unit(self._config["consumption_price_sensor"].unit) * power_energy_unit
+        )
+        revenue_unit = (
+            ur.Unit(self._config["production_price_sensor"].unit) * power_energy_unit
+        )
         assert is_currency_unit(cost_unit)
         assert is_currency_unit(revenue_unit)
-
-        # transform time series as to get positive values for production and negative for consumption
-        if input_sensor.get_attribute("consumption_is_positive", False):
-            power_energy_data *= -1.0
-
-        # compute profit
-        # this step assumes that positive flows represent production and negative flows consumption
-        result = (
-            power_energy_data.clip(lower=0) * production_price
-            + power_energy_data.clip(upper=0) * consumption_price
+        assert str(cost_unit) == str(revenue_unit)
+        return str(cost_unit)
+
+    def _to_output_frame(
+        self, result: pd.DataFrame, output_sensor: Sensor, belief_time: datetime
+    ) -> pd.DataFrame:
+        # resample result to the event_resolution of the output sensor
+        _result = result.resample(output_sensor.event_resolution).sum()
+
+        # convert BeliefsSeries into a BeliefsDataFrame
+        _result["belief_time"] = belief_time
+        _result["cumulative_probability"] = 0.5
+        _result["source"] = self.data_source
+        _result.sensor = output_sensor
+        _result.event_resolution = output_sensor.event_resolution
+
+        return _result.set_index(
+            ["belief_time", "source", "cumulative_probability"], append=True
         )
-
-        # transform a losses in negative to positive
-        if loss_is_positive:
-            result *= -1.0
-
-        results = []
-
-        output_name = "profit"
-
-        if loss_is_positive:
-            output_name = "loss"
-
-        for output_description in output:
-            output_sensor = output_description["sensor"]
-            _result = result.copy()
-
-            # resample result to the event_resolution of the output sensor
-            _result = _result.resample(output_sensor.event_resolution).sum()
-
-            # convert BeliefsSeries into a BeliefsDataFrame
-            _result["belief_time"] = belief_time
-            _result["cumulative_probability"] = 0.5
-            _result["source"] = self.data_source
-            _result.sensor = output_sensor
-            _result.event_resolution = output_sensor.event_resolution
-
-            # check output sensor unit coincides with the units of the result
-            assert str(cost_unit) == output_sensor.unit
-            assert str(revenue_unit) == output_sensor.unit
-
-            _result = _result.set_index(
-                ["belief_time", "source", "cumulative_probability"], append=True
-            )
-
-            results.append(
-                {
-                    "name": output_name,
-                    "column": "event_value",
-                    "sensor": output_description["sensor"],
-                    "data": _result,
-                }
-            )
-
-        return results
@@ -274,3 +274,47 @@ def test_source_transition(setup_dummy_data, db):
     assert len(result) == 6
     assert (result[:5] == -1).all().event_value  # beliefs from the older version
     assert (result[5:] == 3).all().event_value  # belief from the latest version
+
+
+def test_aggregator_batch(setup_dummy_data, db, monkeypatch):
+    """Check that inputs shared among the entries of a batch are loaded only once."""
+    s1, s2, s3, s4, report_sensor, daily_report_sensor = setup_dummy_data
+
+    source_1 = db.session.get(DataSource, 1)
+    source_2 = db.session.get(DataSource, 2)
+
+    searched_sensors = []
+    search_input = AggregatorReporter._search_input
+
+    def counting_search_input(sensor, *args, **kwargs):
+        searched_sensors.append(sensor)
+        return search_input(sensor, *args, **kwargs)
+
+    monkeypatch.setattr(
+        AggregatorReporter, "_search_input", staticmethod(counting_search_input)
+    )
+
+    agg_reporter = AggregatorReporter(method="sum")
+    results = agg_reporter.compute(
+        batch=[
+            dict(
+                input=[
+                    dict(sensor=s1, source=source_1),
+                    dict(sensor=s2, source=source_2),
+                ],
+                output=[dict(sensor=report_sensor)],
+            ),
+            dict(
+                input=[dict(sensor=s1, source=source_1)],
+                output=[dict(sensor=report_sensor)],
+            ),
+        ],
+        start=datetime(2023, 5, 10, tzinfo=utc),
+        end=datetime(2023, 5, 11, tzinfo=utc),
+    )
+
+    assert searched_sensors == [s1, s2]
+    assert len(results) == 2
+    assert (results[0]["data"] == 0).all().event_value
+    assert (results[1]["data"] == 1).all().event_value
+    assert len(results[1]["data"]) == 24
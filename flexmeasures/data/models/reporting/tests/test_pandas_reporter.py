@@ -346,3 +346,77 @@ def test_pandas_reporter_valid_range(app, setup_dummy_data, shortcut):
     # Check that all values are now inside the range
     assert (result.event_value.values > range[0]).all()
     assert (result.event_value.values < range[1]).all()
+
+
+def test_pandas_reporter_in_chunks(app, setup_dummy_data, monkeypatch):
+    """Check that computing a report in chunks, with enough overlap, gives the same results as computing it at once,
+    while fetching only the data of one chunk (plus overlap) at a time."""
+    s1, s2, s3, s4, report_sensor, daily_report_sensor = setup_dummy_data
+
+    reporter_config = dict(
+        required_input=[{"name": "sensor_1"}],
+        required_output=[{"name": "df_diff"}],
+        transformations=[
+            dict(
+                df_input="sensor_1",
+                df_output="df_diff",
+                method="xs",
+                args=["@source_1"],
+                kwargs=dict(level=2),
+            ),
+            dict(method="diff"),
+        ],
+    )
+    parameters = dict(
+        start=datetime(2023, 4, 10, tzinfo=utc),
+        end=datetime(2023, 4, 10, 10, tzinfo=utc),
+        input=[dict(name="sensor_1", sensor=s1)],
+        output=[dict(name="df_diff", sensor=report_sensor)],
+    )
+
+    result = PandasReporter(config=reporter_config).compute(**parameters)[0]["data"]
+
+    fetched_windows = []
+    fetch_data = PandasReporter.fetch_data
+
+    def recording_fetch_data(self, start, end, *args, **kwargs):
+        fetched_windows.append((start, end))
+        return fetch_data(self, start, end, *args, **kwargs)
+
+    monkeypatch.setattr(PandasReporter, "fetch_data", recording_fetch_data)
+
+    chunked_result = PandasReporter(
+        config=dict(reporter_config, chunk_overlap="PT1H")
+    ).compute(chunk_duration=timedelta(hours=4), **parameters)[0]["data"]
+
+    assert chunked_result["event_value"].tolist()[1:] == [1] * 9
+    assert (
+        chunked_result["event_value"].tolist()[1:] == result["event_value"].tolist()[1:]
+    )
+    assert chunked_result.event_starts.equals(result.event_starts)
+    assert [(start.hour, end.hour) for start, end in fetched_windows] == [
+        (0, 5),
+        (3, 9),
+        (7, 10),
+    ]
+
+    # Without overlap, the first difference in each chunk is missing
+    chunked_results = list(
+        PandasReporter(config=reporter_config).compute_in_chunks(
+            chunk_duration=timedelta(hours=4), **parameters
+        )
+    )
+    assert len(chunked_results) == 3
+    assert [
+        chunk[0]["data"]["event_value"].isnull().sum() for chunk in chunked_results
+    ] == [1, 1, 1]
+    assert all(
+        chunk[0]["data"].sources.unique()[0].type == "reporter"
+        for chunk in chunked_results
+    )
+
+    # Chunks should cover whole events of the output sensors
+    with pytest.raises(ValueError, match="whole events"):
+        PandasReporter(config=reporter_config).compute(
+            chunk_duration=timedelta(minutes=90), **parameters
+        )
@@ -3,11 +3,13 @@ import pytest
 from datetime import datetime, timedelta
 from pytz import timezone
 
+import pandas as pd
 from sqlalchemy import select
 
 from flexmeasures.data.models.reporting.profit import ProfitOrLossReporter
 from flexmeasures.data.models.time_series import Sensor
 from flexmeasures.tests.utils import get_test_sensor
+from flexmeasures.utils.instrumentation import finish_measurement, start_measurement
 
 
 @pytest.mark.parametrize(
@@ -80,3 +82,60 @@ def test_profit_reporter(app, db, profit_report, use_power_sensor, loss_is_posit
     assert (result_hourly[12:16] == -10 * sign).event_value.all()
 
     assert result_daily.event_value.iloc[0] == result_hourly.sum().iloc[0]
+
+
+def test_profit_reporter_batch(app, db, profit_report):
+    """Computing the profit of several inputs in a batch gives the same results, while loading the prices only once."""
+    (
+        profit_sensor_hourly,
+        profit_sensor_daily,
+        power_sensor,
+        energy_sensor,
+    ) = profit_report
+
+    epex_da = get_test_sensor(db)
+    epex_da_production = db.session.execute(
+        select(Sensor).filter(Sensor.name == "epex_da_production")
+    ).scalar_one_or_none()
+    config = dict(
+        consumption_price_sensor=epex_da,
+        production_price_sensor=epex_da_production,
+    )
+    tz = timezone("Europe/Amsterdam")
+    parameters = dict(
+        start=tz.localize(datetime(2015, 1, 3)),
+        end=tz.localize(datetime(2015, 1, 4)),
+        belief_time=tz.localize(datetime(2015, 1, 5)),
+    )
+    batch = [
+        dict(
+            input=[dict(sensor=input_sensor)],
+            output=[
+                dict(sensor=profit_sensor_hourly),
+                dict(sensor=profit_sensor_daily),
+            ],
+        )
+        for input_sensor in (power_sensor, energy_sensor)
+    ]
+
+    measurement = start_measurement("job", "single reports")
+    single_results = []
+    for entry in batch:
+        single_results.extend(
+            ProfitOrLossReporter(**config).compute(**entry, **parameters)
+        )
+    finish_measurement(measurement)
+    single_report_queries = measurement.sql_count
+
+    measurement = start_measurement("job", "batch report")
+    batch_results = ProfitOrLossReporter(**config).compute(batch=batch, **parameters)
+    finish_measurement(measurement)
+    batch_report_queries = measurement.sql_count
+
+    assert len(batch_results) == len(single_results) == 4
+    for batch_result, single_result in zip(batch_results, single_results):
+        assert batch_result["sensor"] == single_result["sensor"]
+        pd.testing.assert_frame_equal(batch_result["data"], single_result["data"])
+
+    # the power and energy sensor share the same resolution, so the two price sensors are searched once rather than twice
+    assert batch_report_queries <= single_report_queries - 2
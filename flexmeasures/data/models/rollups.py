@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from flexmeasures.data import db
+
+
+class TimedBeliefRollup(db.Model):
+    """Pre-aggregated statistics of a sensor's data, per data source and per hour or day.
+
+    A rollup summarizes the most recent deterministic belief about each event within its period,
+    which is what searching for the most recent beliefs returns.
+    Hours and days start on the hour and at midnight in the sensor's timezone, respectively.
+
+    Rollups are maintained by ``save_to_db`` (if ``FLEXMEASURES_ROLLUPS_ENABLED`` is set),
+    can be (re)built with ``flexmeasures add rollups``,
+    and are used to serve searches for coarse resolutions (see ``flexmeasures.data.services.rollups``).
+    """
+
+    __tablename__ = "timed_belief_rollup"
+
+    sensor_id = db.Column(
+        db.Integer, db.ForeignKey("sensor.id", ondelete="CASCADE"), primary_key=True
+    )
+    source_id = db.Column(
+        db.Integer,
+        db.ForeignKey("data_source.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # "hour" or "day"
+    period = db.Column(db.String(8), primary_key=True)
+    period_start = db.Column(db.DateTime(timezone=True), primary_key=True)
+
+    first_event_start = db.Column(db.DateTime(timezone=True), nullable=False)
+    last_event_start = db.Column(db.DateTime(timezone=True), nullable=False)
+    last_belief_time = db.Column(db.DateTime(timezone=True), nullable=False)
+    # Aggregates over non-NaN event values only (NULL if there are none)
+    min_value = db.Column(db.Float, nullable=True)
+    max_value = db.Column(db.Float, nullable=True)
+    sum_value = db.Column(db.Float, nullable=True)
+    count = db.Column(db.Integer, nullable=False)
+    last_value = db.Column(db.Float, nullable=True)
+
+    @property
+    def mean_value(self) -> float | None:
+        return self.sum_value / self.count if self.count else None
+
+    def __repr__(self) -> str:
+        return f"<TimedBeliefRollup sensor={self.sensor_id} source={self.source_id} {self.period} {self.period_start}>"
@@ -312,6 +312,28 @@ class Sensor(db.Model, tb.SensorDBMixin, AuthModelMixin, OrderByIdMixin):
             one_deterministic_belief_per_event=True,
         )
 
+    @staticmethod
+    def latest_states(
+        sensors: list[Sensor],
+        source: (
+            DataSource | list[DataSource] | int | list[int] | str | list[str] | None
+        ) = None,
+    ) -> pd.DataFrame:
+        """Look up the most recent ex-post belief about the most recent event of each of the given sensors, per source.
+
+        Unlike calling ``latest_state`` for each sensor, this takes a single (indexed) query,
+        on the latest beliefs maintained by ``save_to_db`` (see ``flexmeasures.data.services.latest_beliefs``).
+        Also, where ``latest_state`` keeps one belief about an event shared by several sources, this keeps one belief per source.
+
+        :param sensors: the sensors to look up the current state of
+        :param source: look up only beliefs by this source (pass the DataSource, or its name or id) or list of sources
+        :returns: DataFrame with one row per sensor and source, with columns "sensor_id", "source", "event_start",
+                  "belief_time", "cumulative_probability" and "event_value" (with datetimes in UTC)
+        """
+        from flexmeasures.data.services.latest_beliefs import search_latest_beliefs
+
+        return search_latest_beliefs(sensors, sources=parse_source_arg(source))
+
     def search_annotations(
         self,
         annotation_starts_after: datetime_type | None = None,  # deprecated
@@ -1062,23 +1084,53 @@ class TimedBelief(db.Model, tb.TimedBeliefDBMixin):
                 most_recent_events_only=most_recent_events_only,
             )
 
+        # Coarse resolutions of the most recent beliefs may be served from pre-aggregated rollups
+        from flexmeasures.data.services.rollups import search_rollups_at_resolution
+
+        may_use_rollups = (
+            current_app.config.get("FLEXMEASURES_ROLLUPS_ENABLED", False)
+            and resolution is not None
+            and most_recent_beliefs_only
+            and not most_recent_events_only
+            and not most_recent_only
+            and beliefs_after is None
+            and beliefs_before is None
+            and horizons_at_least is None
+            and horizons_at_most is None
+        )
         bdf_dict = {}
         for sensor in sensors:
-            bdf = cls.search_session(
-                session=db.session,
-                sensor=sensor,
-                # Workaround (1st half) for https://github.com/FlexMeasures/flexmeasures/issues/484
-                event_ends_after=event_starts_after,
-                event_starts_before=event_ends_before,
-                beliefs_after=beliefs_after,
-                beliefs_before=beliefs_before,
-                horizons_at_least=horizons_at_least,
-                horizons_at_most=horizons_at_most,
-                source=parsed_sources,
-                **most_recent_filters,
-                custom_filter_criteria=source_criteria,
-                custom_join_targets=custom_join_targets,
+            bdf = (
+                search_rollups_at_resolution(
+                    sensor=sensor,
+                    resolution=resolution,
+                    event_starts_after=event_starts_after,
+                    event_ends_before=event_ends_before,
+                    sources=parsed_sources,
+                    user_source_ids=user_source_ids,
+                    source_account_ids=source_account_ids,
+                    source_types=source_types,
+                    exclude_source_types=exclude_source_types,
+                )
+                if may_use_rollups
+                else None
             )
+            if bdf is None:
+                bdf = cls.search_session(
+                    session=db.session,
+                    sensor=sensor,
+                    # Workaround (1st half) for https://github.com/FlexMeasures/flexmeasures/issues/484
+                    event_ends_after=event_starts_after,
+                    event_starts_before=event_ends_before,
+                    beliefs_after=beliefs_after,
+                    beliefs_before=beliefs_before,
+                    horizons_at_least=horizons_at_least,
+                    horizons_at_most=horizons_at_most,
+                    source=parsed_sources,
+                    **most_recent_filters,
+                    custom_filter_criteria=source_criteria,
+                    custom_join_targets=custom_join_targets,
+                )
             if use_latest_version_per_event:
                 bdf = keep_latest_version(
                     bdf=bdf,
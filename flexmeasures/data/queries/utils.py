@@ -43,6 +43,22 @@ def id_prefix_filter(
     return or_(*filters)
 
 
+def keyset_paginate(
+    query: Select, id_column, after: int | None, limit: int | None = None
+) -> Select:
+    """Order a query by ID, selecting only rows with an ID greater than the `after` cursor.
+
+    Unlike offset pagination, the database seeks straight to the first row of a page using the index on the ID column,
+    so deep pages are as fast as the first one.
+    """
+    if after is not None:
+        query = query.where(id_column > after)
+    query = query.order_by(id_column)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
 def create_beliefs_query(
     cls: "Type[ts.TimedValue]",
     session: Session,
@@ -1,4 +1,4 @@
-from marshmallow import Schema, fields, validate
+from marshmallow import Schema, fields, validate, validates_schema, ValidationError
 
 from flexmeasures.data.schemas.sources import DataSourceIdField
 from flexmeasures.data.schemas.account import AccountIdOrListField
@@ -11,9 +11,31 @@ class ReporterConfigSchema(Schema):
     """
     This schema is used to validate Reporter class configurations (config).
     Inherit from this class to extend this schema with your own parameters.
+
+    When computing a report in chunks (see the `chunk_duration` parameter), each chunk is computed
+    over a window extended by the `chunk_overlap` on both sides, for transformations that need data
+    beyond the chunk edges (e.g. differences, shifts or rolling windows).
     """
 
-    pass
+    chunk_overlap = DurationField(required=False)
+
+
+class ReporterBatchEntrySchema(Schema):
+    """
+    This schema is used to validate a pair of input and output descriptions,
+    to be computed in a batch with other pairs (see the `batch` parameter of the Reporter class).
+    Inherit from this class to restrict the input and output descriptions of your own reporter.
+    """
+
+    input = fields.List(
+        fields.Nested(Input()),
+        required=True,
+        validate=validate.Length(min=1),
+    )
+
+    output = fields.List(
+        fields.Nested(Output()), required=True, validate=validate.Length(min=1)
+    )
 
 
 class ReporterParametersSchema(Schema):
@@ -21,16 +43,28 @@ class ReporterParametersSchema(Schema):
     This schema is used to validate the parameters to the method `compute` of
      the Reporter class.
     Inherit from this class to extend this schema with your own parameters.
+
+    Instead of a single input and output description, a `batch` of them can be passed,
+    so that reports sharing inputs can be computed together.
+
+    With a `chunk_duration`, long report windows are split into chunks that are computed one after the other,
+    which bounds the memory needed to hold the inputs and intermediate results.
     """
 
     input = fields.List(
         fields.Nested(Input()),
-        required=True,
+        required=False,
         validate=validate.Length(min=1),
     )
 
     output = fields.List(fields.Nested(Output()), validate=validate.Length(min=1))
 
+    batch = fields.List(
+        fields.Nested(ReporterBatchEntrySchema()),
+        required=False,
+        validate=validate.Length(min=1),
+    )
+
     start = AwareDateTimeField(required=True)
     end = AwareDateTimeField(required=True)
 
@@ -38,6 +72,19 @@ class ReporterParametersSchema(Schema):
     belief_time = AwareDateTimeField(required=False)
     check_output_resolution = fields.Bool(required=False)
     belief_horizon = DurationField(required=False)
+    chunk_duration = DurationField(required=False)
+
+    @validates_schema
+    def validate_input_or_batch(self, data, **kwargs):
+        if "batch" not in data and "input" not in data:
+            raise ValidationError(
+                {"input": ["Missing data for required field."]},
+            )
+        if "batch" in data and ("input" in data or "output" in data):
+            raise ValidationError(
+                "A batch of input and output descriptions cannot be combined with a single input or output description.",
+                field_name="batch",
+            )
 
 
 class BeliefsSearchConfigSchema(Schema):
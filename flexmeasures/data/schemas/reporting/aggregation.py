@@ -1,6 +1,7 @@
 from marshmallow import fields, validate
 
 from flexmeasures.data.schemas.reporting import (
+    ReporterBatchEntrySchema,
     ReporterConfigSchema,
     ReporterParametersSchema,
 )
@@ -26,6 +27,15 @@ class AggregatorConfigSchema(ReporterConfigSchema):
     weights = fields.Dict(fields.Str(), fields.Float(), required=False)
 
 
+class AggregatorBatchEntrySchema(ReporterBatchEntrySchema):
+    """Schema for a pair of input and output descriptions in a batch of AggregatorReporter parameters"""
+
+    # redefining output to restrict the output length to 1
+    output = fields.List(
+        fields.Nested(Output()), required=True, validate=validate.Length(min=1, max=1)
+    )
+
+
 class AggregatorParametersSchema(ReporterParametersSchema):
     """Schema for the AggregatorReporter parameters
 
@@ -58,3 +68,8 @@ class AggregatorParametersSchema(ReporterParametersSchema):
     output = fields.List(
         fields.Nested(Output()), validate=validate.Length(min=1, max=1)
     )
+
+    batch = fields.List(
+        fields.Nested(AggregatorBatchEntrySchema()),
+        validate=validate.Length(min=1),
+    )
@@ -8,11 +8,12 @@ from marshmallow import (
 )
 
 from flexmeasures.data.schemas.reporting import (
+    ReporterBatchEntrySchema,
     ReporterConfigSchema,
     ReporterParametersSchema,
 )
 
-from flexmeasures.data.schemas.io import Input
+from flexmeasures.data.schemas.io import Input, Output
 from flexmeasures.data.schemas.sensors import SensorIdField
 from flexmeasures.utils.unit_utils import is_currency_unit
 
@@ -73,6 +74,51 @@ class ProfitOrLossReporterConfigSchema(ReporterConfigSchema):
             )
 
 
+def validate_power_or_energy_input(value: list[dict]):
+    if not (value[0]["sensor"].measures_power or value[0]["sensor"].measures_energy):
+        raise ValidationError("Input sensor can only contain power or energy values.")
+
+
+def validate_currency_output(value: list[dict]):
+    for output_description in value:
+        if not is_currency_unit(output_description["sensor"].unit):
+            raise ValidationError(
+                "Output sensor unit can only be a currency, e.g. EUR."
+            )
+
+
+class ProfitOrLossReporterBatchEntrySchema(ReporterBatchEntrySchema):
+    """Schema for a pair of input and output descriptions in a batch of ProfitOrLossReporter parameters
+
+    Example:
+    .. code-block:: json
+        {
+            "input": [
+                {
+                    "sensor": 1,
+                },
+            ],
+            "output": [
+                {
+                    "sensor": 2,
+                }
+            ],
+        }
+    """
+
+    # redefining input to restrict the input length to 1
+    input = fields.List(
+        fields.Nested(Input()),
+        required=True,
+        validate=[validate.Length(min=1, max=1), validate_power_or_energy_input],
+    )
+    output = fields.List(
+        fields.Nested(Output()),
+        required=True,
+        validate=[validate.Length(min=1), validate_currency_output],
+    )
+
+
 class ProfitOrLossReporterParametersSchema(ReporterParametersSchema):
     """Schema for the ProfitOrLossReporter parameters
 
@@ -92,24 +138,32 @@ class ProfitOrLossReporterParametersSchema(ReporterParametersSchema):
             "start" : "2023-01-01T00:00:00+00:00",
             "end" : "2023-01-03T00:00:00+00:00",
         }
+
+    Or, to compute the profit or loss of many power/energy sensors, loading the prices only once:
+
+    .. code-block:: json
+        {
+            "batch": [
+                {"input": [{"sensor": 1}], "output": [{"sensor": 2}]},
+                {"input": [{"sensor": 3}], "output": [{"sensor": 4}]},
+            ],
+            "start" : "2023-01-01T00:00:00+00:00",
+            "end" : "2023-01-03T00:00:00+00:00",
+        }
     """
 
-    # redefining output to restrict the input length to 1
+    # redefining input to restrict the input length to 1
     input = fields.List(fields.Nested(Input()), validate=validate.Length(min=1, max=1))
 
+    batch = fields.List(
+        fields.Nested(ProfitOrLossReporterBatchEntrySchema()),
+        validate=validate.Length(min=1),
+    )
+
     @validates("input")
     def validate_input_measures_power_energy(self, value, **kwargs):
-        if not (
-            value[0]["sensor"].measures_power or value[0]["sensor"].measures_energy
-        ):
-            raise ValidationError(
-                "Input sensor can only contain power or energy values."
-            )
+        validate_power_or_energy_input(value)
 
     @validates("output")
     def validate_output_unit_currency(self, value, **kwargs):
-        for output_description in value:
-            if not is_currency_unit(output_description["sensor"].unit):
-                raise ValidationError(
-                    "Output sensor unit can only be a currency, e.g. EUR."
-                )
+        validate_currency_output(value)
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from marshmallow import fields, Schema, validate, validates_schema, ValidationError
+
+from flexmeasures.data.schemas.times import DurationField
+
+RETENTION_ACTIONS = ("keep-most-recent-belief", "thin-horizons", "drop-rolled-up-data")
+
+
+class RetentionPolicySchema(Schema):
+    """A retention policy, which deletes beliefs about events that lie further in the past than a given duration.
+
+    Actions:
+
+    - "keep-most-recent-belief": keep only the most recent belief about each event (per source and probability).
+    - "thin-horizons": keep only the most recent belief within each horizon bucket,
+      e.g. with a horizon bucket of PT6H, forecasts made 0-6, 6-12 and 12-18 hours ahead each keep one belief.
+    - "drop-rolled-up-data": drop the beliefs about events covered by a daily rollup (see ``TimedBeliefRollup``).
+    """
+
+    action = fields.Str(required=True, validate=validate.OneOf(RETENTION_ACTIONS))
+    older_than = DurationField(required=True, data_key="older-than")
+    horizon_bucket = DurationField(required=False, data_key="horizon-bucket")
+    source_types = fields.List(fields.Str(), required=False, data_key="source-types")
+    sensors = fields.List(fields.Int(), required=False)
+
+    @validates_schema
+    def validate_horizon_bucket(self, data, **kwargs):
+        if data["action"] == "thin-horizons" and not data.get("horizon_bucket"):
+            raise ValidationError(
+                "Thinning horizons requires a horizon bucket.",
+                field_name="horizon-bucket",
+            )
+        if "horizon_bucket" in data and data["action"] != "thin-horizons":
+            raise ValidationError(
+                "A horizon bucket only applies to thinning horizons.",
+                field_name="horizon-bucket",
+            )
@@ -1823,6 +1823,19 @@ class AssetTriggerSchema(Schema):
             description="If true, each asset within the asset tree is scheduled one after the other, where the next schedule takes into account the previously scheduled assets as inflexible device.",
         ),
     )
+    sequential_tiers = fields.List(
+        fields.List(SensorIdField()),
+        data_key="sequential-tiers",
+        required=False,
+        metadata=dict(
+            description="Ordered priority tiers for sequential scheduling, each listing the power sensors of one or more flexible devices from the flex-model. "
+            "Devices within a tier are scheduled in parallel, each taking into account the devices of all earlier tiers (but not those of its own tier) as inflexible devices. "
+            "Only the tiers are scheduled one after the other. "
+            "Requires `sequential` to be true, and each sensor in the flex-model to be listed exactly once. "
+            "By default, each device forms its own tier, in the order of the flex-model.",
+            example=[[1, 2, 3], [4]],
+        ),
+    )
     force_new_job_creation = fields.Boolean(
         data_key="force-new-job-creation",
         required=False,
@@ -1893,6 +1906,33 @@ class AssetTriggerSchema(Schema):
             sensors.append(sensor)
         return data
 
+    @validates_schema
+    def check_sequential_tiers(self, data, **kwargs):
+        """Verify that the sequential tiers partition the flex-model's sensors."""
+        if "sequential_tiers" not in data:
+            return data
+        if not data.get("sequential"):
+            raise FMValidationError(
+                "Sequential tiers can only be used with sequential scheduling.",
+                field_name="sequential-tiers",
+            )
+        tier_sensor_ids = [
+            sensor.id for tier in data["sequential_tiers"] for sensor in tier
+        ]
+        flex_model_sensor_ids = [
+            sensor_flex_model["sensor"].id
+            for sensor_flex_model in data.get("flex_model", [])
+            if sensor_flex_model.get("sensor") is not None
+        ]
+        if any(len(tier) == 0 for tier in data["sequential_tiers"]) or sorted(
+            tier_sensor_ids
+        ) != sorted(flex_model_sensor_ids):
+            raise FMValidationError(
+                "Sequential tiers should be non-empty, and list each sensor in the flex-model exactly once.",
+                field_name="sequential-tiers",
+            )
+        return data
+
 
 class ScheduleSignConvention:
     """Named constants for the three sign-convention modes of the get_schedule endpoint.
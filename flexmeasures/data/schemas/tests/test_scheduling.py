@@ -1820,6 +1820,43 @@ def test_db_flex_model_coupling_round_trips(app):
         schema.load({"coupling": "chp", "coupling-coefficient": 0})
 
 
+@pytest.mark.parametrize(
+    ["sequential", "tiers", "fails"],
+    [
+        # Each flex-model sensor in exactly one tier
+        (True, [[1, 2], [3]], False),
+        (True, [[3], [2], [1]], False),
+        # Tiers require sequential scheduling
+        (False, [[1, 2, 3]], True),
+        # A sensor is left out
+        (True, [[1, 2]], True),
+        # A sensor is listed twice
+        (True, [[1, 2], [2, 3]], True),
+        # An empty tier
+        (True, [[1, 2, 3], []], True),
+    ],
+)
+def test_asset_trigger_schema_sequential_tiers(app, sequential, tiers, fails):
+    """Sequential tiers should partition the flex-model's sensors."""
+    from types import SimpleNamespace
+
+    from flexmeasures.data.schemas.scheduling import AssetTriggerSchema
+
+    sensors = {i: SimpleNamespace(id=i) for i in (1, 2, 3)}
+    data = dict(
+        sequential=sequential,
+        sequential_tiers=[[sensors[i] for i in tier] for tier in tiers],
+        flex_model=[dict(sensor=sensor) for sensor in sensors.values()],
+    )
+    schema = AssetTriggerSchema()
+    if fails:
+        with pytest.raises(ValidationError) as e_info:
+            schema.check_sequential_tiers(data)
+        assert e_info.value.field_name == "sequential-tiers"
+    else:
+        schema.check_sequential_tiers(data)
+
+
 # Note: AssetTriggerSchema itself no longer aliases legacy field names (e.g.
 # force_new_job_creation) -- that's v3_0-specific backward compatibility,
 # layered on top by AssetTriggerSchemaV3 in flexmeasures/api/v3_0/assets.py,
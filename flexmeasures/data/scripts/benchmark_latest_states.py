@@ -0,0 +1,143 @@
+"""Benchmark looking up the current state of many sensors.
+
+Usage:
+
+    python flexmeasures/data/scripts/benchmark_latest_states.py --sensors 200 --events 5000
+
+The script adds sensors with measurements from two data sources, builds their latest beliefs (``refresh_latest_beliefs``,
+as the database migration does for existing data), and compares the median time of looking up their current state
+by searching each sensor's beliefs (``Sensor.latest_state``) with looking them up in one go (``Sensor.latest_states``).
+
+Nothing is committed: all synthetic data is rolled back afterwards.
+By default, the script runs against the database of the "testing" environment
+(see ``TestingConfig.SQLALCHEMY_DATABASE_URI``), creating its tables if needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import timedelta
+from statistics import median
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import insert
+
+REPS = 3
+
+
+def add_synthetic_sensors(db, n_sensors: int, n_events: int, seed: int = 0) -> list:
+    """Add an asset with the given number of 15-minute sensors, each with measurements from two sources."""
+    from flexmeasures.data.models.data_sources import DataSource
+    from flexmeasures.data.models.generic_assets import GenericAsset, GenericAssetType
+    from flexmeasures.data.models.time_series import Sensor, TimedBelief
+    from flexmeasures.data.services.utils import get_or_create_model
+
+    rng = np.random.default_rng(seed)
+    sources = [
+        get_or_create_model(DataSource, name="Benchmark meter", type="demo script"),
+        get_or_create_model(DataSource, name="Benchmark gateway", type="demo script"),
+    ]
+    asset = GenericAsset(
+        name="benchmark site",
+        generic_asset_type=get_or_create_model(GenericAssetType, name="building"),
+    )
+    sensors = [
+        Sensor(
+            name=f"power {i}",
+            generic_asset=asset,
+            unit="kW",
+            event_resolution=timedelta(minutes=15),
+        )
+        for i in range(n_sensors)
+    ]
+    db.session.add_all([asset] + sensors)
+    db.session.flush()
+
+    event_starts = pd.date_range(
+        "2025-01-01T00:00+00:00", periods=n_events, freq="15min"
+    )
+    for sensor in sensors:
+        db.session.execute(
+            insert(TimedBelief),
+            [
+                dict(
+                    sensor_id=sensor.id,
+                    source_id=source.id,
+                    event_start=event_start,
+                    belief_horizon=timedelta(0),
+                    cumulative_probability=0.5,
+                    event_value=value,
+                )
+                for source in sources
+                for event_start, value in zip(
+                    event_starts, rng.random(n_events).tolist()
+                )
+            ],
+        )
+    return sensors
+
+
+def timeit(fn, reps: int) -> float:
+    times = []
+    for _ in range(reps):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sensors", type=int, default=100, help="Number of sensors to look up."
+    )
+    parser.add_argument(
+        "--events", type=int, default=2000, help="Number of events per sensor."
+    )
+    parser.add_argument("--reps", type=int, default=REPS, help="Repetitions.")
+    parser.add_argument(
+        "--env",
+        default="testing",
+        help="FlexMeasures environment whose database to use (nothing is committed).",
+    )
+    args = parser.parse_args()
+
+    from flexmeasures.app import create as create_app
+    from flexmeasures.data import db
+    from flexmeasures.data.models.time_series import Sensor
+    from flexmeasures.data.services.latest_beliefs import refresh_latest_beliefs
+
+    app = create_app(env=args.env)
+    with app.app_context():
+        if args.env == "testing":
+            db.create_all()
+        try:
+            sensors = add_synthetic_sensors(db, args.sensors, args.events)
+            t0 = time.perf_counter()
+            refresh_latest_beliefs([sensor.id for sensor in sensors])
+            print(
+                f"Built the latest beliefs from {2 * args.sensors * args.events} beliefs in {time.perf_counter() - t0:.1f} s."
+            )
+            per_sensor = timeit(
+                lambda: [sensor.latest_state() for sensor in sensors], args.reps
+            )
+            bulk = timeit(lambda: Sensor.latest_states(sensors), args.reps)
+            print(
+                "{:<45} {:>10.1f} ms".format(
+                    "Sensor.latest_state (per sensor)", per_sensor * 1000
+                )
+            )
+            print(
+                "{:<45} {:>10.1f} ms".format(
+                    "Sensor.latest_states (one query)", bulk * 1000
+                )
+            )
+            print(f"Speed-up: {per_sensor / bulk:.0f}x")
+        finally:
+            db.session.rollback()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,387 @@
+"""Benchmark the StorageScheduler on synthetic fleets.
+
+Usage:
+
+    python flexmeasures/data/scripts/benchmark_scheduling.py --output scheduling_benchmark.json
+
+Each scenario describes a site with a number of batteries, EV chargers, heat pumps and inflexible loads.
+The script sets up that site (assets, sensors, prices and load profiles) in the database,
+schedules it with each of the given solver backends, and reports, per scenario and backend,
+the median time spent on preparing the scheduling problem, building the model, solving it and saving the schedules.
+
+Nothing is committed: all synthetic data (including the saved schedules) is rolled back afterwards.
+By default, the script runs against the database of the "testing" environment
+(see ``TestingConfig.SQLALCHEMY_DATABASE_URI``), creating its tables if needed,
+so only a local Postgres is required (Redis is replaced by a fake, as in the test suite).
+
+Run it on two branches and compare the JSON output to track performance regressions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import time
+from datetime import datetime, timedelta, timezone
+from statistics import median
+
+import numpy as np
+import pandas as pd
+import timely_beliefs as tb
+
+#: Device counts per scenario: (batteries, EV chargers, heat pumps, inflexible loads)
+SCENARIOS = {
+    "single-battery": (1, 0, 0, 0),
+    "home": (1, 1, 1, 1),
+    "small-business": (2, 5, 2, 2),
+    "charging-hub": (0, 20, 0, 2),
+    "mixed-site": (5, 20, 5, 5),
+}
+SOLVERS = ["highspy", "appsi_highs"]
+STAGES = ["deserialize", "prepare", "build", "solve", "postprocess", "save"]
+REPS = 3
+TIMING_NOTE = (
+    "For Pyomo-based solvers (anything but 'highspy'), the 'solve' timing includes"
+    " translating the Pyomo model into the solver's own form."
+)
+
+
+def add_synthetic_site(
+    db,
+    name: str,
+    n_batteries: int,
+    n_ev_chargers: int,
+    n_heat_pumps: int,
+    n_inflexible_loads: int,
+    start: datetime,
+    end: datetime,
+    resolution: timedelta,
+    seed: int = 0,
+):
+    """Add a site with the given devices (each as a child asset with a power sensor) to the session.
+
+    :returns: the site asset, and the flex-model and flex-context to schedule it with.
+    """
+    from flexmeasures.data.models.data_sources import DataSource
+    from flexmeasures.data.models.generic_assets import GenericAsset, GenericAssetType
+    from flexmeasures.data.models.time_series import Sensor, TimedBelief
+    from flexmeasures.data.services.utils import get_or_create_model
+
+    rng = np.random.default_rng(seed)
+    source = get_or_create_model(DataSource, name="Benchmark", type="demo script")
+    site = GenericAsset(
+        name=name,
+        generic_asset_type=get_or_create_model(GenericAssetType, name="building"),
+    )
+    db.session.add(site)
+
+    def add_device(asset_type: str, device_name: str) -> Sensor:
+        asset = GenericAsset(
+            name=device_name,
+            generic_asset_type=get_or_create_model(GenericAssetType, name=asset_type),
+            parent_asset=site,
+        )
+        sensor = Sensor(
+            name="power",
+            generic_asset=asset,
+            unit="kW",
+            event_resolution=resolution,
+        )
+        db.session.add_all([asset, sensor])
+        return sensor
+
+    belief_time = start - timedelta(days=1)
+    index = pd.date_range(start, end, freq=resolution, inclusive="left")
+    hours = np.asarray(index.hour + index.minute / 60)
+
+    # Day-ahead prices with a daily pattern and noise
+    price_sensor = Sensor(
+        name="day-ahead prices",
+        generic_asset=site,
+        unit="EUR/MWh",
+        event_resolution=timedelta(hours=1),
+    )
+    db.session.add(price_sensor)
+    price_index = pd.date_range(start, end, freq="1h", inclusive="left")
+    prices = (
+        60
+        + 30 * np.sin((np.asarray(price_index.hour) - 8) / 24 * 2 * np.pi)
+        + rng.normal(0, 10, len(price_index))
+    )
+    db.session.add_all(
+        TimedBelief(
+            sensor=price_sensor,
+            source=source,
+            event_start=dt,
+            belief_time=belief_time,
+            event_value=float(price),
+        )
+        for dt, price in zip(price_index, prices)
+    )
+
+    flex_model = []
+    site_capacity_kw = 0.0
+    for i in range(n_batteries):
+        sensor = add_device("battery", f"battery {i}")
+        flex_model.append(
+            {
+                "sensor": sensor,
+                "soc-at-start": f"{rng.uniform(20, 80):.1f} kWh",
+                "soc-min": "10 kWh",
+                "soc-max": "100 kWh",
+                "power-capacity": "50 kW",
+                "roundtrip-efficiency": "90%",
+            }
+        )
+        site_capacity_kw += 50
+    for i in range(n_ev_chargers):
+        sensor = add_device("one-way_evse", f"EV charger {i}")
+        target_time = start + timedelta(hours=int(rng.integers(6, 20)))
+        flex_model.append(
+            {
+                "sensor": sensor,
+                "soc-at-start": f"{rng.uniform(5, 25):.1f} kWh",
+                "soc-min": "0 kWh",
+                "soc-max": "60 kWh",
+                "soc-targets": [
+                    {
+                        "start": target_time.isoformat(),
+                        "duration": pd.Timedelta(resolution).isoformat(),
+                        "value": "50 kWh",
+                    }
+                ],
+                "power-capacity": "11 kW",
+                "production-capacity": "0 kW",
+            }
+        )
+        site_capacity_kw += 11
+    for i in range(n_heat_pumps):
+        sensor = add_device("heat-storage", f"heat pump {i}")
+        flex_model.append(
+            {
+                "sensor": sensor,
+                "soc-at-start": "10 kWh",
+                "soc-min": "0 kWh",
+                "soc-max": "20 kWh",
+                "soc-usage": [f"{rng.uniform(1, 3):.1f} kW"],
+                "storage-efficiency": "99.9%",
+                "power-capacity": "5 kW",
+                "production-capacity": "0 kW",
+            }
+        )
+        site_capacity_kw += 5
+
+    inflexible_consumption = []
+    for i in range(n_inflexible_loads):
+        sensor = add_device("building", f"inflexible load {i}")
+        sensor.attributes = dict(consumption_is_positive=True)
+        profile = (
+            15
+            + 10 * np.sin((hours - 12) / 24 * 2 * np.pi)
+            + rng.normal(0, 2, len(index))
+        )
+        db.session.add_all(
+            TimedBelief(
+                sensor=sensor,
+                source=source,
+                event_start=dt,
+                belief_time=belief_time,
+                event_value=float(value),
+            )
+            for dt, value in zip(index, profile)
+        )
+        inflexible_consumption.append(sensor)
+        site_capacity_kw += 25
+    db.session.flush()
+
+    # Resolve sensor objects to IDs now that they have one
+    for flex_model_d in flex_model:
+        flex_model_d["sensor"] = flex_model_d["sensor"].id
+    flex_context = {
+        "consumption-price": {"sensor": price_sensor.id},
+        "production-price": {"sensor": price_sensor.id},
+        # A tight connection, so that devices compete for capacity
+        "site-power-capacity": f"{0.6 * site_capacity_kw:.0f} kW",
+        "inflexible-consumption": [{"sensor": s.id} for s in inflexible_consumption],
+    }
+    return site, flex_model, flex_context
+
+
+def save_schedules(db, outputs: list[dict], belief_time: datetime) -> int:
+    """Save the scheduler outputs like make_schedule does, returning the number of beliefs saved."""
+    from flexmeasures.data.models.time_series import TimedBelief
+    from flexmeasures.data.utils import get_data_source, save_to_db
+
+    data_source = get_data_source(
+        data_source_name="Benchmark",
+        data_source_model="StorageScheduler",
+        data_source_type="scheduler",
+    )
+    n_beliefs = 0
+    for output in outputs:
+        if "sensor" not in output or not isinstance(output.get("data"), pd.Series):
+            continue
+        bdf = tb.BeliefsDataFrame(
+            [
+                TimedBelief(
+                    event_start=dt,
+                    belief_time=belief_time,
+                    event_value=value,
+                    sensor=output["sensor"],
+                    source=data_source,
+                )
+                for dt, value in output["data"].items()
+            ]
+        )
+        save_to_db(bdf)
+        n_beliefs += len(bdf)
+    return n_beliefs
+
+
+def run_scenario(
+    app,
+    db,
+    scenario: str,
+    solver: str,
+    horizon: timedelta,
+    resolution: timedelta,
+    reps: int = REPS,
+) -> dict:
+    """Schedule a freshly set up site ``reps`` times with the given solver, and report median stage timings."""
+    from flexmeasures.data.models.planning.storage import StorageScheduler
+
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    end = start + horizon
+    counts = SCENARIOS[scenario]
+    stage_times: dict[str, list[float]] = {stage: [] for stage in STAGES}
+    beliefs_saved = []
+    original_solver = app.config["FLEXMEASURES_LP_SOLVER"]
+    app.config["FLEXMEASURES_LP_SOLVER"] = solver
+    try:
+        for rep in range(reps):
+            savepoint = db.session.begin_nested()
+            site, flex_model, flex_context = add_synthetic_site(
+                db, f"{scenario} site", *counts, start, end, resolution, seed=rep
+            )
+            scheduler = StorageScheduler(
+                asset_or_sensor=site,
+                start=start,
+                end=end,
+                resolution=resolution,
+                belief_time=start,
+                flex_model=flex_model,
+                flex_context=flex_context,
+                return_multiple=True,
+            )
+            outputs = scheduler.compute()
+            for stage, seconds in scheduler.timings.items():
+                stage_times[stage].append(seconds)
+            save_start = time.perf_counter()
+            beliefs_saved.append(save_schedules(db, outputs, belief_time=start))
+            stage_times["save"].append(time.perf_counter() - save_start)
+            savepoint.rollback()
+    finally:
+        app.config["FLEXMEASURES_LP_SOLVER"] = original_solver
+
+    timings = {stage: median(times) for stage, times in stage_times.items() if times}
+    return dict(
+        scenario=scenario,
+        solver=solver,
+        batteries=counts[0],
+        ev_chargers=counts[1],
+        heat_pumps=counts[2],
+        inflexible_loads=counts[3],
+        timesteps=int(horizon / resolution),
+        beliefs_saved=beliefs_saved,  # per repetition
+        reps=reps,
+        timings=timings,
+        total=sum(timings.values()),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=SCENARIOS.keys(),
+        help="Scenario to run (repeat for several). Defaults to all scenarios.",
+    )
+    parser.add_argument(
+        "--solver",
+        action="append",
+        help=f"FLEXMEASURES_LP_SOLVER backend to run (repeat for several). Defaults to {SOLVERS}.",
+    )
+    parser.add_argument(
+        "--horizon", type=int, default=48, help="Scheduling horizon in hours."
+    )
+    parser.add_argument(
+        "--resolution", type=int, default=15, help="Scheduling resolution in minutes."
+    )
+    parser.add_argument(
+        "--reps", type=int, default=REPS, help="Repetitions per scenario and solver."
+    )
+    parser.add_argument(
+        "--env",
+        default="testing",
+        help="FlexMeasures environment whose database to use (nothing is committed).",
+    )
+    parser.add_argument("--output", help="Path to write the results to, as JSON.")
+    args = parser.parse_args()
+
+    from flexmeasures import __version__
+    from flexmeasures.app import create as create_app
+    from flexmeasures.data import db
+
+    app = create_app(env=args.env)
+    horizon = timedelta(hours=args.horizon)
+    resolution = timedelta(minutes=args.resolution)
+    results = []
+    with app.app_context():
+        if args.env == "testing":
+            db.create_all()
+        try:
+            print(
+                "{:<16} {:<12} ".format("scenario", "solver")
+                + " ".join("{:>11}".format(stage) for stage in STAGES + ["total"])
+            )
+            for scenario in args.scenario or SCENARIOS:
+                for solver in args.solver or SOLVERS:
+                    result = run_scenario(
+                        app, db, scenario, solver, horizon, resolution, args.reps
+                    )
+                    results.append(result)
+                    print(
+                        "{:<16} {:<12} ".format(scenario, solver)
+                        + " ".join(
+                            "{:>8.1f} ms".format(
+                                result["timings"].get(stage, float("nan")) * 1000
+                            )
+                            for stage in STAGES
+                        )
+                        + " {:>8.1f} ms".format(result["total"] * 1000)
+                    )
+        finally:
+            db.session.rollback()
+
+    report = dict(
+        flexmeasures_version=__version__,
+        python_version=platform.python_version(),
+        created_at=datetime.now(timezone.utc).isoformat(),
+        horizon=pd.Timedelta(horizon).isoformat(),
+        resolution=pd.Timedelta(resolution).isoformat(),
+        timing_unit="seconds",
+        timing_note=TIMING_NOTE,
+        results=results,
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote results to {args.output}.")
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
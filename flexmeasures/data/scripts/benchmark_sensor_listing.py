@@ -0,0 +1,190 @@
+"""Benchmark listing many sensors through the API, page by page.
+
+Usage:
+
+    python flexmeasures/data/scripts/benchmark_sensor_listing.py --sensors 100000 --per-page 100
+
+The script adds an account with many sensors, and requests pages at increasing depths from ``GET /api/v3_0/sensors``,
+once paginating with ``page`` (offset pagination) and once with ``after`` (keyset pagination).
+It reports the median latency per depth, checks that keyset pagination stays flat across pages,
+and times streaming all sensors with ``format=ndjson``.
+
+The synthetic data has to be committed (every API request updates when its user was last seen),
+so it is deleted again afterwards. By default, the script runs against the database of the "testing" environment
+(see ``TestingConfig.SQLALCHEMY_DATABASE_URI``), creating its tables if needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import timedelta
+from statistics import median
+
+from sqlalchemy import delete, insert, select
+
+REPS = 3
+MAX_RATIO = 3
+ACCOUNT_NAME = "Benchmark account"
+
+
+def add_synthetic_sensors(db, n_sensors: int):
+    """Add an account with a user and an asset, holding the given number of sensors."""
+    from flexmeasures.data.models.generic_assets import GenericAsset, GenericAssetType
+    from flexmeasures.data.models.time_series import Sensor
+    from flexmeasures.data.services.users import create_user
+    from flexmeasures.data.services.utils import get_or_create_model
+
+    user = create_user(
+        email="benchmark@seita.nl",
+        password="benchmark",
+        username="Benchmark user",
+        account_name=ACCOUNT_NAME,
+        check_email_deliverability=False,
+    )
+    asset = GenericAsset(
+        name="benchmark site",
+        generic_asset_type=get_or_create_model(GenericAssetType, name="building"),
+        owner=user.account,
+    )
+    db.session.add(asset)
+    db.session.flush()
+    db.session.execute(
+        insert(Sensor),
+        [
+            dict(
+                name=f"power {i}",
+                generic_asset_id=asset.id,
+                unit="kW",
+                event_resolution=timedelta(minutes=15),
+                attributes={},
+            )
+            for i in range(n_sensors)
+        ],
+    )
+    sensor_ids = db.session.scalars(
+        select(Sensor.id)
+        .filter(Sensor.generic_asset_id == asset.id)
+        .order_by(Sensor.id)
+    ).all()
+    db.session.commit()
+    return user, sensor_ids
+
+
+def remove_synthetic_sensors(db):
+    """Delete the account added by ``add_synthetic_sensors``, with its user, asset and sensors."""
+    from flexmeasures.data.models.data_sources import DataSource
+    from flexmeasures.data.models.generic_assets import GenericAsset
+    from flexmeasures.data.models.time_series import Sensor
+    from flexmeasures.data.models.user import Account, User
+    from flexmeasures.data.services.users import delete_user
+
+    db.session.rollback()
+    account = db.session.scalar(select(Account).filter_by(name=ACCOUNT_NAME))
+    if account is None:
+        return
+    asset_ids = select(GenericAsset.id).filter_by(account_id=account.id)
+    db.session.execute(delete(Sensor).filter(Sensor.generic_asset_id.in_(asset_ids)))
+    db.session.execute(delete(GenericAsset).filter_by(account_id=account.id))
+    for user in db.session.scalars(select(User).filter_by(account_id=account.id)):
+        db.session.execute(delete(DataSource).filter_by(user_id=user.id))
+        delete_user(user)
+    db.session.execute(delete(Account).filter_by(id=account.id))
+    db.session.commit()
+
+
+def request(app, user, query_string: dict):
+    """Let the app handle a request, within the script's database session (so it sees the uncommitted sensors)."""
+    with app.test_request_context(
+        "/api/v3_0/sensors",
+        query_string=query_string,
+        headers={
+            app.config["SECURITY_TOKEN_AUTHENTICATION_HEADER"]: user.get_auth_token()
+        },
+    ):
+        response = app.full_dispatch_request()
+        body = response.get_data()
+        assert response.status_code == 200, body
+        return body
+
+
+def timeit(fn, reps: int) -> float:
+    times = []
+    for _ in range(reps):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sensors", type=int, default=100_000, help="Number of sensors to list."
+    )
+    parser.add_argument("--per-page", type=int, default=100, help="Page size.")
+    parser.add_argument("--reps", type=int, default=REPS, help="Repetitions.")
+    parser.add_argument(
+        "--max-ratio",
+        type=float,
+        default=MAX_RATIO,
+        help="Fail if the deepest keyset page is this many times slower than the first one.",
+    )
+    parser.add_argument(
+        "--env",
+        default="testing",
+        help="FlexMeasures environment whose database to use.",
+    )
+    args = parser.parse_args()
+
+    from flexmeasures.app import create as create_app
+    from flexmeasures.data import db
+
+    app = create_app(env=args.env)
+    with app.app_context():
+        if args.env == "testing":
+            db.create_all()
+        remove_synthetic_sensors(db)  # left over from an interrupted run
+        try:
+            user, sensor_ids = add_synthetic_sensors(db, args.sensors)
+            n_pages = len(sensor_ids) // args.per_page
+            pages = sorted({1} | {p for p in (10, 100, 1000, n_pages) if p <= n_pages})
+            print(f"{'page':>8} {'page=…':>12} {'after=…':>12}")
+            keyset_times = []
+            for page in pages:
+                offset = timeit(
+                    lambda: request(
+                        app, user, {"page": page, "per-page": args.per_page}
+                    ),
+                    args.reps,
+                )
+                # The cursor of a page is the last ID on the page before it
+                cursor = sensor_ids[(page - 1) * args.per_page - 1] if page > 1 else 0
+                keyset = timeit(
+                    lambda: request(
+                        app, user, {"after": cursor, "per-page": args.per_page}
+                    ),
+                    args.reps,
+                )
+                keyset_times.append(keyset)
+                print(f"{page:>8} {offset * 1000:>9.1f} ms {keyset * 1000:>9.1f} ms")
+
+            t0 = time.perf_counter()
+            n_streamed = request(app, user, {"format": "ndjson"}).count(b"\n")
+            print(
+                f"Streamed {n_streamed} sensors as NDJSON in {time.perf_counter() - t0:.2f} s."
+            )
+
+            ratio = keyset_times[-1] / keyset_times[0]
+            print(f"Deepest vs first keyset page: {ratio:.1f}x")
+            if ratio > args.max_ratio:
+                sys.exit(
+                    f"Keyset pagination got slower across pages ({ratio:.1f}x > {args.max_ratio}x)."
+                )
+        finally:
+            remove_synthetic_sensors(db)
+
+
+if __name__ == "__main__":
+    main()
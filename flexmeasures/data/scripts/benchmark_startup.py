@@ -0,0 +1,174 @@
+"""Benchmark the startup time of the FlexMeasures CLI, web server and workers.
+
+Usage:
+
+    python flexmeasures/data/scripts/benchmark_startup.py --output startup_benchmark.json
+
+Each target is started in a fresh Python process with ``-X importtime``:
+
+- ``cli-help``: running ``flexmeasures --help``,
+- ``web``: creating the app, which is what a gunicorn worker does when loading ``wsgi.py``,
+- ``worker``: creating the app and importing the data generators used by jobs on all queues,
+  which is what ``flexmeasures jobs run-worker`` does before it starts working.
+
+The script reports, per target, the median wall time of the process, the time spent on imports,
+the slowest top-level imports and which of a set of heavy optional dependencies were imported.
+Run it on two branches and compare the JSON output to track startup regressions.
+By default, the app is created for the "testing" environment, so no database connection or Redis is required.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from statistics import median
+
+TARGETS = {
+    "cli-help": (
+        "import sys\n"
+        "sys.argv = ['flexmeasures', '--help']\n"
+        "from flexmeasures.utils.app_utils import flexmeasures_cli\n"
+        "try:\n"
+        "    flexmeasures_cli()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+    ),
+    "web": ("from flexmeasures.app import create\n" "create()\n"),
+    "worker": (
+        "from flexmeasures.app import create\n"
+        "app = create()\n"
+        "with app.app_context():\n"
+        "    from flexmeasures.cli.jobs import preload_data_generators\n"
+        "    preload_data_generators(list(app.queues.values()))\n"
+    ),
+}
+HEAVY_DEPENDENCIES = [
+    "darts",
+    "highspy",
+    "lightgbm",
+    "pyomo",
+    "sklearn",
+    "statsmodels",
+    "torch",
+]
+REPS = 3
+TOP = 10
+
+
+def parse_importtime(stderr: str) -> list[tuple[int, str, int]]:
+    """Parse the output of ``-X importtime`` into (depth, module, cumulative microseconds) tuples."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _self_time, cumulative_time, module = line[len("import time:") :].split("|")
+        depth = (len(module) - len(module.lstrip())) // 2
+        imports.append((depth, module.strip(), int(cumulative_time)))
+    return imports
+
+
+def run_target(target: str, env: str) -> dict:
+    """Start the target once, and return its wall time and import statistics."""
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", TARGETS[target]],
+        env={**os.environ, "FLEXMEASURES_ENV": env},
+        capture_output=True,
+        text=True,
+    )
+    wall_time = time.perf_counter() - start
+    if process.returncode != 0:
+        raise RuntimeError(f"Starting {target} failed:\n{process.stderr[-2000:]}")
+    imports = parse_importtime(process.stderr)
+    top_level_imports = [(module, us) for depth, module, us in imports if depth == 0]
+    imported_modules = {module for _, module, _ in imports}
+    return dict(
+        wall_time=wall_time,
+        import_time=sum(us for _, us in top_level_imports) / 10**6,
+        modules_imported=len(imported_modules),
+        heavy_dependencies_imported=[
+            dependency
+            for dependency in HEAVY_DEPENDENCIES
+            if dependency in imported_modules
+        ],
+        slowest_imports={
+            module: us / 10**6
+            for module, us in sorted(top_level_imports, key=lambda x: -x[1])[:TOP]
+        },
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--target",
+        action="append",
+        choices=TARGETS.keys(),
+        help="Target to start (repeat for several). Defaults to all targets.",
+    )
+    parser.add_argument(
+        "--reps", type=int, default=REPS, help="Repetitions per target."
+    )
+    parser.add_argument(
+        "--env",
+        default="testing",
+        help="FlexMeasures environment to create the app for.",
+    )
+    parser.add_argument("--output", help="Path to write the results to, as JSON.")
+    args = parser.parse_args()
+
+    from flexmeasures import __version__
+
+    results = []
+    print(
+        "{:<10} {:>11} {:>11} {:>8}  {}".format(
+            "target", "wall time", "imports", "modules", "heavy dependencies"
+        )
+    )
+    for target in args.target or TARGETS:
+        # Warm up (e.g. to write bytecode caches), then measure
+        run_target(target, args.env)
+        runs = [run_target(target, args.env) for _ in range(args.reps)]
+        result = dict(
+            target=target,
+            reps=args.reps,
+            wall_time=median(run["wall_time"] for run in runs),
+            import_time=median(run["import_time"] for run in runs),
+            modules_imported=runs[-1]["modules_imported"],
+            heavy_dependencies_imported=runs[-1]["heavy_dependencies_imported"],
+            slowest_imports=runs[-1]["slowest_imports"],
+        )
+        results.append(result)
+        print(
+            "{:<10} {:>8.2f} s {:>8.2f} s {:>8}  {}".format(
+                target,
+                result["wall_time"],
+                result["import_time"],
+                result["modules_imported"],
+                ", ".join(result["heavy_dependencies_imported"]) or "-",
+            )
+        )
+
+    report = dict(
+        flexmeasures_version=__version__,
+        python_version=platform.python_version(),
+        created_at=datetime.now(timezone.utc).isoformat(),
+        timing_unit="seconds",
+        results=results,
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote results to {args.output}.")
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
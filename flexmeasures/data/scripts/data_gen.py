@@ -15,6 +15,7 @@ from flexmeasures.data.models.time_series import Sensor, TimedBelief
 from flexmeasures.data.models.generic_assets import GenericAssetType, GenericAsset
 from flexmeasures.data.models.data_sources import DataSource
 from flexmeasures.data.models.user import User, Role, AccountRole
+from flexmeasures.data.services.latest_beliefs import refresh_latest_beliefs
 from flexmeasures.data.transactional import as_transaction
 from flexmeasures.cli.utils import MsgStyle
 from flexmeasures.data.utils import TEMPLATE_COPY_GUIDANCE_PREFIX
@@ -424,6 +425,7 @@ def depopulate_measurements(
         query = query.filter(TimedBelief.sensor_id == sensor.id)
     deletion_result = db.session.execute(query)
     num_measurements_deleted = deletion_result.rowcount
+    refresh_latest_beliefs([sensor.id] if sensor is not None else None)
 
     click.echo("Deleted %d measurements (ex-post beliefs)" % num_measurements_deleted)
 
@@ -5,6 +5,9 @@ Logic around data ingestion (jobs)
 from __future__ import annotations
 
 from io import BytesIO
+import os
+import tempfile
+import uuid
 
 from flask import current_app
 from rq.job import Job
@@ -47,9 +50,48 @@ def _load_json_sensor_data(
     return PostSensorDataSchema(source_user=user).load(payload)["bdf"]
 
 
+def get_upload_staging_dir() -> str:
+    """Return the directory to spool uploaded files to, creating it if needed."""
+    staging_dir = current_app.config.get("FLEXMEASURES_UPLOAD_STAGING_DIR") or (
+        os.path.join(tempfile.gettempdir(), "flexmeasures-uploads")
+    )
+    os.makedirs(staging_dir, exist_ok=True)
+    return staging_dir
+
+
+def stage_uploaded_file(file: FileStorage) -> dict:
+    """Spool an uploaded file to the staging directory.
+
+    Returns a reference to the staged file, to pass to an ingestion job instead of the file contents,
+    so the contents do not need to pass through Redis.
+    """
+    _, extension = os.path.splitext(file.filename or "")
+    path = os.path.join(get_upload_staging_dir(), f"{uuid.uuid4().hex}{extension}")
+    file.save(path)  # copies the file in chunks
+    return dict(
+        filename=file.filename,
+        content_type=file.content_type,
+        path=path,
+    )
+
+
+def remove_staged_files(uploaded_files: list[dict]):
+    """Remove the staged files referenced by the given file payloads, if they (still) exist."""
+    for file_payload in uploaded_files:
+        if "path" in file_payload:
+            try:
+                os.remove(file_payload["path"])
+            except FileNotFoundError:
+                pass
+
+
 def _file_storage_from_payload(file_payload: dict) -> FileStorage:
-    stream = BytesIO(file_payload["content"])
-    stream.name = file_payload["filename"]
+    """Open a staged file, or wrap file contents passed directly (e.g. by jobs queued before staging was introduced)."""
+    if "path" in file_payload:
+        stream = open(file_payload["path"], "rb")
+    else:
+        stream = BytesIO(file_payload["content"])
+        stream.name = file_payload["filename"]
     return FileStorage(
         stream=stream,
         filename=file_payload["filename"],
@@ -63,17 +105,27 @@ def _load_uploaded_sensor_data(
     uploaded_files: list[dict],
     upload_data: dict,
 ) -> list[tb.BeliefsDataFrame]:
-    """Validate and transform raw uploaded files into BeliefsDataFrames."""
+    """Validate and transform uploaded files into BeliefsDataFrames.
+
+    Staged files are parsed straight from disk, so their contents are never held in memory as a whole,
+    and removed afterwards (also if they turn out to be invalid).
+    """
 
     from flexmeasures.data.schemas.sensors import SensorDataFileSchema
 
     _sensor, user = _get_ingestion_context(sensor_id, user_id)
     payload = dict(upload_data)
     payload["id"] = sensor_id
-    payload["uploaded-files"] = [
+    files = [
         _file_storage_from_payload(file_payload) for file_payload in uploaded_files
     ]
-    return SensorDataFileSchema(source_user=user).load(payload)["data"]
+    payload["uploaded-files"] = files
+    try:
+        return SensorDataFileSchema(source_user=user).load(payload)["data"]
+    finally:
+        for file in files:
+            file.close()
+        remove_staged_files(uploaded_files)
 
 
 def add_beliefs_to_db_and_enqueue_forecasting_jobs(
@@ -96,7 +148,8 @@ def add_beliefs_to_db_and_enqueue_forecasting_jobs(
     :param sensor_id:                   Sensor ID for raw JSON or file ingestion.
     :param user_id:                     User ID used to resolve the source of raw ingested data.
     :param sensor_data:                 Raw JSON payload from the sensor data endpoint.
-    :param uploaded_files:              Uploaded file contents and metadata.
+    :param uploaded_files:              Uploaded file metadata and references to staged files (see ``stage_uploaded_file``),
+                                        which are removed once loaded.
     :param upload_data:                 Raw form payload from the sensor data upload endpoint.
     :param forecasting_jobs:            Optional list of forecasting Jobs to enqueue after saving.
     :param forecasting_job_ids:         Optional list of forecasting Job ids to enqueue after saving.
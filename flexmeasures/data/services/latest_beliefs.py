@@ -0,0 +1,247 @@
+"""Logic around the latest belief per sensor and data source, which represents the current state of a sensor.
+
+Looking up the current state of a sensor (see ``Sensor.latest_state``) searches the sensor's beliefs for the most recent event,
+which gets expensive for dashboards showing the current state of many sensors.
+Instead, ``save_to_db`` keeps track of the latest belief per sensor and source in the ``sensor_latest_belief`` table,
+so that ``Sensor.latest_states`` can look up the current state of many sensors in a single indexed query.
+After deleting beliefs, the affected rows are refreshed from the remaining beliefs (see ``refresh_latest_beliefs``).
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+
+import pandas as pd
+import timely_beliefs as tb
+from sqlalchemy import and_, delete, func, insert, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from flexmeasures.data import db
+from flexmeasures.data.models.data_sources import DataSource
+from flexmeasures.data.models.latest_beliefs import SensorLatestBelief
+from flexmeasures.data.models.time_series import Sensor, TimedBelief
+
+LATEST_BELIEF_COLUMNS = [
+    "sensor_id",
+    "source_id",
+    "event_start",
+    "belief_horizon",
+    "cumulative_probability",
+    "event_value",
+]
+
+
+def _select_latest(df: pd.DataFrame) -> pd.DataFrame:
+    """Select the latest ex-post belief per sensor and source.
+
+    That is, of the beliefs formed after knowledge time, the belief about the latest event, formed most recently,
+    and (for probabilistic beliefs) the one closest to the median.
+    """
+    df = df[df["belief_horizon"] <= timedelta(0)]
+    median_distance = (df["cumulative_probability"] - 0.5).abs()
+    df = df.assign(median_distance=median_distance).sort_values(
+        ["event_start", "belief_horizon", "median_distance"],
+        ascending=[False, True, True],
+    )
+    return df.drop_duplicates(["sensor_id", "source_id"]).drop(
+        columns="median_distance"
+    )
+
+
+def select_latest_beliefs(bdf: tb.BeliefsDataFrame) -> pd.DataFrame:
+    """Select the candidates for the latest belief per data source, from beliefs about to be saved.
+
+    Data sources may not have an ID yet, so the selected beliefs reference the data source itself
+    (under "source_id"), until they are passed to ``update_latest_beliefs``.
+    """
+    df = pd.DataFrame(
+        dict(
+            sensor_id=bdf.sensor.id,
+            source_id=bdf.index.get_level_values("source"),
+            event_start=pd.DatetimeIndex(bdf.event_starts).tz_convert("UTC"),
+            belief_horizon=bdf.belief_horizons,
+            cumulative_probability=bdf.index.get_level_values("cumulative_probability"),
+            event_value=bdf["event_value"].values,
+        )
+    )
+    return _select_latest(df)
+
+
+def update_latest_beliefs(candidates: list[pd.DataFrame]):
+    """Update the latest belief per sensor and data source with the given candidates (see ``select_latest_beliefs``).
+
+    A candidate only replaces the stored latest belief if it is about a later event,
+    or about the same event and formed more recently (or closer to the median).
+    Does not commit.
+    """
+    candidates = [df for df in candidates if not df.empty]
+    if not candidates:
+        return
+    df = pd.concat(candidates)
+    df["source_id"] = df["source_id"].map(
+        lambda source: source.id if isinstance(source, DataSource) else source
+    )
+    df = _select_latest(df)
+
+    stmt = pg_insert(SensorLatestBelief).values(
+        [
+            dict(
+                sensor_id=int(row.sensor_id),
+                source_id=int(row.source_id),
+                event_start=row.event_start.to_pydatetime(),
+                belief_horizon=row.belief_horizon.to_pytimedelta(),
+                cumulative_probability=float(row.cumulative_probability),
+                event_value=float(row.event_value),
+            )
+            for row in df.itertuples()
+        ]
+    )
+    stored, new = SensorLatestBelief.__table__.c, stmt.excluded
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[stored.sensor_id, stored.source_id],
+        set_={
+            column: new[column]
+            for column in LATEST_BELIEF_COLUMNS
+            if column not in ("sensor_id", "source_id")
+        },
+        where=or_(
+            new.event_start > stored.event_start,
+            and_(
+                new.event_start == stored.event_start,
+                new.belief_horizon < stored.belief_horizon,
+            ),
+            and_(
+                new.event_start == stored.event_start,
+                new.belief_horizon == stored.belief_horizon,
+                func.abs(new.cumulative_probability - 0.5)
+                <= func.abs(stored.cumulative_probability - 0.5),
+            ),
+        ),
+    )
+    db.session.execute(stmt)
+
+
+def refresh_latest_beliefs(sensor_ids: list[int] | None = None):
+    """Recompute the latest belief per data source of the given sensors (or of all sensors) from their beliefs.
+
+    Use this after deleting beliefs, or after adding beliefs without using ``save_to_db``.
+    Does not commit.
+    """
+    query = delete(SensorLatestBelief)
+    if sensor_ids is not None:
+        if not sensor_ids:
+            return
+        query = query.filter(SensorLatestBelief.sensor_id.in_(sensor_ids))
+    db.session.execute(query)
+
+    latest_beliefs = (
+        select(
+            TimedBelief.sensor_id,
+            TimedBelief.source_id,
+            TimedBelief.event_start,
+            TimedBelief.belief_horizon,
+            TimedBelief.cumulative_probability,
+            TimedBelief.event_value,
+        )
+        .distinct(TimedBelief.sensor_id, TimedBelief.source_id)
+        .filter(TimedBelief.belief_horizon <= timedelta(0))
+        .order_by(
+            TimedBelief.sensor_id,
+            TimedBelief.source_id,
+            TimedBelief.event_start.desc(),
+            TimedBelief.belief_horizon,
+            func.abs(TimedBelief.cumulative_probability - 0.5),
+        )
+    )
+    if sensor_ids is not None:
+        latest_beliefs = latest_beliefs.filter(TimedBelief.sensor_id.in_(sensor_ids))
+    db.session.execute(
+        insert(SensorLatestBelief).from_select(LATEST_BELIEF_COLUMNS, latest_beliefs)
+    )
+
+
+def _knowledge_horizon_kind(sensor: Sensor) -> tuple:
+    """Sensors of the same kind share the knowledge times of their events."""
+    return (
+        sensor.knowledge_horizon_fnc,
+        json.dumps(sensor.knowledge_horizon_par, sort_keys=True),
+        sensor.event_resolution,
+    )
+
+
+def search_latest_beliefs(
+    sensors: list[Sensor],
+    sources: list[DataSource] | None = None,
+) -> pd.DataFrame:
+    """Look up the latest belief per data source of each of the given sensors, in a single query.
+
+    :param sensors: The sensors whose current state to look up.
+    :param sources: Only look up beliefs from these data sources.
+    :returns:       DataFrame with one row per sensor and data source, with columns
+                    "sensor_id", "source", "event_start", "belief_time", "cumulative_probability" and "event_value"
+                    (ordered like the given sensors, and with datetimes in UTC).
+    """
+    query = (
+        select(
+            SensorLatestBelief.sensor_id,
+            DataSource,
+            SensorLatestBelief.event_start,
+            SensorLatestBelief.belief_horizon,
+            SensorLatestBelief.cumulative_probability,
+            SensorLatestBelief.event_value,
+        )
+        .join(DataSource, DataSource.id == SensorLatestBelief.source_id)
+        .filter(SensorLatestBelief.sensor_id.in_([sensor.id for sensor in sensors]))
+        .order_by(SensorLatestBelief.sensor_id, SensorLatestBelief.source_id)
+    )
+    if sources is not None:
+        query = query.filter(
+            SensorLatestBelief.source_id.in_([source.id for source in sources])
+        )
+    df = pd.DataFrame(
+        db.session.execute(query).all(),
+        columns=[
+            "sensor_id",
+            "source",
+            "event_start",
+            "belief_horizon",
+            "cumulative_probability",
+            "event_value",
+        ],
+    )
+    df["event_start"] = pd.to_datetime(df["event_start"], utc=True)
+    df["belief_horizon"] = pd.to_timedelta(df["belief_horizon"])
+
+    # Order like the given sensors
+    sensors_by_id = {sensor.id: sensor for sensor in sensors}
+    order = {sensor.id: i for i, sensor in enumerate(sensors)}
+    df = df.sort_values(
+        "sensor_id", key=lambda ids: ids.map(order), kind="stable"
+    ).reset_index(drop=True)
+
+    # Derive belief times from the knowledge times of the events, in one go per kind of knowledge horizon
+    belief_times = pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns, UTC]")
+    rows_per_kind = {}
+    for row, sensor_id in enumerate(df["sensor_id"]):
+        kind = _knowledge_horizon_kind(sensors_by_id[sensor_id])
+        rows_per_kind.setdefault(kind, []).append(row)
+    for rows in rows_per_kind.values():
+        sensor = sensors_by_id[df["sensor_id"].iloc[rows[0]]]
+        knowledge_times = sensor.knowledge_time(
+            pd.DatetimeIndex(df["event_start"].iloc[rows])
+        )
+        belief_times.iloc[rows] = knowledge_times - pd.TimedeltaIndex(
+            df["belief_horizon"].iloc[rows]
+        )
+    df["belief_time"] = belief_times
+    return df[
+        [
+            "sensor_id",
+            "source",
+            "event_start",
+            "belief_time",
+            "cumulative_probability",
+            "event_value",
+        ]
+    ]
@@ -0,0 +1,182 @@
+"""Logic around the incremental recomputation of reports, whenever new data arrives for their input sensors.
+
+Reports are registered with their input sensors (see ``ReportDependency``),
+e.g. by running ``flexmeasures add report`` with the ``--recompute-on-new-data`` flag.
+When ``save_to_db`` stores new beliefs for an input sensor, we look up the dependent reports,
+and, once the transaction is committed, queue jobs on the reporting queue to recompute them,
+but only for the time window affected by the new data (widened to whole events of the output sensors).
+Reports that serve as input to other reports trigger their recomputation in turn.
+"""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from datetime import datetime, timedelta
+
+import pandas as pd
+from flask import current_app, has_app_context
+from rq.job import Job
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from flexmeasures.data import db
+from flexmeasures.data.models.data_sources import DataSource
+from flexmeasures.data.models.report_dependencies import ReportDependency
+from flexmeasures.data.models.time_series import Sensor
+
+PENDING_REPORTS_KEY = "pending_report_windows"
+
+
+def get_report_sensor_ids(parameters: dict) -> tuple[list[int], list[int]]:
+    """Return the IDs of the input and output sensors in the (serialized) parameters of a report,
+    which may describe a single report or a batch of them.
+    """
+    entries = parameters.get("batch", []) + [
+        dict(input=parameters.get("input", []), output=parameters.get("output", []))
+    ]
+    input_ids, output_ids = [], []
+    for entry in entries:
+        for input_description in entry["input"]:
+            if input_description["sensor"] not in input_ids:
+                input_ids.append(input_description["sensor"])
+        for output_description in entry["output"]:
+            if output_description["sensor"] not in output_ids:
+                output_ids.append(output_description["sensor"])
+    return input_ids, output_ids
+
+
+def register_report_dependencies(source: DataSource) -> list[int]:
+    """Register the input sensors of the report computed by the given reporter data source.
+
+    The data source should store the report's parameters (i.e. the reporter was created with ``save_parameters=True``).
+    Reports that list their own output sensor as input are refused, as they would keep triggering themselves.
+
+    :returns: the IDs of the input sensors
+    """
+    parameters = source.attributes.get("data_generator", {}).get("parameters")
+    if not parameters:
+        raise ValueError(
+            f"Data source {source} does not store the parameters of its report, so its dependencies are unknown."
+        )
+    input_ids, output_ids = get_report_sensor_ids(parameters)
+    if set(input_ids) & set(output_ids):
+        raise ValueError(
+            f"The report of data source {source} uses its own output as input, so it cannot be recomputed on new data."
+        )
+    registered_ids = db.session.scalars(
+        select(ReportDependency.sensor_id).filter(
+            ReportDependency.source_id == source.id
+        )
+    ).all()
+    db.session.add_all(
+        [
+            ReportDependency(sensor_id=sensor_id, source_id=source.id)
+            for sensor_id in input_ids
+            if sensor_id not in registered_ids
+        ]
+    )
+    return input_ids
+
+
+def schedule_dependent_reports(windows: list[tuple[Sensor, datetime, datetime]]):
+    """Look up the reports depending on sensors for which new data was saved,
+    and keep track of the time windows for which to recompute them, until the session is committed.
+
+    :param windows: list of sensors with the first and last event start of their new data
+    """
+    windows = {sensor.id: (sensor, start, end) for sensor, start, end in windows}
+    if not windows:
+        return
+    dependencies = db.session.execute(
+        select(ReportDependency.sensor_id, ReportDependency.source_id).filter(
+            ReportDependency.sensor_id.in_(windows.keys())
+        )
+    ).all()
+    pending = db.session.info.setdefault(PENDING_REPORTS_KEY, {})
+    for sensor_id, source_id in dependencies:
+        sensor, start, last = windows[sensor_id]
+        end = last + sensor.event_resolution
+        if source_id in pending:
+            pending_start, pending_end = pending[source_id]
+            start, end = min(start, pending_start), max(end, pending_end)
+        pending[source_id] = (start, end)
+
+
+@event.listens_for(Session, "after_commit")
+def _queue_pending_reports(session: Session):
+    """Queue the recomputation of reports whose input data changed in the committed transaction."""
+    pending = session.info.pop(PENDING_REPORTS_KEY, {})
+    if not pending or not has_app_context():
+        return
+    for source_id, (start, end) in pending.items():
+        create_report_job(source_id, start, end)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_reports(session: Session):
+    session.info.pop(PENDING_REPORTS_KEY, None)
+
+
+def create_report_job(source_id: int, start: datetime, end: datetime) -> Job:
+    """Queue a job to recompute the report of the given reporter data source, for the given time window."""
+    return current_app.queues["reporting"].enqueue(
+        compute_report,
+        source_id=source_id,
+        start=pd.Timestamp(start).isoformat(),
+        end=pd.Timestamp(end).isoformat(),
+        ttl=int(
+            current_app.config.get(
+                "FLEXMEASURES_JOB_TTL", timedelta(-1)
+            ).total_seconds()
+        ),
+    )
+
+
+def align_window_with_sensors(
+    start: datetime, end: datetime, sensors: list[Sensor]
+) -> tuple[pd.Timestamp, pd.Timestamp]:
+    """Widen the window to cover whole events of each of the given sensors (in their own timezone)."""
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    for sensor in sensors:
+        if sensor.event_resolution == timedelta(0):
+            continue
+        kwargs = dict(freq=sensor.event_resolution, nonexistent="shift_forward")
+        start = start.tz_convert(sensor.timezone).floor(ambiguous=True, **kwargs)
+        end = end.tz_convert(sensor.timezone).ceil(ambiguous=False, **kwargs)
+    return start, end
+
+
+def compute_report(source_id: int, start: str, end: str) -> int:
+    """Recompute the report of the given reporter data source for the given time window, and save the results.
+
+    This is the job function run by workers on the reporting queue.
+    The window is widened to cover whole events of the report's output sensors,
+    e.g. new hourly data leads to recomputing the whole day for a daily report.
+
+    :returns: the number of results saved
+    """
+    from flexmeasures.data.utils import save_to_db
+
+    source = db.session.get(DataSource, source_id)
+    if source is None:
+        raise ValueError(f"Data source {source_id} does not exist.")
+    parameters = deepcopy(source.attributes["data_generator"]["parameters"])
+    _, output_ids = get_report_sensor_ids(parameters)
+    output_sensors = db.session.scalars(
+        select(Sensor).filter(Sensor.id.in_(output_ids))
+    ).all()
+    start, end = align_window_with_sensors(
+        pd.Timestamp(start), pd.Timestamp(end), output_sensors
+    )
+    current_app.logger.info(
+        f"Recomputing the report of data source {source_id} from {start} until {end}."
+    )
+
+    # Passing all parameters overwrites any parameters of an earlier computation
+    reporter = source.data_generator
+    results = reporter.compute(
+        parameters=dict(parameters, start=start.isoformat(), end=end.isoformat())
+    )
+    save_to_db([result["data"] for result in results])
+    db.session.commit()
+    return len(results)
@@ -0,0 +1,124 @@
+"""Logic around retention policies, which thin out or drop old sensor data.
+
+Most beliefs in a long-running database are superseded forecasts and schedules, with many belief times per event.
+Retention policies, configured with ``FLEXMEASURES_RETENTION_POLICIES`` (or per sensor, with its ``retention-policies`` attribute),
+describe which of these may be deleted once the events they are about lie far enough in the past.
+They are applied with ``flexmeasures delete beliefs-past-retention``, in batches that are each committed right away.
+Each policy only ever selects beliefs that are superseded or summarized by beliefs it keeps,
+so an interrupted run can simply be resumed by running it again.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterator
+
+from flask import current_app
+import sqlalchemy as sa
+from sqlalchemy.orm import aliased
+
+from flexmeasures.data import db
+from flexmeasures.data.models.data_sources import DataSource
+from flexmeasures.data.models.rollups import TimedBeliefRollup
+from flexmeasures.data.models.time_series import Sensor, TimedBelief
+from flexmeasures.data.schemas.retention import RetentionPolicySchema
+from flexmeasures.data.schemas.times import DurationField
+from flexmeasures.data.services.sensors import delete_beliefs_in_batches
+from flexmeasures.utils.time_utils import server_now
+
+
+def get_retention_policies(sensor: Sensor) -> list[dict]:
+    """Return the (deserialized) retention policies that apply to the given sensor.
+
+    The sensor's own ``retention-policies`` attribute takes precedence over the ``FLEXMEASURES_RETENTION_POLICIES`` setting.
+    Policies from the setting that list sensors only apply to those sensors.
+    """
+    policies = sensor.get_attribute("retention-policies")
+    if policies is None:
+        policies = [
+            policy
+            for policy in current_app.config.get("FLEXMEASURES_RETENTION_POLICIES", [])
+            if sensor.id in policy.get("sensors", [sensor.id])
+        ]
+    return RetentionPolicySchema(many=True).load(policies)
+
+
+def query_beliefs_past_retention(
+    sensor: Sensor, policy: dict, now: datetime | None = None
+) -> sa.Select:
+    """Select the beliefs of the sensor that may be deleted according to the given retention policy.
+
+    :param sensor:  The sensor whose beliefs to select.
+    :param policy:  Deserialized retention policy (see ``RetentionPolicySchema``).
+    :param now:     Reference time for the policy's age criterion (defaults to the server time).
+    """
+    if now is None:
+        now = server_now()
+    cutoff = now - DurationField.ground_from(policy["older_than"], now)
+    query = sa.select(TimedBelief).filter(
+        TimedBelief.sensor_id == sensor.id,
+        TimedBelief.event_start < cutoff,
+    )
+    if policy.get("source_types"):
+        query = query.join(DataSource, DataSource.id == TimedBelief.source_id).filter(
+            DataSource.type.in_(policy["source_types"])
+        )
+
+    if policy["action"] == "drop-rolled-up-data":
+        return query.filter(
+            sa.exists().where(
+                TimedBeliefRollup.sensor_id == TimedBelief.sensor_id,
+                TimedBeliefRollup.source_id == TimedBelief.source_id,
+                TimedBeliefRollup.period == "day",
+                TimedBeliefRollup.first_event_start <= TimedBelief.event_start,
+                TimedBeliefRollup.last_event_start >= TimedBelief.event_start,
+            )
+        )
+
+    # Select beliefs for which a more recent belief exists about the same event (from the same source, with the same probability)
+    more_recent_belief = aliased(TimedBelief)
+    criteria = [
+        more_recent_belief.sensor_id == TimedBelief.sensor_id,
+        more_recent_belief.event_start == TimedBelief.event_start,
+        more_recent_belief.source_id == TimedBelief.source_id,
+        more_recent_belief.cumulative_probability == TimedBelief.cumulative_probability,
+        more_recent_belief.belief_horizon < TimedBelief.belief_horizon,
+    ]
+    if policy["action"] == "thin-horizons":
+        # ... within the same horizon bucket
+        bucket_seconds = policy["horizon_bucket"].total_seconds()
+        criteria.append(
+            sa.func.floor(
+                sa.extract("epoch", more_recent_belief.belief_horizon) / bucket_seconds
+            )
+            == sa.func.floor(
+                sa.extract("epoch", TimedBelief.belief_horizon) / bucket_seconds
+            )
+        )
+    return query.filter(sa.exists().where(*criteria))
+
+
+def apply_retention_policies(
+    sensors: list[Sensor] | None = None,
+    batch_size: int = 10000,
+    dry_run: bool = False,
+    now: datetime | None = None,
+) -> Iterator[tuple[Sensor, dict, int]]:
+    """Apply the retention policies of the given sensors (by default, all sensors).
+
+    Deletes in batches (see ``delete_beliefs_in_batches``), committing each batch.
+    Yields, for each batch, the sensor, the policy and the number of deleted beliefs.
+    In a dry run, nothing is deleted, and the number of beliefs up for deletion is yielded once per sensor and policy.
+    """
+    if sensors is None:
+        sensors = db.session.scalars(sa.select(Sensor).order_by(Sensor.id)).all()
+    for sensor in sensors:
+        for policy in get_retention_policies(sensor):
+            query = query_beliefs_past_retention(sensor, policy, now=now)
+            if dry_run:
+                yield sensor, policy, db.session.scalar(
+                    sa.select(sa.func.count()).select_from(query.subquery())
+                )
+                continue
+            for num_deleted in delete_beliefs_in_batches(query, batch_size):
+                yield sensor, policy, num_deleted
@@ -0,0 +1,330 @@
+"""Logic around pre-aggregated (hourly and daily) rollups of sensor data.
+
+Zoomed-out charts and KPIs need coarse statistics over long periods.
+Without rollups, these are computed from the raw beliefs, e.g. by resampling a year of minutely data in pandas.
+With ``FLEXMEASURES_ROLLUPS_ENABLED``, we maintain hourly and daily rollups on ingestion (see ``save_to_db``),
+and serve searches for the most recent beliefs at a resolution of one hour or one day from them.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pandas as pd
+import timely_beliefs as tb
+import timely_beliefs.utils as tb_utils
+from flask import current_app
+from sqlalchemy import delete, insert, select
+from sqlalchemy.sql.elements import BinaryExpression
+
+from flexmeasures.data import db
+from flexmeasures.data.models.data_sources import DataSource
+from flexmeasures.data.models.rollups import TimedBeliefRollup
+from flexmeasures.data.models.time_series import Sensor, TimedBelief
+from flexmeasures.data.queries.utils import get_source_criteria
+
+ROLLUP_PERIODS = dict(hour=timedelta(hours=1), day=timedelta(days=1))
+
+
+def sensor_supports_rollup(sensor: Sensor, period: str) -> bool:
+    """Rollups summarize whole events, so the sensor's events should neatly fit the period.
+
+    Instantaneous sensors are not supported, because their data is resampled differently.
+    """
+    duration = ROLLUP_PERIODS[period]
+    return timedelta(
+        0
+    ) < sensor.event_resolution < duration and duration % sensor.event_resolution == timedelta(
+        0
+    )
+
+
+def rollup_period(
+    sensor: Sensor,
+    resolution: str | timedelta,
+    event_starts_after: datetime | None,
+) -> str | None:
+    """Return the rollup period ("hour" or "day") that can serve data at the given resolution, if any.
+
+    Resampling aligns its periods with the start of the search window,
+    so rollups can only serve windows starting on the hour or at midnight (in the sensor's timezone), respectively.
+    """
+    if (
+        not current_app.config.get("FLEXMEASURES_ROLLUPS_ENABLED", False)
+        or event_starts_after is None
+    ):
+        return None
+    start = pd.Timestamp(event_starts_after)
+    if start.tzinfo is None:
+        return None
+    start = pd.Series([start.tz_convert(sensor.timezone)])
+    resolution = pd.Timedelta(tb_utils.parse_timedelta_like(resolution))
+    for period, duration in ROLLUP_PERIODS.items():
+        if (
+            resolution == duration
+            and sensor_supports_rollup(sensor, period)
+            and _period_starts(start, period).equals(start)
+        ):
+            return period
+    return None
+
+
+def _period_starts(event_starts: pd.Series, period: str) -> pd.Series:
+    """Floor (tz-aware) event starts to the start of their hour or day, in their timezone."""
+    midnights = event_starts.dt.normalize()
+    if period == "day":
+        return midnights
+    return midnights + (event_starts - midnights).dt.floor("h")
+
+
+def _whole_days(
+    sensor: Sensor,
+    start: datetime | None,
+    end: datetime | None,
+) -> tuple[pd.Timestamp | None, pd.Timestamp | None]:
+    """Extend a window to whole days in the sensor's timezone (which also makes it whole hours)."""
+    if start is not None:
+        start = pd.Timestamp(start).tz_convert(sensor.timezone).normalize()
+    if end is not None:
+        end = pd.Timestamp(end).tz_convert(sensor.timezone).normalize() + pd.DateOffset(
+            days=1
+        )
+    return start, end
+
+
+def update_rollups(
+    sensor: Sensor,
+    start: datetime | None = None,
+    end: datetime | None = None,
+):
+    """(Re)compute the hourly and daily rollups of the sensor's data, for each day overlapping the given window.
+
+    Without a start and/or end, all of the sensor's data before and/or after is rolled up.
+    Does not commit.
+
+    :param sensor:  The sensor whose data to roll up.
+    :param start:   Roll up data from (the start of the day of) this datetime onwards.
+    :param end:     Roll up data until (the end of the day of) this datetime.
+    """
+    start, end = _whole_days(sensor, start, end)
+
+    # Remove outdated rollups
+    query = delete(TimedBeliefRollup).filter(TimedBeliefRollup.sensor_id == sensor.id)
+    if start is not None:
+        query = query.filter(TimedBeliefRollup.period_start >= start)
+    if end is not None:
+        query = query.filter(TimedBeliefRollup.period_start < end)
+    db.session.execute(query)
+
+    periods = [
+        period for period in ROLLUP_PERIODS if sensor_supports_rollup(sensor, period)
+    ]
+    if not periods:
+        return
+
+    # Roll up the most recent deterministic belief about each event, per source
+    bdf = TimedBelief.search(
+        sensors=sensor,
+        event_starts_after=start,
+        event_ends_before=end,
+        most_recent_beliefs_only=True,
+        use_latest_version_per_event=False,
+        one_deterministic_belief_per_event_per_source=True,
+    )
+    if bdf.empty:
+        return
+    df = bdf.reset_index()
+    if start is not None:
+        df = df[df["event_start"] >= start]
+    if end is not None:
+        df = df[df["event_start"] < end]
+    df["source_id"] = df["source"].map(lambda source: source.id)
+    df = df.sort_values("event_start")
+
+    rollups = []
+    for period in periods:
+        df["period_start"] = _period_starts(df["event_start"], period)
+        aggregates = df.groupby(["source_id", "period_start"]).agg(
+            first_event_start=("event_start", "min"),
+            last_event_start=("event_start", "max"),
+            last_belief_time=("belief_time", "max"),
+            min_value=("event_value", "min"),
+            max_value=("event_value", "max"),
+            sum_value=("event_value", "sum"),
+            count=("event_value", "count"),
+            last_value=("event_value", "last"),
+        )
+        aggregates.loc[aggregates["count"] == 0, "sum_value"] = None
+        for (source_id, period_start), row in aggregates.iterrows():
+            rollups.append(
+                dict(
+                    sensor_id=sensor.id,
+                    source_id=int(source_id),
+                    period=period,
+                    period_start=period_start,
+                    first_event_start=row["first_event_start"],
+                    last_event_start=row["last_event_start"],
+                    last_belief_time=row["last_belief_time"],
+                    min_value=None if pd.isnull(row["min_value"]) else row["min_value"],
+                    max_value=None if pd.isnull(row["max_value"]) else row["max_value"],
+                    sum_value=None if pd.isnull(row["sum_value"]) else row["sum_value"],
+                    count=int(row["count"]),
+                    last_value=(
+                        None if pd.isnull(row["last_value"]) else row["last_value"]
+                    ),
+                )
+            )
+    db.session.execute(insert(TimedBeliefRollup), rollups)
+
+
+def search_rollups(
+    sensor: Sensor,
+    period: str,
+    event_starts_after: datetime | None = None,
+    event_ends_before: datetime | None = None,
+    sources: list[DataSource] | None = None,
+    source_criteria: list[BinaryExpression] | None = None,
+) -> tb.BeliefsDataFrame:
+    """Search the hourly or daily mean values of the sensor's data, from its rollups.
+
+    The result mimics resampling the most recent beliefs of each source to the period,
+    with one belief per period and source (timed at the most recent belief within the period),
+    and only periods that lie completely within the given window.
+
+    :param sensor:              The sensor whose data to search.
+    :param period:              "hour" or "day".
+    :param event_starts_after:  Only return periods starting after this datetime (inclusive).
+    :param event_ends_before:   Only return periods ending before this datetime (inclusive).
+    :param sources:             Only return data from these sources.
+    :param source_criteria:     Criteria to select data sources (see ``get_source_criteria``).
+    """
+    query = (
+        select(
+            TimedBeliefRollup.period_start,
+            TimedBeliefRollup.last_belief_time,
+            DataSource,
+            TimedBeliefRollup.sum_value,
+            TimedBeliefRollup.count,
+        )
+        .join(DataSource, DataSource.id == TimedBeliefRollup.source_id)
+        .filter(
+            TimedBeliefRollup.sensor_id == sensor.id,
+            TimedBeliefRollup.period == period,
+            TimedBeliefRollup.count > 0,
+        )
+    )
+    if sources:
+        query = query.filter(
+            TimedBeliefRollup.source_id.in_([source.id for source in sources])
+        )
+    for criterion in source_criteria or []:
+        query = query.filter(criterion)
+    if event_starts_after is not None:
+        query = query.filter(TimedBeliefRollup.period_start >= event_starts_after)
+    if event_ends_before is not None:
+        query = query.filter(TimedBeliefRollup.period_start < event_ends_before)
+    rows = db.session.execute(
+        query.order_by(TimedBeliefRollup.period_start, TimedBeliefRollup.source_id)
+    ).all()
+
+    df = pd.DataFrame(
+        [
+            (period_start, belief_time, source, sum_value / count)
+            for period_start, belief_time, source, sum_value, count in rows
+        ],
+        columns=["event_start", "belief_time", "source", "event_value"],
+    )
+    df["event_start"] = pd.to_datetime(df["event_start"], utc=True).dt.tz_convert(
+        sensor.timezone
+    )
+    df["belief_time"] = pd.to_datetime(df["belief_time"], utc=True).dt.tz_convert(
+        sensor.timezone
+    )
+    bdf = tb.BeliefsDataFrame(
+        df, sensor=sensor, event_resolution=ROLLUP_PERIODS[period]
+    )
+    if event_starts_after is not None:
+        bdf = bdf[bdf.event_starts >= event_starts_after]
+    if event_ends_before is not None:
+        bdf = bdf[bdf.event_ends <= event_ends_before]
+    return bdf
+
+
+def search_rollups_at_resolution(
+    sensor: Sensor | int,
+    resolution: str | timedelta,
+    event_starts_after: datetime | None = None,
+    event_ends_before: datetime | None = None,
+    sources: list[DataSource] | None = None,
+    **source_criteria_kwargs,
+) -> tb.BeliefsDataFrame | None:
+    """Search the most recent beliefs at the given resolution from the rollups, if they can serve the search.
+
+    Returns None if they cannot, in which case the raw beliefs should be searched and resampled instead.
+
+    :param source_criteria_kwargs: Source filters to pass to ``get_source_criteria``, such as ``source_types``.
+    """
+    if not isinstance(sensor, Sensor):
+        sensor = db.session.get(Sensor, sensor)
+    period = rollup_period(sensor, resolution, event_starts_after)
+    if period is None:
+        return None
+    return search_rollups(
+        sensor=sensor,
+        period=period,
+        event_starts_after=event_starts_after,
+        event_ends_before=event_ends_before,
+        sources=sources,
+        source_criteria=get_source_criteria(
+            cls=TimedBeliefRollup, **source_criteria_kwargs
+        ),
+    )
+
+
+def get_sensor_stats_from_rollups(
+    sensor: Sensor,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> list[tuple] | None:
+    """Aggregate the daily rollups of the sensor within the given window, per data source.
+
+    Returns None if the rollups cannot serve the window, i.e. if rollups are disabled,
+    the sensor's data is not rolled up, or the window does not start and end at midnight in the sensor's timezone.
+    Otherwise, returns rows like those of ``_get_sensor_stats``:
+    data source, first and last event start, last belief time, min, max, mean, sum and number of values.
+    """
+    if not current_app.config.get(
+        "FLEXMEASURES_ROLLUPS_ENABLED", False
+    ) or not sensor_supports_rollup(sensor, "day"):
+        return None
+    for dt in (start, end):
+        if dt is not None:
+            local_dt = pd.Timestamp(dt).tz_convert(sensor.timezone)
+            if local_dt != local_dt.normalize():
+                return None
+
+    query = (
+        select(
+            DataSource,
+            db.func.min(TimedBeliefRollup.first_event_start),
+            db.func.max(TimedBeliefRollup.last_event_start),
+            db.func.max(TimedBeliefRollup.last_belief_time),
+            db.func.min(TimedBeliefRollup.min_value),
+            db.func.max(TimedBeliefRollup.max_value),
+            db.func.sum(TimedBeliefRollup.sum_value)
+            / db.func.nullif(db.func.sum(TimedBeliefRollup.count), 0),
+            db.func.sum(TimedBeliefRollup.sum_value),
+            db.func.sum(TimedBeliefRollup.count),
+        )
+        .join(DataSource, DataSource.id == TimedBeliefRollup.source_id)
+        .filter(
+            TimedBeliefRollup.sensor_id == sensor.id,
+            TimedBeliefRollup.period == "day",
+        )
+        .group_by(DataSource.id)
+    )
+    if start is not None:
+        query = query.filter(TimedBeliefRollup.period_start >= start)
+    if end is not None:
+        query = query.filter(TimedBeliefRollup.period_start < end)
+    return db.session.execute(query).all()
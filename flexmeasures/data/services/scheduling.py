@@ -7,6 +7,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 import os
 import sys
+import time
 import importlib.util
 from importlib.abc import Loader
 from typing import Callable, Type
@@ -27,14 +28,12 @@ from sqlalchemy import select
 
 from flexmeasures.data import db
 from flexmeasures.data.models.planning import Scheduler, SchedulerOutputType
-from flexmeasures.data.models.planning.storage import (
-    StorageScheduler,
-    SCHEDULING_RESULT_KEY,
-)
 from flexmeasures.data.models.planning.devices import INFLEXIBLE_DEVICE_KEYS
 from flexmeasures.data.models.planning.exceptions import InfeasibleProblemException
-from flexmeasures.data.models.planning.process import ProcessScheduler
-from flexmeasures.data.services.scheduling_result import SchedulingJobResult
+from flexmeasures.data.services.scheduling_result import (
+    SCHEDULING_RESULT_KEY,
+    SchedulingJobResult,
+)
 from flexmeasures.data.models.time_series import Sensor, TimedBelief
 from flexmeasures.data.models.generic_assets import GenericAsset as Asset
 from flexmeasures.data.models.data_sources import DataSource
@@ -381,10 +380,17 @@ def create_sequential_scheduling_job(
     scheduler_specs: dict | None = None,
     depends_on: list[Job] | None = None,
     success_callback: Callable | None = None,
+    tiers: list[list[Sensor]] | None = None,
     **scheduler_kwargs,
 ) -> Job:
     """Create a chain of underlying jobs, one for each device, with one additional job to wrap up.
 
+    Optionally, the devices can be grouped into ordered priority tiers.
+    Devices within the same tier are scheduled by jobs that may run in parallel,
+    each taking into account the devices of all earlier tiers as inflexible devices.
+    Only the tiers are chained: the jobs of a tier depend on all jobs of the previous tier.
+    By default, each device forms its own tier, in the order of the flex-model.
+
     :param asset:                   Asset (e.g. a site) for which the schedule is computed.
     :param job_id:                  Optionally, set a job id explicitly.
     :param enqueue:                 If True, enqueues the job in case it is new.
@@ -393,6 +399,7 @@ def create_sequential_scheduling_job(
     :param force_new_job_creation:  If True, this attribute forces a new job to be created (skipping cache).
     :param success_callback:        Callback function that runs on success
                                     (this argument is used by the @job_cache decorator).
+    :param tiers:                   Optionally, ordered tiers of power sensors, together covering each sensor in the flex-model once.
     :param scheduler_kwargs:        Dict containing start and end (both deserialized) the flex-context (serialized),
                                     and the flex-model (partially deserialized, see example below).
     :returns:                       The wrap-up job.
@@ -418,40 +425,56 @@ def create_sequential_scheduling_job(
             "See why: https://github.com/FlexMeasures/flexmeasures/pull/1313/files#r1971479492"
         )
     flex_model = scheduler_kwargs["flex_model"]
-    jobs = []
-    previous_sensors = []
-    previous_job = depends_on
+    sensor_flex_models = {
+        child_flex_model["sensor"].id: child_flex_model["sensor_flex_model"]
+        for child_flex_model in flex_model
+    }
+    if tiers is None:
+        tiers = [[child_flex_model["sensor"]] for child_flex_model in flex_model]
+    elif sorted(sensor.id for tier in tiers for sensor in tier) != sorted(
+        sensor_flex_models
+    ):
+        raise ValueError(
+            "The scheduling tiers should list each sensor in the flex-model exactly once."
+        )
     for child_flex_model in flex_model:
-        sensor = child_flex_model.pop("sensor")
-
-        current_scheduler_kwargs = deepcopy(scheduler_kwargs)
+        child_flex_model.pop("sensor")
 
-        current_scheduler_kwargs["flex_model"] = child_flex_model["sensor_flex_model"]
-        _add_inflexible_devices(
-            current_scheduler_kwargs["flex_context"], previous_sensors
-        )
-        if "resolution" not in current_scheduler_kwargs:
-            current_scheduler_kwargs["resolution"] = sensor.event_resolution
-        current_scheduler_kwargs["asset_or_sensor"] = sensor
+    jobs = []
+    previous_sensors = []
+    previous_jobs = depends_on
+    for tier in tiers:
+        tier_jobs = []
+        for sensor in tier:
+            current_scheduler_kwargs = deepcopy(scheduler_kwargs)
+
+            current_scheduler_kwargs["flex_model"] = sensor_flex_models[sensor.id]
+            _add_inflexible_devices(
+                current_scheduler_kwargs["flex_context"], previous_sensors
+            )
+            if "resolution" not in current_scheduler_kwargs:
+                current_scheduler_kwargs["resolution"] = sensor.event_resolution
+            current_scheduler_kwargs["asset_or_sensor"] = sensor
 
-        job = create_scheduling_job(
-            **current_scheduler_kwargs,
-            scheduler_specs=scheduler_specs,
-            requeue=requeue,
-            job_id=job_id,
-            enqueue=enqueue,
-            depends_on=previous_job,
-            force_new_job_creation=force_new_job_creation,
-        )
-        jobs.append(job)
-        previous_sensors.append(sensor)
-        previous_job = job
+            job = create_scheduling_job(
+                **current_scheduler_kwargs,
+                scheduler_specs=scheduler_specs,
+                requeue=requeue,
+                job_id=job_id,
+                enqueue=enqueue,
+                depends_on=previous_jobs,
+                force_new_job_creation=force_new_job_creation,
+            )
+            tier_jobs.append(job)
+        jobs.extend(tier_jobs)
+        previous_sensors.extend(tier)
+        previous_jobs = tier_jobs
 
-    # create job that triggers when the last job is done
+    # create job that triggers when the jobs of the last tier are done
     job = Job.create(
         func=cb_done_sequential_scheduling_job,
         args=([j.id for j in jobs],),
-        depends_on=previous_job,
+        depends_on=previous_jobs,
         ttl=int(
             current_app.config.get(
                 "FLEXMEASURES_JOB_TTL", timedelta(-1)
@@ -837,6 +860,7 @@ def make_schedule(  # noqa: C901
         rq_job.save_meta()
 
     # Save any result that specifies a sensor to save it to
+    save_start = time.perf_counter()
     scheduling_result_dict: dict = SchedulingJobResult().to_dict()
     num_beliefs_created = 0
     for result in consumption_schedule:
@@ -896,6 +920,14 @@ def make_schedule(  # noqa: C901
         scheduler.persist_flex_model()
         db.session.commit()
 
+    # saving the stage timings and problem size on the job, so the API and CLI can report them
+    if rq_job and scheduler.timings is not None:
+        rq_job.meta["timings"] = dict(
+            scheduler.timings, save=time.perf_counter() - save_start
+        )
+        rq_job.meta["problem_size"] = scheduler.problem_size
+        rq_job.save_meta()
+
     return scheduling_result_dict
 
 
@@ -918,10 +950,12 @@ def find_scheduler_class(asset_or_sensor: Asset | Sensor) -> type:
     else:
         asset = asset_or_sensor
 
+    # Look up our own schedulers in the registry, which only imports them on first use
+    schedulers = current_app.data_generators["scheduler"]
     if asset.generic_asset_type.name in ("process", "load"):
-        scheduler_class = ProcessScheduler
+        scheduler_class = schedulers["ProcessScheduler"]
     else:
-        scheduler_class = StorageScheduler
+        scheduler_class = schedulers["StorageScheduler"]
 
     return scheduler_class
 
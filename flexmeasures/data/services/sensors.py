@@ -4,7 +4,7 @@ import json
 import time
 import hashlib
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Iterator
 from flask import current_app
 from sqlalchemy import delete
 
@@ -27,6 +27,8 @@ from flexmeasures.data.models.generic_assets import GenericAsset
 from flexmeasures.data.models.planning.devices import INFLEXIBLE_DEVICE_KEYS
 from flexmeasures.data.schemas.generic_assets import SensorsToShowSchema
 from flexmeasures.data.schemas.reporting import StatusSchema
+from flexmeasures.data.services.latest_beliefs import refresh_latest_beliefs
+from flexmeasures.data.services.rollups import get_sensor_stats_from_rollups
 from flexmeasures.utils.time_utils import server_now
 
 _REMOVE = object()
@@ -823,16 +825,11 @@ def build_asset_jobs_data(
     return jobs_data
 
 
-def _get_sensor_stats(
+def _get_sensor_stats_from_beliefs(
     sensor: Sensor,
-    event_end_time: str,
-    event_start_time: str,
-    sort_keys: bool,
-) -> dict:
-    # parse incoming datetimes (or leave None)
-    start_dt = pd.to_datetime(event_start_time) if event_start_time else None
-    end_dt = pd.to_datetime(event_end_time) if event_end_time else None
-
+    start_dt: datetime | None,
+    end_dt: datetime | None,
+) -> list:
     # In PostgreSQL NaN = NaN is TRUE (unlike IEEE-754), so this predicate correctly excludes NaN rows from value aggregates while keeping them in the row count.
     # We pass it to aggregate FILTER clauses so that the planner can compute all aggregates in a single pass over the belief rows.
     not_nan = TimedBelief.event_value != float("nan")
@@ -866,7 +863,23 @@ def _get_sensor_stats(
     if end_dt:
         q = q.filter(TimedBelief.event_start < end_dt)
 
-    raw_stats = db.session.execute(q.group_by(DataSource.id)).fetchall()
+    return db.session.execute(q.group_by(DataSource.id)).fetchall()
+
+
+def _get_sensor_stats(
+    sensor: Sensor,
+    event_end_time: str,
+    event_start_time: str,
+    sort_keys: bool,
+) -> dict:
+    # parse incoming datetimes (or leave None)
+    start_dt = pd.to_datetime(event_start_time) if event_start_time else None
+    end_dt = pd.to_datetime(event_end_time) if event_end_time else None
+
+    # Serve whole days from the daily rollups, if available
+    raw_stats = get_sensor_stats_from_rollups(sensor, start_dt, end_dt)
+    if raw_stats is None:
+        raw_stats = _get_sensor_stats_from_beliefs(sensor, start_dt, end_dt)
 
     def to_local_iso(ts):
         return pd.Timestamp(ts).tz_convert(sensor.timezone).isoformat()
@@ -966,3 +979,50 @@ def delete_sensor(sensor: Sensor):
     )
     db.session.execute(delete(Sensor).filter_by(id=sensor.id))
     current_app.logger.info("Deleted sensor '%s'." % sensor_name)
+
+
+def delete_beliefs_in_batches(
+    query: sa.Select, batch_size: int = 10000
+) -> Iterator[int]:
+    """Delete the beliefs selected by the given query, in batches.
+
+    Each batch is a single ``DELETE ... WHERE (primary key) IN (subquery)`` statement
+    that deletes at most ``batch_size`` beliefs and is committed right away
+    (along with refreshing the latest beliefs of the affected sensors),
+    so no beliefs are loaded as ORM objects, and transactions stay bounded in size.
+    Batches walk the primary key of the timed_belief table in order,
+    picking up after the last belief deleted by the previous batch.
+    This assumes deleting a batch does not change which of the remaining beliefs are selected by the query,
+    which holds for filters on belief attributes, and for unchanged beliefs (see ``query_unchanged_beliefs``).
+
+    Yields the number of beliefs deleted per batch.
+
+    :param query:       Select statement for TimedBelief, e.g. ``select(TimedBelief).filter(...)``.
+    :param batch_size:  Maximum number of beliefs to delete per transaction.
+    """
+    primary_key = [
+        TimedBelief.event_start,
+        TimedBelief.belief_horizon,
+        TimedBelief.cumulative_probability,
+        TimedBelief.sensor_id,
+        TimedBelief.source_id,
+    ]
+    last_key = None
+    while True:
+        keys = query.with_only_columns(*primary_key).order_by(*primary_key)
+        if last_key is not None:
+            keys = keys.where(sa.tuple_(*primary_key) > sa.tuple_(*last_key))
+        deleted_keys = db.session.execute(
+            delete(TimedBelief)
+            .where(sa.tuple_(*primary_key).in_(keys.limit(batch_size).correlate(None)))
+            .returning(*primary_key)
+            .execution_options(synchronize_session=False)
+        ).all()
+        refresh_latest_beliefs(list({key.sensor_id for key in deleted_keys}))
+        db.session.commit()
+        if not deleted_keys:
+            return
+        yield len(deleted_keys)
+        if len(deleted_keys) < batch_size:
+            return
+        last_key = max(tuple(key) for key in deleted_keys)
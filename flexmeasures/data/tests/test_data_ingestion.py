@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import io
+import os
+
+from werkzeug.datastructures import FileStorage
+
 from flexmeasures.data.services.data_ingestion import (
     add_beliefs_to_db_and_enqueue_forecasting_jobs,
+    stage_uploaded_file,
+)
+from flexmeasures.data.utils import (
+    SAVE_TO_DB_SUCCESS,
+    SAVE_TO_DB_SUCCESS_BUT_NOTHING_NEW,
 )
-from flexmeasures.data.utils import SAVE_TO_DB_SUCCESS_BUT_NOTHING_NEW
 from flexmeasures.tests.utils import get_test_sensor
 
 
@@ -19,3 +28,36 @@ def test_ingestion_service_accepts_beliefs_data_frame(setup_beliefs, db):
     )
 
     assert status == SAVE_TO_DB_SUCCESS_BUT_NOTHING_NEW
+
+
+def test_ingestion_service_loads_and_removes_staged_file(
+    app, setup_beliefs, setup_roles_users, db, tmp_path, monkeypatch
+):
+    monkeypatch.setitem(app.config, "FLEXMEASURES_UPLOAD_STAGING_DIR", str(tmp_path))
+    sensor = get_test_sensor(db)
+    csv_content = b"event_start,event_value\n2021-03-29T10:00+01:00,40\n2021-03-29T11:00+01:00,42\n"
+    file = FileStorage(
+        stream=io.BytesIO(csv_content), filename="prices.csv", content_type="text/csv"
+    )
+
+    staged_file = stage_uploaded_file(file)
+    assert "content" not in staged_file
+    assert os.path.dirname(staged_file["path"]) == str(tmp_path)
+    with open(staged_file["path"], "rb") as f:
+        assert f.read() == csv_content
+
+    status = add_beliefs_to_db_and_enqueue_forecasting_jobs(
+        sensor_id=sensor.id,
+        user_id=setup_roles_users["Test Prosumer User"],
+        uploaded_files=[staged_file],
+        upload_data={"belief-time-measured-instantly": "on"},
+    )
+
+    assert status == SAVE_TO_DB_SUCCESS
+    assert not os.path.exists(staged_file["path"])
+    bdf = sensor.search_beliefs(
+        event_starts_after="2021-03-29T10:00+01:00",
+        event_ends_before="2021-03-29T12:00+01:00",
+        source="Test Prosumer User",
+    )
+    assert bdf["event_value"].tolist() == [40, 42]
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pandas as pd
+import pytest
+import timely_beliefs as tb
+from sqlalchemy import select
+
+from flexmeasures.data.models.data_sources import DataSource
+from flexmeasures.data.models.generic_assets import GenericAsset
+from flexmeasures.data.models.latest_beliefs import SensorLatestBelief
+from flexmeasures.data.models.time_series import Sensor, TimedBelief
+from flexmeasures.data.services.latest_beliefs import refresh_latest_beliefs
+from flexmeasures.data.services.sensors import delete_beliefs_in_batches
+from flexmeasures.data.utils import save_to_db
+
+
+@pytest.fixture(scope="function")
+def latest_belief_sensors(
+    fresh_db, setup_generic_asset_types_fresh_db
+) -> tuple[list[Sensor], list[DataSource]]:
+    """Three hourly sensors, and two data sources."""
+    asset = GenericAsset(
+        name="latest belief test asset",
+        generic_asset_type=setup_generic_asset_types_fresh_db["battery"],
+    )
+    sensors = [
+        Sensor(
+            name=f"latest belief test power {i}",
+            generic_asset=asset,
+            unit="kW",
+            event_resolution=timedelta(hours=1),
+            timezone="Europe/Amsterdam",
+        )
+        for i in range(3)
+    ]
+    sources = [
+        DataSource(name="latest belief test meter", type="demo script"),
+        DataSource(name="latest belief test forecaster", type="forecaster"),
+    ]
+    fresh_db.session.add_all([asset] + sensors + sources)
+    fresh_db.session.flush()
+    return sensors, sources
+
+
+def make_beliefs(
+    sensor: Sensor,
+    source: DataSource,
+    start: str,
+    periods: int,
+    horizon: timedelta,
+    offset: float = 0,
+) -> tb.BeliefsDataFrame:
+    event_starts = pd.date_range(
+        pd.Timestamp(start, tz=sensor.timezone), periods=periods, freq="1h"
+    )
+    return tb.BeliefsDataFrame(
+        [
+            TimedBelief(
+                sensor=sensor,
+                source=source,
+                event_start=event_start,
+                belief_horizon=horizon,
+                event_value=i + offset,
+            )
+            for i, event_start in enumerate(event_starts)
+        ]
+    )
+
+
+def latest_values(sensor: Sensor) -> list[float]:
+    latest_states = Sensor.latest_states([sensor])
+    return sorted(latest_states["event_value"].tolist())
+
+
+def assert_latest_states_match_search(sensors: list[Sensor], **kwargs):
+    """Compare the latest state per sensor and source with what searching the sensor's beliefs returns."""
+    latest_states = Sensor.latest_states(sensors, **kwargs)
+    assert latest_states["sensor_id"].unique().tolist() == [
+        sensor.id for sensor in sensors if not sensor.latest_state(**kwargs).empty
+    ]
+    for row in latest_states.itertuples():
+        sensor = next(sensor for sensor in sensors if sensor.id == row.sensor_id)
+        expected = sensor.latest_state(source=row.source).reset_index()
+        assert len(expected) == 1
+        assert row.event_start == expected["event_start"][0]
+        assert row.belief_time == expected["belief_time"][0]
+        assert row.event_value == expected["event_value"][0]
+
+
+def test_latest_beliefs_are_updated_on_ingestion(fresh_db, latest_belief_sensors):
+    (sensor_1, sensor_2, sensor_3), (meter, forecaster) = latest_belief_sensors
+
+    # Measurements, and forecasts reaching further ahead
+    save_to_db(
+        [
+            make_beliefs(sensor_1, meter, "2025-01-01T00:00", 24, timedelta(hours=-1)),
+            make_beliefs(sensor_1, forecaster, "2025-01-01T12:00", 24, timedelta(1)),
+            make_beliefs(sensor_2, meter, "2025-01-01T00:00", 12, timedelta(0)),
+            make_beliefs(sensor_2, forecaster, "2025-01-01T00:00", 6, timedelta(0)),
+        ]
+    )
+    fresh_db.session.commit()
+    assert latest_values(sensor_1) == [23]
+    assert latest_values(sensor_2) == [5, 11]
+    assert latest_values(sensor_3) == []
+    assert_latest_states_match_search([sensor_1, sensor_2, sensor_3])
+    assert_latest_states_match_search([sensor_2], source=forecaster)
+
+    # Older events and older beliefs do not change the latest state
+    save_to_db(
+        [
+            make_beliefs(sensor_1, meter, "2024-12-31T00:00", 6, timedelta(hours=-1)),
+            make_beliefs(
+                sensor_1, meter, "2025-01-01T23:00", 1, timedelta(0), offset=100
+            ),
+        ]
+    )
+    fresh_db.session.commit()
+    assert latest_values(sensor_1) == [23]
+
+    # A correction (a more recent belief about the latest event) and a new event do
+    save_to_db(
+        make_beliefs(sensor_1, meter, "2025-01-01T23:00", 1, timedelta(hours=-2), 50)
+    )
+    assert latest_values(sensor_1) == [50]
+    save_to_db(
+        make_beliefs(sensor_1, meter, "2025-01-02T00:00", 1, timedelta(hours=-1), 60)
+    )
+    fresh_db.session.commit()
+    assert_latest_states_match_search([sensor_1, sensor_2, sensor_3])
+
+
+def test_latest_beliefs_are_refreshed_after_deletion(fresh_db, latest_belief_sensors):
+    (sensor_1, sensor_2, _), (meter, _) = latest_belief_sensors
+    save_to_db(
+        [
+            make_beliefs(sensor_1, meter, "2025-01-01T00:00", 24, timedelta(0)),
+            make_beliefs(sensor_2, meter, "2025-01-01T00:00", 24, timedelta(0)),
+        ]
+    )
+    fresh_db.session.commit()
+
+    # Delete the last 6 hours of data of the first sensor
+    query = select(TimedBelief).filter(
+        TimedBelief.sensor_id == sensor_1.id,
+        TimedBelief.event_start >= pd.Timestamp("2025-01-01T18:00+01:00"),
+    )
+    assert sum(delete_beliefs_in_batches(query, batch_size=4)) == 6
+    assert latest_values(sensor_1) == [17]
+    assert latest_values(sensor_2) == [23]
+
+    # Rebuilding all latest beliefs from scratch gives the same result
+    rows_before = fresh_db.session.execute(
+        select(SensorLatestBelief.__table__).order_by(SensorLatestBelief.sensor_id)
+    ).all()
+    refresh_latest_beliefs()
+    rows_after = fresh_db.session.execute(
+        select(SensorLatestBelief.__table__).order_by(SensorLatestBelief.sensor_id)
+    ).all()
+    assert rows_after == rows_before
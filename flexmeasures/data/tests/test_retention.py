@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pandas as pd
+import pytest
+from marshmallow import ValidationError
+from sqlalchemy import func, select
+
+from flexmeasures.data.models.data_sources import DataSource
+from flexmeasures.data.models.generic_assets import GenericAsset
+from flexmeasures.data.models.time_series import Sensor, TimedBelief
+from flexmeasures.data.services.retention import (
+    apply_retention_policies,
+    get_retention_policies,
+)
+from flexmeasures.data.services.rollups import update_rollups
+
+NOW = pd.Timestamp("2025-02-01T00:00+01:00")
+
+
+@pytest.fixture(scope="function")
+def retention_sensor(fresh_db, setup_generic_asset_types_fresh_db) -> Sensor:
+    """Hourly sensor with schedules and forecasts from 12 belief times about each event, for an old and a recent day."""
+    asset = GenericAsset(
+        name="retention test asset",
+        generic_asset_type=setup_generic_asset_types_fresh_db["battery"],
+    )
+    sensor = Sensor(
+        name="retention test power",
+        generic_asset=asset,
+        unit="kW",
+        event_resolution=timedelta(hours=1),
+        timezone="Europe/Amsterdam",
+    )
+    scheduler = DataSource(name="retention test scheduler", type="scheduler")
+    forecaster = DataSource(name="retention test forecaster", type="forecaster")
+    fresh_db.session.add_all([asset, sensor, scheduler, forecaster])
+    event_starts = pd.date_range(
+        "2025-01-01T00:00+01:00", periods=24, freq="1h"
+    ).append(pd.date_range("2025-01-31T00:00+01:00", periods=24, freq="1h"))
+    fresh_db.session.add_all(
+        [
+            TimedBelief(
+                sensor=sensor,
+                source=source,
+                event_start=event_start,
+                belief_horizon=timedelta(hours=h),
+                event_value=h,
+            )
+            for source in (scheduler, forecaster)
+            for event_start in event_starts
+            for h in range(1, 13)
+        ]
+    )
+    fresh_db.session.commit()
+    return sensor
+
+
+def count_beliefs(db, sensor: Sensor, source_type: str, horizon: int | None = None):
+    query = (
+        select(func.count())
+        .select_from(TimedBelief)
+        .join(DataSource)
+        .filter(TimedBelief.sensor_id == sensor.id, DataSource.type == source_type)
+    )
+    if horizon is not None:
+        query = query.filter(TimedBelief.belief_horizon == timedelta(hours=horizon))
+    return db.session.scalar(query)
+
+
+def test_retention_policies(app, fresh_db, retention_sensor):
+    app.config["FLEXMEASURES_RETENTION_POLICIES"] = [
+        {
+            "action": "keep-most-recent-belief",
+            "older-than": "P30D",
+            "source-types": ["scheduler"],
+        },
+        {
+            "action": "thin-horizons",
+            "older-than": "P7D",
+            "horizon-bucket": "PT6H",
+            "source-types": ["forecaster"],
+        },
+        {
+            "action": "keep-most-recent-belief",
+            "older-than": "P1D",
+            "sensors": [retention_sensor.id + 1],
+        },
+    ]
+    try:
+        # The last policy applies to another sensor
+        assert len(get_retention_policies(retention_sensor)) == 2
+
+        # A dry run only counts: 11 superseded schedules (of old events) and 9 thinned forecasts (of both days) per event
+        counts = list(apply_retention_policies(dry_run=True, now=NOW))
+        assert [num_beliefs for _, _, num_beliefs in counts] == [24 * 11, 24 * 9]
+        assert count_beliefs(fresh_db, retention_sensor, "scheduler") == 2 * 24 * 12
+
+        # Deleting in small batches
+        deleted = list(
+            apply_retention_policies(sensors=[retention_sensor], batch_size=50, now=NOW)
+        )
+        assert len(deleted) > 2
+        assert sum(num_deleted for _, _, num_deleted in deleted) == 24 * 20
+    finally:
+        app.config["FLEXMEASURES_RETENTION_POLICIES"] = []
+
+    # Old schedules: only the most recent belief is left, recent schedules are untouched
+    assert count_beliefs(fresh_db, retention_sensor, "scheduler") == 24 + 24 * 12
+    assert count_beliefs(fresh_db, retention_sensor, "scheduler", horizon=1) == 2 * 24
+
+    # Old forecasts: the most recent belief within each 6-hour horizon bucket is left
+    assert count_beliefs(fresh_db, retention_sensor, "forecaster") == 24 * 3 + 24 * 12
+    for horizon in (1, 6, 12):
+        assert (
+            count_beliefs(fresh_db, retention_sensor, "forecaster", horizon=horizon)
+            == 2 * 24
+        )
+
+    # Running again (e.g. after an interruption) has nothing left to do
+    assert list(apply_retention_policies(dry_run=True, now=NOW)) == []
+
+
+def test_drop_rolled_up_data(app, fresh_db, retention_sensor):
+    retention_sensor.attributes["retention-policies"] = [
+        {"action": "drop-rolled-up-data", "older-than": "P7D"}
+    ]
+    app.config["FLEXMEASURES_ROLLUPS_ENABLED"] = True
+    try:
+        # Only the old day is rolled up
+        update_rollups(
+            retention_sensor,
+            start=pd.Timestamp("2025-01-01T00:00+01:00"),
+            end=pd.Timestamp("2025-01-01T12:00+01:00"),
+        )
+        fresh_db.session.commit()
+        list(apply_retention_policies(sensors=[retention_sensor], now=NOW))
+
+        assert count_beliefs(fresh_db, retention_sensor, "scheduler") == 24 * 12
+        bdf = TimedBelief.search(
+            retention_sensor,
+            event_starts_after=pd.Timestamp("2025-01-01T00:00+01:00"),
+            event_ends_before=pd.Timestamp("2025-01-02T00:00+01:00"),
+            resolution="P1D",
+            source_types=["scheduler"],
+        )
+        assert bdf["event_value"].tolist() == [1]
+    finally:
+        app.config["FLEXMEASURES_ROLLUPS_ENABLED"] = False
+
+
+def test_invalid_retention_policy(fresh_db, retention_sensor):
+    retention_sensor.attributes["retention-policies"] = [
+        {"action": "thin-horizons", "older-than": "P7D"}
+    ]
+    with pytest.raises(ValidationError, match="horizon bucket"):
+        get_retention_policies(retention_sensor)
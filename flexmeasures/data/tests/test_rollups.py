@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+import timely_beliefs as tb
+from sqlalchemy import select
+
+from flexmeasures.data.models.data_sources import DataSource
+from flexmeasures.data.models.generic_assets import GenericAsset
+from flexmeasures.data.models.rollups import TimedBeliefRollup
+from flexmeasures.data.models.time_series import Sensor, TimedBelief
+from flexmeasures.data.services.rollups import (
+    get_sensor_stats_from_rollups,
+    rollup_period,
+    search_rollups,
+)
+from flexmeasures.data.services.sensors import _get_sensor_stats_from_beliefs
+from flexmeasures.data.utils import save_to_db
+
+
+@pytest.fixture(scope="module")
+def rollup_sensor(db, setup_generic_asset_types) -> Sensor:
+    """15-minute sensor with data from two sources, over the days around the switch to daylight saving time."""
+    asset = GenericAsset(
+        name="rollup test asset",
+        generic_asset_type=setup_generic_asset_types["battery"],
+    )
+    sensor = Sensor(
+        name="rollup test power",
+        generic_asset=asset,
+        unit="kW",
+        event_resolution=timedelta(minutes=15),
+        timezone="Europe/Amsterdam",
+    )
+    db.session.add_all([asset, sensor])
+    db.session.flush()
+    return sensor
+
+
+@pytest.fixture(scope="module")
+def rollup_sources(db) -> list[DataSource]:
+    sources = [
+        DataSource(name="rollup source A", type="demo script"),
+        DataSource(name="rollup source B", type="demo script"),
+    ]
+    db.session.add_all(sources)
+    db.session.flush()
+    return sources
+
+
+def make_beliefs(
+    sensor: Sensor, source: DataSource, offset: float = 0
+) -> tb.BeliefsDataFrame:
+    event_starts = pd.date_range(
+        pd.Timestamp("2025-03-29T00:00", tz=sensor.timezone),
+        pd.Timestamp("2025-04-01T00:00", tz=sensor.timezone),
+        freq="15min",
+        inclusive="left",
+    )
+    values = np.sin(np.arange(len(event_starts)) / 7) * 10 + offset
+    return tb.BeliefsDataFrame(
+        [
+            TimedBelief(
+                sensor=sensor,
+                source=source,
+                event_start=event_start,
+                belief_horizon=timedelta(hours=1),
+                event_value=value,
+            )
+            for event_start, value in zip(event_starts, values)
+        ]
+    )
+
+
+def search_with_and_without_rollups(app, **search_kwargs):
+    app.config["FLEXMEASURES_ROLLUPS_ENABLED"] = False
+    bdf_raw = TimedBelief.search(**search_kwargs)
+    app.config["FLEXMEASURES_ROLLUPS_ENABLED"] = True
+    bdf_rollups = TimedBelief.search(**search_kwargs)
+    return bdf_raw, bdf_rollups
+
+
+def assert_same_events_and_values(bdf_rollups, bdf_raw):
+    """Compare events, sources and values (not belief times or probabilities)."""
+    pd.testing.assert_index_equal(
+        bdf_rollups.index.get_level_values("event_start"),
+        bdf_raw.index.get_level_values("event_start"),
+    )
+    assert list(bdf_rollups.sources) == list(bdf_raw.sources)
+    np.testing.assert_allclose(
+        bdf_rollups["event_value"].values, bdf_raw["event_value"].values
+    )
+
+
+@pytest.fixture(scope="function")
+def rollups_enabled(app):
+    original_setting = app.config["FLEXMEASURES_ROLLUPS_ENABLED"]
+    app.config["FLEXMEASURES_ROLLUPS_ENABLED"] = True
+    yield
+    app.config["FLEXMEASURES_ROLLUPS_ENABLED"] = original_setting
+
+
+def test_rollups_are_updated_on_ingestion(
+    db, rollups_enabled, rollup_sensor, rollup_sources
+):
+    for i, source in enumerate(rollup_sources):
+        save_to_db(make_beliefs(rollup_sensor, source, offset=i * 100))
+
+    rollups = db.session.scalars(
+        select(TimedBeliefRollup).filter(
+            TimedBeliefRollup.sensor_id == rollup_sensor.id
+        )
+    ).all()
+    day_rollups = [r for r in rollups if r.period == "day"]
+    hour_rollups = [r for r in rollups if r.period == "hour"]
+
+    # 3 local days (the middle one only has 23 hours) for each of the 2 sources
+    assert len(day_rollups) == 2 * 3
+    assert len(hour_rollups) == 2 * (24 + 23 + 24)
+    assert all(r.count == 4 for r in hour_rollups)
+    assert sorted(r.count for r in day_rollups) == [92, 92, 96, 96, 96, 96]
+
+    # Daily aggregates match the raw data
+    bdf = make_beliefs(rollup_sensor, rollup_sources[0])
+    values = bdf.reset_index().set_index("event_start")["event_value"]
+    dst_day = values["2025-03-30"]
+    dst_rollup = next(
+        r
+        for r in day_rollups
+        if r.source_id == rollup_sources[0].id
+        and r.period_start == pd.Timestamp("2025-03-30T00:00+01:00")
+    )
+    assert dst_rollup.first_event_start == pd.Timestamp("2025-03-30T00:00+01:00")
+    assert dst_rollup.last_event_start == pd.Timestamp("2025-03-30T23:45+02:00")
+    assert dst_rollup.min_value == pytest.approx(dst_day.min())
+    assert dst_rollup.max_value == pytest.approx(dst_day.max())
+    assert dst_rollup.sum_value == pytest.approx(dst_day.sum())
+    assert dst_rollup.mean_value == pytest.approx(dst_day.mean())
+    assert dst_rollup.last_value == pytest.approx(dst_day.iloc[-1])
+
+
+@pytest.mark.parametrize(
+    "resolution, start, end, expected_period",
+    [
+        ("PT1H", "2025-03-29T00:00+01:00", "2025-04-01T00:00+02:00", "hour"),
+        ("PT1H", "2025-03-29T05:00+01:00", "2025-03-30T13:30+02:00", "hour"),
+        ("P1D", "2025-03-29T00:00+01:00", "2025-04-01T00:00+02:00", "day"),
+        ("P1D", "2025-03-30T00:00+01:00", "2025-03-31T12:00+02:00", "day"),
+        # Windows that do not start at a whole hour or day are not served from rollups
+        ("PT1H", "2025-03-29T05:30+01:00", "2025-03-30T13:00+02:00", None),
+        ("P1D", "2025-03-29T12:00+01:00", "2025-04-01T00:00+02:00", None),
+        ("PT2H", "2025-03-29T00:00+01:00", "2025-04-01T00:00+02:00", None),
+    ],
+)
+def test_search_from_rollups_matches_resampling(
+    app,
+    rollups_enabled,
+    rollup_sensor,
+    rollup_sources,
+    resolution,
+    start,
+    end,
+    expected_period,
+):
+    assert (
+        rollup_period(rollup_sensor, resolution, pd.Timestamp(start)) == expected_period
+    )
+    for source in rollup_sources:
+        bdf_raw, bdf_rollups = search_with_and_without_rollups(
+            app,
+            sensors=rollup_sensor,
+            event_starts_after=pd.Timestamp(start),
+            event_ends_before=pd.Timestamp(end),
+            resolution=resolution,
+            source=source,
+        )
+        assert not bdf_raw.empty
+        assert bdf_rollups.event_resolution == bdf_raw.event_resolution
+        pd.testing.assert_frame_equal(bdf_rollups, bdf_raw)
+
+    # With multiple sources, resampling times all beliefs at the most recent belief time overall
+    bdf_raw, bdf_rollups = search_with_and_without_rollups(
+        app,
+        sensors=rollup_sensor,
+        event_starts_after=pd.Timestamp(start),
+        event_ends_before=pd.Timestamp(end),
+        resolution=resolution,
+    )
+    assert_same_events_and_values(bdf_rollups, bdf_raw)
+
+
+def test_search_rollups_filters_sources(rollup_sensor, rollup_sources):
+    bdf = search_rollups(rollup_sensor, "day", sources=[rollup_sources[1]])
+    assert len(bdf) == 3
+    assert set(bdf.sources) == {rollup_sources[1]}
+    assert (bdf["event_value"] > 50).all()
+
+
+def test_sensor_stats_from_rollups(app, rollups_enabled, rollup_sensor):
+    start = pd.Timestamp("2025-03-29T00:00+01:00")
+    end = pd.Timestamp("2025-03-31T00:00+02:00")
+    stats_raw = _get_sensor_stats_from_beliefs(rollup_sensor, start, end)
+    stats_rollups = get_sensor_stats_from_rollups(rollup_sensor, start, end)
+
+    assert len(stats_rollups) == len(stats_raw) == 2
+    for row_rollups, row_raw in zip(
+        sorted(stats_rollups, key=lambda row: row[0].id),
+        sorted(stats_raw, key=lambda row: row[0].id),
+    ):
+        assert row_rollups[0] == row_raw[0]
+        assert tuple(row_rollups[1:4]) == tuple(row_raw[1:4])
+        assert tuple(row_rollups[4:]) == pytest.approx(tuple(row_raw[4:]))
+        assert row_rollups[-1] == 96 + 92
+
+    # Windows that do not start and end at midnight are not served from rollups
+    assert (
+        get_sensor_stats_from_rollups(rollup_sensor, start, end - timedelta(hours=1))
+        is None
+    )
+
+
+def test_rollups_follow_updated_beliefs(
+    app, rollups_enabled, rollup_sensor, rollup_sources
+):
+    """A newer belief about an event replaces the older one in the rollups."""
+    bdf = tb.BeliefsDataFrame(
+        [
+            TimedBelief(
+                sensor=rollup_sensor,
+                source=rollup_sources[0],
+                event_start=event_start,
+                belief_horizon=timedelta(0),
+                event_value=1000.0,
+            )
+            for event_start in pd.date_range(
+                "2025-03-29T00:00+01:00", periods=4, freq="15min"
+            )
+        ]
+    )
+    save_to_db(bdf)
+
+    bdf_hours = search_rollups(
+        rollup_sensor,
+        "hour",
+        event_starts_after=pd.Timestamp("2025-03-29T00:00+01:00"),
+        event_ends_before=pd.Timestamp("2025-03-29T02:00+01:00"),
+        sources=[rollup_sources[0]],
+    )
+    assert bdf_hours["event_value"].iloc[0] == pytest.approx(1000.0)
+    assert bdf_hours["event_value"].iloc[1] != pytest.approx(1000.0)
+
+    bdf_raw, bdf_rollups = search_with_and_without_rollups(
+        app,
+        sensors=rollup_sensor,
+        event_starts_after=pd.Timestamp("2025-03-29T00:00+01:00"),
+        event_ends_before=pd.Timestamp("2025-03-30T00:00+01:00"),
+        resolution="P1D",
+    )
+    assert_same_events_and_values(bdf_rollups, bdf_raw)
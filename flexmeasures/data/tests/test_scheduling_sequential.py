@@ -2,6 +2,7 @@ from unittest.mock import patch
 from flexmeasures.data.models.planning.exceptions import InfeasibleProblemException
 
 import pandas as pd
+import pytest
 from rq.job import Job
 from flexmeasures.data.services.scheduling import create_sequential_scheduling_job
 from flexmeasures.utils.job_utils import work_on_rq
@@ -294,3 +295,74 @@ def test_create_sequential_jobs_with_sign_explicit_context(
         {"sensor": sensors["Test EV"].id},
     ]
     assert "inflexible-device-sensors" not in deferred_jobs[0].kwargs["flex_context"]
+
+
+def test_create_tiered_sequential_jobs(
+    db, app, flex_description_sequential, smart_building
+):
+    """Devices within one tier are scheduled by parallel jobs, which don't see each other as inflexible devices.
+
+    With both flexible devices in a single tier, both scheduling jobs should be queued right away,
+    and only the wrap-up job should be deferred, waiting for both of them.
+    """
+    assets, sensors, soc_sensors = smart_building
+
+    queue = app.queues["scheduling"]
+    flex_description_sequential["start"] = pd.Timestamp("2015-01-03").tz_localize(
+        "Europe/Amsterdam"
+    )
+    flex_description_sequential["end"] = pd.Timestamp("2015-01-04").tz_localize(
+        "Europe/Amsterdam"
+    )
+
+    wrapup_job = create_sequential_scheduling_job(
+        asset=assets["Test Site"],
+        scheduler_specs={
+            "module": "flexmeasures.data.models.planning.storage",
+            "class": "StorageScheduler",
+        },
+        enqueue=True,
+        force_new_job_creation=True,
+        tiers=[[sensors["Test EV"], sensors["Test Battery"]]],
+        **flex_description_sequential,
+    )
+
+    # The wrap-up job waits for both devices in the tier, which are queued right away
+    tier_jobs = Job.fetch_many(wrapup_job.dependency_ids, connection=queue.connection)
+    assert len(tier_jobs) == 2
+    assert all(job.get_status() == "queued" for job in tier_jobs)
+    assert wrapup_job.get_status() == "deferred"
+    assert {job.kwargs["asset_or_sensor"]["id"] for job in tier_jobs} == {
+        sensors["Test EV"].id,
+        sensors["Test Battery"].id,
+    }
+
+    # Neither device takes into account the other one, only the given inflexible devices
+    for job in tier_jobs:
+        assert job.kwargs["flex_context"]["inflexible-device-sensors"] == [
+            sensors["Test Solar"].id,
+            sensors["Test Building"].id,
+        ]
+
+    work_on_rq(queue, handle_scheduling_exception)
+    for job in tier_jobs:
+        assert job.get_status() == "finished"
+    assert wrapup_job.get_status() == "finished"
+    assert not sensors["Test EV"].search_beliefs().empty
+    assert not sensors["Test Battery"].search_beliefs().empty
+
+
+def test_create_tiered_sequential_jobs_with_incomplete_tiers(
+    db, app, flex_description_sequential, smart_building
+):
+    """Tiers that leave out a device of the flex-model are rejected."""
+    assets, sensors, soc_sensors = smart_building
+
+    with pytest.raises(ValueError, match="exactly once"):
+        create_sequential_scheduling_job(
+            asset=assets["Test Site"],
+            enqueue=True,
+            force_new_job_creation=True,
+            tiers=[[sensors["Test EV"]]],
+            **flex_description_sequential,
+        )
@@ -15,6 +15,12 @@ from sqlalchemy import select
 from flexmeasures.data import db
 from flexmeasures.data.models.data_sources import DataSource
 from flexmeasures.data.models.time_series import TimedBelief, Sensor
+from flexmeasures.data.services.latest_beliefs import (
+    select_latest_beliefs,
+    update_latest_beliefs,
+)
+from flexmeasures.data.services.reporting import schedule_dependent_reports
+from flexmeasures.data.services.rollups import update_rollups
 from flexmeasures.data.services.time_series import drop_unchanged_beliefs
 
 SAVE_TO_DB_SUCCESS = "success"
@@ -152,6 +158,10 @@ def save_to_db(
     """Save the timed beliefs to the database.
 
     Note: This function does not commit. It does, however, flush the session. Best to keep transactions short.
+    It also keeps track of the latest belief per sensor and source (see ``Sensor.latest_states``).
+    If FLEXMEASURES_ROLLUPS_ENABLED is set, it also updates the rollups of the days the saved data pertains to.
+    Reports depending on the saved data are recomputed for the affected time window, once the session is committed
+    (see ``flexmeasures.data.services.reporting``).
 
     We make the distinction between updating beliefs and replacing beliefs.
 
@@ -190,6 +200,10 @@ def save_to_db(
 
     status = SAVE_TO_DB_SUCCESS
     values_saved = 0
+    # Per sensor ID: the sensor and the first and last event start saved
+    windows_saved = {}
+    # Candidates for the latest belief per sensor and source
+    latest_beliefs = []
     for timed_values in timed_values_list:
 
         # Convert series to frame if needed
@@ -232,9 +246,25 @@ def save_to_db(
         )
         values_saved += len(timed_values)
         current_app.logger.info(f"SAVED {len(timed_values)} values TO DB.")
+        sensor = timed_values.sensor
+        first, last = timed_values.event_starts.min(), timed_values.event_starts.max()
+        if sensor.id in windows_saved:
+            _, saved_first, saved_last = windows_saved[sensor.id]
+            first, last = min(first, saved_first), max(last, saved_last)
+        windows_saved[sensor.id] = (sensor, first, last)
+        latest_beliefs.append(select_latest_beliefs(timed_values))
     # Flush to bring up potential unique violations (due to attempting to replace beliefs)
     db.session.flush()
 
+    update_latest_beliefs(latest_beliefs)
+
+    if current_app.config.get("FLEXMEASURES_ROLLUPS_ENABLED", False):
+        for sensor, start, end in windows_saved.values():
+            update_rollups(sensor, start, end)
+
+    # Recompute the reports that depend on the new data, once it is committed
+    schedule_dependent_reports(list(windows_saved.values()))
+
     if values_saved == 0:
         status = SAVE_TO_DB_SUCCESS_BUT_NOTHING_NEW
     return status
@@ -2,6 +2,7 @@ r"""Various coding utils (e.g. around function decoration)"""
 
 from __future__ import annotations
 
+from collections.abc import Iterator, MutableMapping
 from typing import Any
 import functools
 import time
@@ -228,6 +229,58 @@ def get_classes_module(module, superclass, skiptest=True) -> dict:
     return dict(find_classes_modules(module, superclass, skiptest=skiptest))
 
 
+def import_class(import_path: str) -> type:
+    """Import a class from its import path, e.g. "flexmeasures.data.models.planning.storage:StorageScheduler"."""
+    module_name, class_name = import_path.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+class LazyClassRegistry(MutableMapping):
+    """Registry of classes by name, which only imports the module of a class when it is first looked up.
+
+    Entries can be registered as classes, or as import paths (see ``import_class``).
+    Checking whether a name is registered, or listing the registered names, imports nothing.
+
+    >>> registry = LazyClassRegistry({"OrderedDict": "collections:OrderedDict"})
+    >>> "OrderedDict" in registry
+    True
+    >>> registry["OrderedDict"]
+    <class 'collections.OrderedDict'>
+    """
+
+    def __init__(self, entries: dict[str, str | type] | None = None):
+        self._entries: dict[str, str | type] = dict(entries or {})
+
+    def __getitem__(self, name: str) -> type:
+        entry = self._entries[name]
+        if isinstance(entry, str):
+            entry = self._entries[name] = import_class(entry)
+        return entry
+
+    def __setitem__(self, name: str, entry: str | type):
+        self._entries[name] = entry
+
+    def __delitem__(self, name: str):
+        del self._entries[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._entries})"
+
+    def load_all(self):
+        """Import all registered classes."""
+        for name in self:
+            self[name]
+
+
 @functools.total_ordering
 class OrderByIdMixin:
     """
@@ -130,6 +130,10 @@ class Config(object):
     FLEXMEASURES_SIGNUP_PAGE: str | None = None
     FLEXMEASURES_TOS_PAGE: str | None = None
     FLEXMEASURES_ALLOW_DATA_OVERWRITE: bool = False
+    FLEXMEASURES_ROLLUPS_ENABLED: bool = False
+    FLEXMEASURES_RETENTION_POLICIES: list[dict] = (
+        []
+    )  # applied by flexmeasures delete beliefs-past-retention
     FLEXMEASURES_TIMEZONE: str = "Asia/Seoul"
     FLEXMEASURES_HIDE_NAN_IN_UI: bool = False
     FLEXMEASURES_PUBLIC_DEMO_CREDENTIALS: tuple | None = None
@@ -140,6 +144,9 @@ class Config(object):
     FLEXMEASURES_HOSTS_AND_AUTH_START: dict[str, str] = {"flexmeasures.io": "2021-01"}
     FLEXMEASURES_PLUGINS: list[str] | str = []  # str will be checked for commas
     FLEXMEASURES_PROFILE_REQUESTS: bool = False
+    FLEXMEASURES_INSTRUMENTATION_ENABLED: bool = True
+    # Fraction of jobs to profile, per queue
+    FLEXMEASURES_PROFILE_JOBS: dict[str, float] = {}
     FLEXMEASURES_PROFILER_CONFIG: dict = dict(
         async_mode="disabled",
         interval=0.01,  # 10 ms sampling interval, enables coarse timer
@@ -161,6 +168,7 @@ class Config(object):
     }  # how to group assets by asset types
     FLEXMEASURES_LP_SOLVER: str = "highspy"
     FLEXMEASURES_LP_SOLVER_OPTIONS: dict[str, str | int | float] = {}
+    FLEXMEASURES_LP_MODEL_BUILDER: str = "rules"  # or "matrix"
     FLEXMEASURES_DEFAULT_JOB_TIMEOUT: timedelta = timedelta(seconds=180)
     FLEXMEASURES_JOB_TIMEOUT: dict[str, timedelta | str] = {}
     FLEXMEASURES_JOB_TTL: timedelta = timedelta(days=1)
@@ -179,6 +187,9 @@ class Config(object):
     FLEXMEASURES_MAX_SENSOR_DATA_INGESTION_BYTES: int | None = (
         3.1 * 1024 * 1024
     )  # up to 3MB are allowed per request
+    FLEXMEASURES_UPLOAD_STAGING_DIR: str | None = (
+        None  # defaults to a "flexmeasures-uploads" directory in the system's temporary directory
+    )
     FLEXMEASURES_TASK_CHECK_AUTH_TOKEN: str | None = None
     FLEXMEASURES_REDIS_URL: str = "localhost"
     FLEXMEASURES_REDIS_PORT: int = 6379
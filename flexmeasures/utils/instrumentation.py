@@ -0,0 +1,317 @@
+"""Lightweight performance instrumentation of requests and jobs.
+
+For each request (per endpoint) and each job (per job function), we measure the wall time,
+the number of SQL queries and the time spent on them (using SQLAlchemy's cursor execution events).
+Measurements are aggregated into histograms in Redis, so that they are shared by all web and worker processes,
+and exposed in the Prometheus text format (see ``render_metrics`` and the ``/api/ops/metrics`` endpoint).
+Switch this off with the ``FLEXMEASURES_INSTRUMENTATION_ENABLED`` setting.
+
+Jobs can also be profiled, per queue or for a sampled fraction of their jobs (see the ``FLEXMEASURES_PROFILE_JOBS`` setting).
+The profiling report is stored in Redis, next to the job, and can be shown with ``flexmeasures jobs inspect-job --profile``.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import math
+import random
+import time
+
+from flask import Flask, current_app, g, has_app_context, request
+from redis import Redis
+from rq import Queue, SimpleWorker, Worker
+from rq.defaults import DEFAULT_RESULT_TTL
+from rq.job import Job
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+METRICS_KEY_PREFIX = "flexmeasures:metrics"
+METRICS_INDEX_KEY = f"{METRICS_KEY_PREFIX}:index"
+PROFILE_KEY_PREFIX = "flexmeasures:profile"
+
+#: Queues whose jobs get their measurement attached to their meta data (under "instrumentation")
+JOB_META_QUEUES = ("scheduling", "forecasting")
+
+#: Label naming the measured thing, per kind of measurement
+METRIC_LABELS = dict(request="endpoint", job="function")
+
+DURATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+    300,
+)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 5000)
+
+#: Histograms per kind of measurement: metric suffix, help text, buckets and the measured attribute
+HISTOGRAMS = (
+    ("duration_seconds", "Wall time", DURATION_BUCKETS, "wall_time"),
+    ("sql_queries", "Number of SQL queries", QUERY_COUNT_BUCKETS, "sql_count"),
+    ("sql_duration_seconds", "Time spent on SQL queries", DURATION_BUCKETS, "sql_time"),
+)
+
+_current_measurement: ContextVar[Measurement | None] = ContextVar(
+    "current_measurement", default=None
+)
+
+
+@dataclass
+class Measurement:
+    """Wall time, SQL query count and SQL time of a request or job.
+
+    Measurements can be nested, in which case SQL queries count towards all enclosing measurements.
+    """
+
+    kind: str
+    name: str
+    start_time: float = field(default_factory=time.perf_counter)
+    wall_time: float | None = None
+    sql_count: int = 0
+    sql_time: float = 0
+    parent: Measurement | None = field(default=None, repr=False)
+
+    def as_dict(self) -> dict:
+        return dict(
+            wall_time=self.wall_time,
+            sql_queries=self.sql_count,
+            sql_time=self.sql_time,
+        )
+
+
+def instrumentation_enabled() -> bool:
+    return has_app_context() and current_app.config.get(
+        "FLEXMEASURES_INSTRUMENTATION_ENABLED", False
+    )
+
+
+def start_measurement(kind: str, name: str) -> Measurement | None:
+    """Start measuring a request or job, unless instrumentation is disabled."""
+    if not instrumentation_enabled():
+        return None
+    measurement = Measurement(kind=kind, name=name, parent=_current_measurement.get())
+    _current_measurement.set(measurement)
+    return measurement
+
+
+def finish_measurement(measurement: Measurement | None) -> Measurement | None:
+    """Stop measuring, and add the measurement to the aggregated metrics.
+
+    Finishing a measurement more than once has no effect.
+    """
+    if measurement is None or measurement.wall_time is not None:
+        return measurement
+    measurement.wall_time = time.perf_counter() - measurement.start_time
+    _current_measurement.set(measurement.parent)
+    try:
+        record_measurement(measurement, current_app.redis_connection)
+    except Exception as exc:  # instrumentation should never break requests or jobs
+        current_app.logger.warning(f"Could not record {measurement}: {exc}")
+    return measurement
+
+
+def _metrics_key(kind: str, suffix: str, name: str) -> str:
+    return f"{METRICS_KEY_PREFIX}:{kind}:{suffix}:{name}"
+
+
+def record_measurement(measurement: Measurement, connection: Redis):
+    """Add the measurement to its histograms, in a single round trip to Redis."""
+    pipeline = connection.pipeline(transaction=False)
+    for suffix, _, buckets, attribute in HISTOGRAMS:
+        key = _metrics_key(measurement.kind, suffix, measurement.name)
+        value = getattr(measurement, attribute)
+        bucket = next((le for le in buckets if value <= le), math.inf)
+        pipeline.hincrby(key, str(bucket), 1)
+        pipeline.hincrbyfloat(key, "sum", value)
+        pipeline.hincrby(key, "count", 1)
+        pipeline.sadd(METRICS_INDEX_KEY, key)
+    pipeline.execute()
+
+
+def render_metrics(connection: Redis) -> str:
+    """Render the aggregated histograms in the Prometheus text exposition format."""
+    keys = sorted(
+        key.decode() if isinstance(key, bytes) else key
+        for key in connection.smembers(METRICS_INDEX_KEY)
+    )
+    pipeline = connection.pipeline(transaction=False)
+    for key in keys:
+        pipeline.hgetall(key)
+    histograms = dict(zip(keys, pipeline.execute()))
+
+    lines = []
+    for kind, label in METRIC_LABELS.items():
+        for suffix, description, buckets, _ in HISTOGRAMS:
+            metric = f"flexmeasures_{kind}_{suffix}"
+            lines.append(f"# HELP {metric} {description} per {kind} {label}.")
+            lines.append(f"# TYPE {metric} histogram")
+            prefix = _metrics_key(kind, suffix, "")
+            for key, histogram in histograms.items():
+                if not key.startswith(prefix):
+                    continue
+                name = key[len(prefix) :].replace("\\", "\\\\").replace('"', '\\"')
+                histogram = {
+                    (k.decode() if isinstance(k, bytes) else k): float(v)
+                    for k, v in histogram.items()
+                }
+                cumulative_count = 0
+                for le in (*buckets, math.inf):
+                    cumulative_count += int(histogram.get(str(le), 0))
+                    le_str = "+Inf" if le == math.inf else str(le)
+                    lines.append(
+                        f'{metric}_bucket{{{label}="{name}",le="{le_str}"}} {cumulative_count}'
+                    )
+                lines.append(f'{metric}_sum{{{label}="{name}"}} {histogram["sum"]}')
+                lines.append(
+                    f'{metric}_count{{{label}="{name}"}} {int(histogram["count"])}'
+                )
+    return "\n".join(lines) + "\n"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    query_start_times = conn.info.get("query_start_times")
+    if not query_start_times:
+        return
+    duration = time.perf_counter() - query_start_times.pop()
+    measurement = _current_measurement.get()
+    while measurement is not None:
+        measurement.sql_count += 1
+        measurement.sql_time += duration
+        measurement = measurement.parent
+
+
+def start_job_profiler(job: Job):
+    """Start a sampling profiler for the job, if its queue is set up to profile (a sampled fraction of) its jobs.
+
+    Profiling requires pyinstrument, and is configured by the ``FLEXMEASURES_PROFILE_JOBS``
+    (fraction of jobs to profile, per queue) and ``FLEXMEASURES_PROFILER_CONFIG`` settings.
+    """
+    if not has_app_context():
+        return None
+    fraction = current_app.config.get("FLEXMEASURES_PROFILE_JOBS", {}).get(
+        job.origin, 0
+    )
+    if fraction <= 0 or random.random() >= fraction:
+        return None
+    try:
+        import pyinstrument
+    except ImportError:
+        current_app.logger.warning(
+            f"FLEXMEASURES_PROFILE_JOBS is set for the {job.origin} queue, but pyinstrument not installed ― I cannot produce profiling reports for jobs."
+        )
+        return None
+    profiler = pyinstrument.Profiler(
+        **current_app.config["FLEXMEASURES_PROFILER_CONFIG"]
+    )
+    profiler.start()
+    return profiler
+
+
+def stop_job_profiler(
+    profiler, job: Job, connection: Redis, default_result_ttl: int = DEFAULT_RESULT_TTL
+) -> str | None:
+    """Stop profiling the job, and store the report in Redis, expiring along with the job's result.
+
+    Stopping a profiler more than once has no effect.
+    Returns the Redis key of the report.
+    """
+    if profiler is None or not profiler.is_running:
+        return None
+    profiler.stop()
+    key = f"{PROFILE_KEY_PREFIX}:{job.id}"
+    result_ttl = job.get_result_ttl(default_result_ttl)
+    try:
+        connection.set(
+            key,
+            profiler.output_text(unicode=True, color=False),
+            ex=result_ttl if result_ttl > 0 else None,
+        )
+    except Exception as exc:  # profiling should never break jobs
+        current_app.logger.warning(f"Could not store profile of {job}: {exc}")
+        return None
+    return key
+
+
+def get_job_profile(job: Job) -> str | None:
+    """Look up the profiling report of the job, if it was profiled (and the report has not expired)."""
+    key = job.meta.get("profile")
+    if key is None:
+        return None
+    report = job.connection.get(key)
+    return report.decode() if isinstance(report, bytes) else report
+
+
+class InstrumentedWorkerMixin:
+    """Measure each job performed by an RQ worker, per job function, and profile jobs if configured to do so."""
+
+    def perform_job(self, job: Job, queue: Queue) -> bool:
+        self._measurement = start_measurement("job", job.func_name)
+        self._profiler = start_job_profiler(job)
+        try:
+            return super().perform_job(job, queue)
+        finally:
+            finish_measurement(self._measurement)
+            stop_job_profiler(
+                self._profiler, job, self.connection, self.default_result_ttl
+            )
+
+    def handle_execution_ended(self, job: Job, queue: Queue, heartbeat_ttl: int):
+        super().handle_execution_ended(job, queue, heartbeat_ttl)
+        meta = {}
+        measurement = finish_measurement(getattr(self, "_measurement", None))
+        if measurement is not None and job.origin in JOB_META_QUEUES:
+            meta["instrumentation"] = measurement.as_dict()
+        profile_key = stop_job_profiler(
+            getattr(self, "_profiler", None),
+            job,
+            self.connection,
+            self.default_result_ttl,
+        )
+        if profile_key is not None:
+            meta["profile"] = profile_key
+        if meta:
+            # Keep what the job function itself stored in the job's meta data,
+            # whether it was saved already (e.g. through another Job object) or not (e.g. before failing)
+            unsaved_meta = dict(job.meta)
+            job.get_meta(refresh=True)
+            job.meta.update(unsaved_meta)
+            job.meta.update(meta)
+            job.save_meta()
+
+
+class InstrumentedWorker(InstrumentedWorkerMixin, Worker):
+    pass
+
+
+class InstrumentedSimpleWorker(InstrumentedWorkerMixin, SimpleWorker):
+    pass
+
+
+def register_at(app: Flask):
+    """Count SQL queries, and measure each request."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+    @app.before_request
+    def start_request_measurement():
+        if request.endpoint is not None and not request.endpoint.endswith("static"):
+            g.measurement = start_measurement("request", request.endpoint)
+
+    @app.teardown_request
+    def finish_request_measurement(exception=None):
+        finish_measurement(g.pop("measurement", None))
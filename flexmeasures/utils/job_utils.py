@@ -12,7 +12,7 @@ from rq import Queue
 from rq.job import Job
 
 RQ_DEFAULT_JOB_TIMEOUT = 180
-KNOWN_JOB_QUEUES = frozenset(("forecasting", "scheduling", "ingestion"))
+KNOWN_JOB_QUEUES = frozenset(("forecasting", "scheduling", "ingestion", "reporting"))
 
 
 def _timeout_to_seconds(timeout: timedelta | str) -> int:
@@ -119,11 +119,20 @@ def work_on_rq(
     job: Job | str | None = None,
 ):
 
+    from flexmeasures.utils.instrumentation import (
+        InstrumentedSimpleWorker,
+        InstrumentedWorkerMixin,
+    )
+
     #  we only want this import distinction to matter when we actually are testing
     if os.name == "nt":
-        from rq_win import WindowsWorker as SimpleWorker  # type: ignore[import-untyped]
+        from rq_win import WindowsWorker  # type: ignore[import-untyped]
+
+        SimpleWorker = type(
+            "InstrumentedWindowsWorker", (InstrumentedWorkerMixin, WindowsWorker), {}
+        )
     else:
-        from rq import SimpleWorker
+        SimpleWorker = InstrumentedSimpleWorker
 
     exc_handlers = []
     if exc_handler is not None:
@@ -1,7 +1,15 @@
+import subprocess
+import sys
+
 import pytest
 
-from flexmeasures import Asset, AssetType, Sensor
-from flexmeasures.utils.coding_utils import deprecated
+from flexmeasures import Asset, AssetType, Forecaster, Reporter, Scheduler, Sensor
+from flexmeasures.data.models import data_generators
+from flexmeasures.utils.coding_utils import (
+    LazyClassRegistry,
+    deprecated,
+    get_classes_module,
+)
 
 
 def other_function():
@@ -47,3 +55,57 @@ def test_unhashable_entities_as_dict_keys(db):
         "Consider calling `db.session.flush()` before using Sensor objects in sets or as dictionary keys."
         in str(exc_info)
     )
+
+
+def test_lazy_class_registry():
+    registry = LazyClassRegistry({"Fraction": "fractions:Fraction", "Sensor": Sensor})
+    assert "Fraction" in registry
+    assert list(registry) == ["Fraction", "Sensor"]
+    assert isinstance(registry._entries["Fraction"], str)  # not imported yet
+
+    from fractions import Fraction
+
+    assert registry["Fraction"] is Fraction
+    assert registry._entries["Fraction"] is Fraction  # imported once
+    assert registry.get("Sensor") is Sensor
+    assert registry.get("Unknown") is None
+
+    registry.update({"Asset": Asset})
+    assert dict(registry) == {"Fraction": Fraction, "Sensor": Sensor, "Asset": Asset}
+
+
+@pytest.mark.parametrize(
+    "generator_type, superclass",
+    [
+        ("forecaster", Forecaster),
+        ("reporter", Reporter),
+        ("scheduler", Scheduler),
+    ],
+)
+def test_data_generator_manifest_is_complete(app, generator_type, superclass):
+    """The manifest of data generators should list each of our data generator classes."""
+    assert dict(LazyClassRegistry(data_generators[generator_type])) == (
+        get_classes_module("flexmeasures.data.models", superclass)
+    )
+    assert set(app.data_generators[generator_type]) >= set(
+        data_generators[generator_type]
+    )
+
+
+def test_app_creation_does_not_import_data_generators():
+    """Creating the app (e.g. for a CLI command or web worker) should not import heavy data generator dependencies."""
+    heavy_dependencies = ["lightgbm", "pyomo"]
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys\n"
+            "from flexmeasures.app import create\n"
+            "create(env='testing')\n"
+            f"print([m for m in {heavy_dependencies} if m in sys.modules])\n",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert process.returncode == 0, process.stderr
+    assert process.stdout.strip().splitlines()[-1] == "[]"
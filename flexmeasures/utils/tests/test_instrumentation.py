@@ -0,0 +1,107 @@
+import time
+
+import pytest
+from sqlalchemy import select, text
+
+from flexmeasures.data.models.time_series import Sensor
+from flexmeasures.utils.instrumentation import (
+    finish_measurement,
+    get_job_profile,
+    render_metrics,
+    start_measurement,
+)
+from flexmeasures.utils.job_utils import work_on_rq
+
+
+def count_sensors() -> int:
+    """Job function running two SQL queries."""
+    from flexmeasures.data import db
+
+    db.session.execute(text("SELECT 1"))
+    return len(db.session.scalars(select(Sensor)).all())
+
+
+def slow_count_sensors() -> int:
+    """Job function taking long enough to be sampled by the profiler."""
+    for _ in range(10):
+        time.sleep(0.02)
+    return count_sensors()
+
+
+def test_sql_queries_count_towards_all_enclosing_measurements(app, db):
+    outer = start_measurement("job", "outer")
+    db.session.execute(text("SELECT 1"))
+    inner = start_measurement("job", "inner")
+    db.session.execute(text("SELECT 1"))
+    db.session.execute(text("SELECT 1"))
+    finish_measurement(inner)
+    finish_measurement(outer)
+    db.session.execute(text("SELECT 1"))
+
+    assert inner.sql_count == 2
+    assert outer.sql_count == 3
+    assert 0 < inner.sql_time <= outer.sql_time <= outer.wall_time
+
+
+def test_instrumentation_can_be_disabled(app, db):
+    app.config["FLEXMEASURES_INSTRUMENTATION_ENABLED"] = False
+    try:
+        assert start_measurement("job", "something") is None
+    finally:
+        app.config["FLEXMEASURES_INSTRUMENTATION_ENABLED"] = True
+
+
+def test_job_measurements(app, db, clean_redis):
+    job_function = "flexmeasures.utils.tests.test_instrumentation.count_sensors"
+    scheduling_job = app.queues["scheduling"].enqueue(count_sensors)
+    ingestion_job = app.queues["ingestion"].enqueue(count_sensors)
+    work_on_rq(app.queues["scheduling"])
+    work_on_rq(app.queues["ingestion"])
+
+    # Scheduling jobs get their measurement in their meta data
+    scheduling_job.refresh()
+    assert scheduling_job.is_finished
+    instrumentation = scheduling_job.meta["instrumentation"]
+    assert instrumentation["sql_queries"] == 2
+    assert 0 < instrumentation["sql_time"] <= instrumentation["wall_time"]
+    ingestion_job.refresh()
+    assert "instrumentation" not in ingestion_job.meta
+
+    # Both jobs count towards the metrics of the job function
+    metrics = render_metrics(app.redis_connection)
+    assert (
+        f'flexmeasures_job_sql_queries_bucket{{function="{job_function}",le="1"}} 0'
+        in metrics
+    )
+    assert (
+        f'flexmeasures_job_sql_queries_bucket{{function="{job_function}",le="2"}} 2'
+        in metrics
+    )
+    assert (
+        f'flexmeasures_job_sql_queries_count{{function="{job_function}"}} 2' in metrics
+    )
+    assert f'flexmeasures_job_sql_queries_sum{{function="{job_function}"}} 4' in metrics
+
+
+def test_job_profiling(app, db, clean_redis):
+    pytest.importorskip("pyinstrument")
+    app.config["FLEXMEASURES_PROFILE_JOBS"] = {"ingestion": 1}
+    try:
+        scheduling_job = app.queues["scheduling"].enqueue(slow_count_sensors)
+        ingestion_job = app.queues["ingestion"].enqueue(
+            slow_count_sensors, result_ttl=60
+        )
+        work_on_rq(app.queues["scheduling"])
+        work_on_rq(app.queues["ingestion"])
+    finally:
+        app.config["FLEXMEASURES_PROFILE_JOBS"] = {}
+
+    # Only jobs on the profiled queue get a profiling report, which expires along with the job result
+    scheduling_job.refresh()
+    assert scheduling_job.is_finished
+    assert get_job_profile(scheduling_job) is None
+    ingestion_job.refresh()
+    assert ingestion_job.is_finished
+    report = get_job_profile(ingestion_job)
+    assert "slow_count_sensors" in report, report
+    assert 0 < app.redis_connection.ttl(ingestion_job.meta["profile"]) <= 60